@@ -0,0 +1,154 @@
+"""Calet: a visual components library based on Flet framework
+   - Cold start benchmark
+
+Run it from the repository root: ```python benchmarks/cold_start.py -o results.json```
+Every measure runs in a new interpreter, and the result is written as JSON to compare releases."""
+
+import argparse
+import importlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+# modules whose import time is measured
+MODULES = ("calet_theme", "calet_button", "calet_bar")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def run(arguments:list):
+    return subprocess.run(
+        [sys.executable, *arguments], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+
+def import_time(module:str):
+    """Return the ```-X importtime``` costs in milliseconds of a module imported in a new interpreter:
+    his cumulative time, the cumulative time of Flet and the modules with the highest self time.
+    """
+    stderr = run(["-X", "importtime", "-c", f"import {module}"]).stderr
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        fields = line[len("import time:"):].split("|")
+        try:
+            own, cumulative = int(fields[0]), int(fields[1])
+        except ValueError:
+            # the header line
+            continue
+        # nested modules are indented, their name is the same at any level
+        modules[fields[2].strip()] = (own / 1000, cumulative / 1000)
+    top = sorted(modules.items(), key=lambda item: item[1][0], reverse=True)[:5]
+    return {
+        "cumulative_ms": modules.get(module, (0, 0))[1],
+        "flet_ms": modules.get("flet", (0, 0))[1],
+        "modules": len(modules),
+        "top_self_ms": {name: own for name, (own, cumulative) in top},
+    }
+
+def app_shell():
+    """Construct a representative app shell: an app bar, a nav bar with submenus, a filter bar and a lateral nav bar.
+    """
+    import flet as ft
+    from calet_theme import ClTheme, ClLightTheme, ClDarkTheme
+    from calet_button import (
+        ClWinButton, ClIconButton, ClModeButton, ClTextButton, ClCheck, ClSwitch, ClNavTab, ClFilterButton, ClNavButton
+    )
+    from calet_bar import ClAppBar, ClMenuSection, ClMenuBar, ClNavBar, ClFilterBar, ClLateralNavBar
+    theme = ClTheme(on_light=ClLightTheme(), on_dark=ClDarkTheme())
+    app_bar = ClAppBar(
+        theme=theme,
+        title="Calet",
+        win_actions=[ClWinButton(theme, winaction=winaction) for winaction in ("minimize", "maximize", "close")],
+        left_actions=[ClIconButton(theme, icon=ft.icons.MENU)],
+        right_actions=[ClModeButton(theme, text="Light", second_text="Dark")]
+    )
+    submenus = [
+        ClMenuBar(
+            theme=theme,
+            sections=[
+                ClMenuSection(
+                    theme=theme,
+                    actions=[
+                        [ClTextButton(theme, text=f"Action {i}.{j}"), ClCheck(theme, label="Check")],
+                        [ClSwitch(theme)]
+                    ]
+                ) for j in range(3)
+            ]
+        ) for i in range(4)
+    ]
+    nav_bar = ClNavBar(theme=theme, options=[ClNavTab(theme, text=f"Tab {i}") for i in range(4)], submenus=submenus)
+    filter_bar = ClFilterBar(theme=theme, filters=[ClFilterButton(theme, text=f"Filter {i}") for i in range(10)])
+    lateral_nav_bar = ClLateralNavBar(
+        theme=theme, options=[ClNavButton(theme, label=f"Option {i}", icon=ft.icons.HOME) for i in range(6)]
+    )
+    return ft.Column(controls=[app_bar, nav_bar, filter_bar, lateral_nav_bar])
+
+def shell_child():
+    # child process mode: measure the import, construction and build of the app shell
+    start = time.perf_counter()
+    importlib.import_module("calet_bar")
+    imported = time.perf_counter()
+    shell = app_shell()
+    constructed = time.perf_counter()
+    # the same build that Flet runs when the shell is added to a page, without a connection
+    commands = shell._build_add_commands()
+    built = time.perf_counter()
+    print(json.dumps({
+        "import_ms": (imported - start) * 1000,
+        "construct_ms": (constructed - imported) * 1000,
+        "build_ms": (built - constructed) * 1000,
+        "flet_controls": len(commands),
+    }))
+
+def app_shell_time(runs:int):
+    """Return the median import, construction and build times in milliseconds of the app shell in new interpreters.
+    """
+    results = [json.loads(run([os.path.abspath(__file__), "--shell-child"]).stdout) for _ in range(runs)]
+    return {name: statistics.median_low(result[name] for result in results) for name in results[0]}
+
+def version(command:list):
+    try:
+        return subprocess.run(command, cwd=ROOT, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def benchmark(runs:int):
+    imports = {}
+    for module in MODULES:
+        results = [import_time(module) for _ in range(runs)]
+        imports[module] = {
+            "cumulative_ms": statistics.median(result["cumulative_ms"] for result in results),
+            "flet_ms": statistics.median(result["flet_ms"] for result in results),
+            "modules": results[-1]["modules"],
+            "top_self_ms": results[-1]["top_self_ms"],
+        }
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "commit": version(["git", "rev-parse", "--short", "HEAD"]),
+        "python": platform.python_version(),
+        "flet": version([sys.executable, "-c", "import flet_core.version as v; print(v.version)"]),
+        "platform": platform.platform(),
+        "runs": runs,
+        "imports": imports,
+        "app_shell": app_shell_time(runs),
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Calet cold start benchmark")
+    parser.add_argument("-n", "--runs", type=int, default=5, help="number of new interpreters for each measure")
+    parser.add_argument("-o", "--output", help="JSON file to write the results, printed if it isn't given")
+    parser.add_argument("--shell-child", action="store_true", help=argparse.SUPPRESS)
+    arguments = parser.parse_args()
+    if arguments.shell_child:
+        sys.path.insert(0, ROOT)
+        shell_child()
+    else:
+        result = json.dumps(benchmark(arguments.runs), indent=2)
+        if arguments.output is None:
+            print(result)
+        else:
+            with open(arguments.output, "w") as file:
+                file.write(result + "\n")
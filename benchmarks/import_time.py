@@ -0,0 +1,38 @@
+"""Calet: a visual components library based on Flet framework
+   - Import time benchmark
+
+Run it from the repository root: ```python benchmarks/import_time.py```"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+# entry points measured, each one in a new interpreter
+ENTRY_POINTS = (
+    "import calet",
+    "from calet import ClTheme",
+    "import calet_theme",
+    "from calet import ClButton",
+    "import calet_button",
+    "from calet import ClNavBar",
+    "import calet_bar",
+)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def measure(statement:str, runs:int=5):
+    """Return the median time in milliseconds of the given import statement in a new interpreter.
+    """
+    script = f"import time; start = time.perf_counter(); {statement}; print(time.perf_counter() - start)"
+    times = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout
+        times.append(float(output.strip().splitlines()[-1]) * 1000)
+    return statistics.median(times)
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    for statement in ENTRY_POINTS:
+        print(f"{statement:<30} {measure(statement, runs):>9.1f} ms")
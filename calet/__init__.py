@@ -0,0 +1,53 @@
+"""Calet: a visual components library based on Flet framework
+   - Package with lazy loading of the Calet modules"""
+
+import importlib
+
+# module of each Calet class, the module is only imported when one of his classes is used
+MODULES = {
+    "calet_errors": ("ClError",),
+    "calet_theme": ("ClPalette", "ClLightTheme", "ClDarkTheme", "ClTheme"),
+    "calet_shortcut": ("ClShortcutDispatcher",),
+    "calet_window": ("ClWindowController",),
+    "calet_button": (
+        "ClTextButton", "ClOutlinedButton", "ClTonalButton", "ClButton", "ClCrystalButton", "ClAcceptButton",
+        "ClCancelButton", "ClModeButton", "ClSelectableTextButton", "ClSelectableButton", "ClSelectableCrystalButton",
+        "ClFilterButton", "ClCrystalFilterButton", "ClRemovableFilter", "ClRemovableCrystalFilter", "ClSwapDestination",
+        "ClNavTab", "ClMarkTab", "ClIconButton", "ClNavButton", "ClWinButton", "ClColorButton", "ClOptionButton",
+        "ClMenuButton", "ClSwitch", "ClRadio", "ClRadioGroup", "ClCheck"
+    ),
+    "calet_bar": (
+        "ClAppBar", "ClMenuSection", "ClMenuBar", "ClNavBar", "ClFilterBar", "ClLateralNavBar", "ClBottomNavBar",
+        "ClSwapNavBar"
+    ),
+    "calet_list": ("ClCheckList", "ClVirtualList"),
+    "calet_batch": ("ClBatch",),
+    "calet_registry": ("ClRegistry",),
+    "calet_state": ("ClSignal", "ClComputed", "ClStore"),
+    "calet_template": ("ClTemplate",),
+    "calet_pool": ("ClPool",),
+    "calet_memory": ("ClMemoryProfile",),
+    "calet_color": ("ClSeedPalette",),
+    "calet_transition": ("ClThemeTransition",),
+    "calet_watch": ("ClThemeFile",),
+    "calet_render": ("ClRenderProfile",),
+    "calet_asset": ("ClAssetCache",),
+    "calet_loop": ("ClLoop",),
+    "calet_source": ("ClPagedSource",),
+    "calet_badge": ("ClBadgeFlusher",),
+}
+EXPORTS = {name: module for module, names in MODULES.items() for name in names}
+
+__all__ = list(EXPORTS)
+
+def __getattr__(name:str):
+    module = EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'calet' has no attribute '{name}'")
+    value = getattr(importlib.import_module(module), name)
+    # cached in the package, so the next lookups don't call this function again
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
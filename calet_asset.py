@@ -0,0 +1,190 @@
+"""Calet: a visual components library based on Flet framework
+   - Assets module"""
+
+import base64
+import hashlib
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from calet_errors import ClError
+
+# Pillow is optional, and it's imported only when the first thumbnail is made
+Image = None
+pillow_checked = False
+
+def image_library():
+    global Image, pillow_checked
+    if not pillow_checked:
+        pillow_checked = True
+        try:
+            from PIL import Image
+        except ImportError:
+            # images are validated by their header and served by their path
+            Image = None
+    return Image
+
+# image assets cache
+class ClAssetCache:
+    """Represents a local disk cache of the images used as icons by Calet components.\n
+    Every image is validated and decoded only once: a thumbnail with the displayed size is saved in the
+    cache folder, named by the hash of the image content, and it's served instead of the full size image.
+    Images are served as base64 strings for the ```src_base64``` property of the Flet images, so they
+    work in web apps too. The work can be done in a background thread, so the components are built with
+    ```PLACEHOLDER``` and they don't wait for it. Without Pillow there are no thumbnails, and the components
+    keep the path of the image in the ```src``` property, so the full size image is never sent as base64.
+    """
+    # extensions and headers of the supported image formats
+    EXTENSIONS = (".png", ".jpg", ".jpeg")
+    HEADERS = {"png": b"\x89PNG\r\n\x1a\n", "jpeg": b"\xff\xd8\xff"}
+    # transparent 1x1 PNG image displayed until the thumbnail is ready
+    PLACEHOLDER = "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAAC0lEQVR4nGNgAAIAAAUAAXpeqz8AAAAASUVORK5CYII="
+    # cache shared by all the components that don't receive one
+    _default = None
+    _lock = threading.Lock()
+
+    def __init__(self, folder:str=None, workers:int=2, on_error=None):
+        """Use this properties to personalize the cache:\n
+        ---
+        - folder: is the folder where the thumbnails are saved. If it isn't given, a 'calet_assets' folder in the temporary directory is used.
+        - workers: is the number of background threads that prepare the images.
+        - on_error: is a function called with the path and the ```ClError``` of an image that fails in background. If it isn't given, the error is raised.
+        """
+        # VALIDATION BLOCK
+        if folder is not None and not isinstance(folder, str):
+            raise ClError(
+                error="Argument Error: <<folder>> must be string"
+            )
+        if not isinstance(workers, int) or workers < 1:
+            raise ClError(
+                error="Argument Error: <<workers>> must be an integer greater than 0"
+            )
+        if on_error is not None and not callable(on_error):
+            raise ClError(
+                error="Argument Error: <<on_error>> must be callable"
+            )
+        # INITIALIZATION BLOCK
+        self.folder = folder if folder is not None else os.path.join(tempfile.gettempdir(), "calet_assets")
+        self.workers = workers
+        self.on_error = on_error
+        self.executor = None
+        # served path by source path, file stamp and size, so unchanged files are not read again
+        self.served = {}
+        self.pending = {}
+
+    @classmethod
+    def default(cls):
+        """Return the cache shared by all the Calet components, creating it the first time.
+        """
+        with cls._lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    @classmethod
+    def thumbnails(cls):
+        """Return True if Pillow is installed, so thumbnails can be made. Otherwise the images must be served by their path.
+        """
+        return image_library() is not None
+
+    @classmethod
+    def check(cls, path:str):
+        """Check that the given path is an existing PNG or JPEG image, reading only his header.
+        It's cheap enough to be called from the constructors of the components.
+        """
+        cls.validate(path, header_only=True)
+
+    @classmethod
+    def validate(cls, path:str, header_only:bool=False):
+        """Check that the given path is a PNG or JPEG image and return his content.
+        """
+        if os.path.splitext(path)[1].lower() not in cls.EXTENSIONS:
+            raise ClError(
+                error=f"Asset Error: '{path}' is an invalid file. Must be in PNG or JPEG format."
+            )
+        try:
+            with open(path, "rb") as file:
+                content = file.read(max(map(len, cls.HEADERS.values()))) if header_only else file.read()
+        except OSError:
+            raise ClError(
+                error=f"Asset Error: '{path}' is an invalid path or the file doesn't exist."
+            )
+        if not content.startswith(tuple(cls.HEADERS.values())):
+            raise ClError(
+                error=f"Asset Error: '{path}' is not a valid PNG or JPEG image"
+            )
+        return content
+
+    def thumbnail(self, path:str, size:int):
+        """Validate the given image and return his cached thumbnail with the given size in pixels, encoded in base64.
+        Without Pillow, only the header of the image is validated and None is returned.
+        """
+        try:
+            status = os.stat(path)
+        except OSError:
+            raise ClError(
+                error=f"Asset Error: '{path}' is an invalid path or the file doesn't exist."
+            )
+        key = (path, status.st_mtime_ns, status.st_size, size)
+        served = self.served.get(key)
+        if served is not None:
+            return served
+        library = image_library()
+        if library is None:
+            self.validate(path, header_only=True)
+            return None
+        content = self.validate(path)
+        cached = os.path.join(self.folder, f"{hashlib.sha256(content).hexdigest()[:32]}-{size}.png")
+        try:
+            if not os.path.exists(cached):
+                with library.open(path) as image:
+                    image.thumbnail((size, size))
+                    os.makedirs(self.folder, exist_ok=True)
+                    # written apart and renamed, so other processes never read half a file
+                    temporary = f"{cached}.{os.getpid()}.{threading.get_ident()}"
+                    image.save(temporary, "PNG")
+                    os.replace(temporary, cached)
+            with open(cached, "rb") as file:
+                content = file.read()
+        except Exception as e:
+            raise ClError(
+                error=f"Asset Error: '{path}' can not be decoded ({e})"
+            )
+        served = base64.b64encode(content).decode("ascii")
+        self.served[key] = served
+        return served
+
+    def submit(self, path:str, size:int):
+        """Prepare the thumbnail of the given image in a background thread and return a future with his base64 string.
+        Requests for the same image and size share the same future.
+        """
+        key = (path, size)
+        with self._lock:
+            future = self.pending.get(key)
+            if future is None:
+                if self.executor is None:
+                    self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="calet_assets")
+                future = self.executor.submit(self.thumbnail, path, size)
+                self.pending[key] = future
+                future.add_done_callback(lambda done, key=key: self.pending.pop(key, None))
+        return future
+
+    def failed(self, path:str, error:Exception):
+        """Report an image that couldn't be prepared in background to ```on_error```, or raise his error without it.
+        """
+        if not isinstance(error, ClError):
+            error = ClError(
+                error=f"Asset Error: '{path}' can not be decoded ({error})"
+            )
+        if self.on_error is None:
+            raise error
+        self.on_error(path, error)
+
+    def clear(self):
+        """Remove all the thumbnails of the cache folder.
+        """
+        self.served.clear()
+        if os.path.isdir(self.folder):
+            for name in os.listdir(self.folder):
+                if name.endswith(".png"):
+                    os.remove(os.path.join(self.folder, name))
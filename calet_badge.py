@@ -0,0 +1,143 @@
+"""Calet: a visual components library based on Flet framework
+   - Badges module"""
+
+import threading
+import time
+import weakref
+import flet as ft
+from calet_errors import ClError
+from calet_theme import ClTheme
+from calet_loop import ClLoop
+
+# badges flusher
+class ClBadgeFlusher:
+    """Represents a page level flusher of the badges of the nav options, like unread messages counters.\n
+    Badge values can be set from any thread or followed from an async stream. Only the latest value of
+    each badge is kept, and all the changed badges of the page are sent together in one single update,
+    at most once every ```interval``` seconds, so a fast feed never floods the connection.
+    """
+    # greatest number displayed in a badge, bigger numbers are displayed like '99+'
+    MAX = 99
+    # one flusher for each live page
+    _flushers = weakref.WeakKeyDictionary()
+    _lock = threading.Lock()
+
+    def __init__(self, page:ft.Page, interval:float=0.1):
+        """Use ```ClBadgeFlusher.of(page)``` instead of this constructor to get the flusher of a page.\n
+        ---
+        - page: is the Flet page whose badges are flushed.
+        - interval: is the minimum time in seconds between two updates of the badges.
+        """
+        # VALIDATION BLOCK
+        if not isinstance(page, ft.Page):
+            raise ClError(
+                error="Argument Error: <<page>> must be an instance of 'flet.Page' class"
+            )
+        if not isinstance(interval, (int, float)) or interval < 0:
+            raise ClError(
+                error="Argument Error: <<interval>> must be a positive number"
+            )
+        # INITIALIZATION BLOCK
+        self.page = page
+        self.interval = interval
+        self.changed = weakref.WeakSet()
+        self.sent = 0.0
+        self.timer = None
+        self.lock = threading.Lock()
+
+    @classmethod
+    def of(cls, page:ft.Page):
+        """Return the badges flusher of the given page, creating it the first time.
+        """
+        # badges are set from any thread, so two threads never create two flushers for one page
+        with cls._lock:
+            flusher = cls._flushers.get(page)
+            if flusher is None:
+                flusher = cls(page)
+                cls._flushers[page] = flusher
+            return flusher
+
+    @classmethod
+    def validate(cls, value):
+        if value is not None and (not isinstance(value, (int, str)) or isinstance(value, bool)):
+            raise ClError(
+                error="Argument Error: <<badge>> must be integer or string"
+            )
+
+    @classmethod
+    def label(cls, value):
+        # text of the badge, or None to hide it
+        if value is None or value == 0 or value == "":
+            return None
+        if isinstance(value, int) and value > cls.MAX:
+            return f"{cls.MAX}+"
+        return str(value)
+
+    @classmethod
+    def control(cls, theme:ClTheme, value, content:ft.Control):
+        """Return a Flet badge with the given value over the given control.
+        """
+        label = cls.label(value)
+        return ft.Badge(
+            content=content,
+            text=label,
+            label_visible=label is not None,
+            bgcolor=theme.error,
+            text_color=theme.background_one
+        )
+
+    @classmethod
+    def paint(cls, badge:ft.Badge, value):
+        # returns True if the badge changed
+        label = cls.label(value)
+        if badge.text == label and badge.label_visible == (label is not None):
+            return False
+        badge.text = label
+        badge.label_visible = label is not None
+        return True
+
+    def post(self, component:ft.UserControl):
+        """Send the badge of the given component with the next update of the badges.
+        """
+        with self.lock:
+            self.changed.add(component)
+            if self.timer is not None:
+                # merged with the badges already waiting
+                return
+            delay = self.sent + self.interval - time.monotonic()
+            if delay > 0:
+                self.timer = threading.Timer(delay, self.flush)
+                self.timer.daemon = True
+                self.timer.start()
+                return
+        self.flush()
+
+    def flush(self):
+        """Send all the changed badges of the page in one single update.
+        """
+        with self.lock:
+            self.timer = None
+            self.sent = time.monotonic()
+            components, self.changed = list(self.changed), weakref.WeakSet()
+            # badges are inside isolated controls, the page update doesn't include them unless they're given
+            changed = [
+                component.badge_control for component in components
+                if component.page is self.page and getattr(component, "badge_control", None) is not None
+                and self.paint(component.badge_control, component.badge)
+            ]
+        if changed:
+            self.page.update(*changed)
+
+    @staticmethod
+    def follow(component:ft.UserControl, stream):
+        """Set the badge of the given component with every value of the given async iterator.
+        Return a future that can be cancelled to stop following it.
+        """
+        if not hasattr(stream, "__aiter__"):
+            raise ClError(
+                error="Argument Error: <<stream>> must be an async iterator"
+            )
+        async def following():
+            async for value in stream:
+                component.set_badge(value)
+        return ClLoop.submit(following())
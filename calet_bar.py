@@ -5,18 +5,24 @@ import flet as ft
 from calet_errors import *
 from calet_theme import *
 from calet_button import *
+from calet_render import ClRenderProfile
+from calet_asset import ClAssetCache
+from calet_batch import ClBatch
+from calet_shortcut import ClShortcutDispatcher
 import math
 
 # app title bar (ok)
 class ClAppBar(ft.UserControl):
     """Represents an app title bar to be used in Flet apps.
     """
+    # color tokens of the theme painted by this class, so 'calet_watch' only repaints it when they change
+    TOKENS = ("background_one", "font_one", "font_three", "primary", "transparent", "transparent_05")
     def __init__(self, theme:ClTheme, title:str, win_actions:list[ClWinButton|ClIconButton],
                  left_title:bool=False, title_icon:str=None, high_title_color:bool=False, left_icon:str=None, 
                  content_size:int=16, bar_size:int=40, defined_sections:bool=False, scrollable_sections:str=None, 
                  expand:bool|int=False, transparent:bool=False, with_blur:bool=False, can_maximize:bool=True, 
                  left_actions:list[ClTextButton|ClIconButton|ClModeButton|ClSwitch|ClMenuButton]=[],
-                 right_actions:list[ClTextButton|ClIconButton|ClModeButton|ClSwitch]=[]):
+                 right_actions:list[ClTextButton|ClIconButton|ClModeButton|ClSwitch]=[], render_profile:ClRenderProfile=None):
         """Use this properties to personalize the app bar:\n
         ---
         - theme: is an instance of ```calet_theme.ClTheme``` with the colors set to paint the bar.
@@ -36,6 +42,7 @@ class ClAppBar(ft.UserControl):
         - can_maximize: is a flag saying if the app bar can maximize the window with double tap.
         - left_actions: is a list of ```calet_button.ClTextButton```, ```calet_button.ClIconButton```, ```calet_button.ClModeButton```, ```calet_button.ClSwitch``` or ```calet_button.ClMenuButton``` objects to be displayed in the left side of the app bar.
         - right_actions: is a list of ```calet_button.ClTextButton```, ```calet_button.ClIconButton```, ```calet_button.ClModeButton```, ```calet_button.ClSwitch``` objects to be displayed in the right side of the app bar.
+        - render_profile: is the ```calet_render.ClRenderProfile``` used to paint the app bar. If it isn't given, the default profile is used.
         """
         # VALIDATION
         if not isinstance(theme, ClTheme):
@@ -63,19 +70,8 @@ class ClAppBar(ft.UserControl):
                 error="Argument Error: <<left_icon>> must be string."
             )
         elif left_icon is not None and "/" in left_icon:
-            file = None
-            try:
-                file = open(left_icon)
-            except Exception:
-                raise ClError(
-                    error="Argument Error: <<left_icon>> is an invalid path or the file doesn't exist."
-                )
-            finally:
-                file.close()
-            if not left_icon.endswith(("png","jpeg")):
-                raise ClError(
-                    error="Argument Error: <<left_icon>> is an invalid file. Must be in PNG or JPEG format."
-                )
+            # only the header is read here, the image is decoded in background, see 'left_icon_loaded'
+            ClAssetCache.check(left_icon)
         if not isinstance(content_size, int):
             raise ClError(
                 error="Argument Error: <<content_size>> must be integer."
@@ -132,6 +128,11 @@ class ClAppBar(ft.UserControl):
                 raise ClError(
                     error=f"Argument Error: <<right_actions[{i}]>> must be an instance of 'calet_button.ClTextButton', 'calet_button.ClIconButton','calet_button.ClModeButton' or 'calet_button.ClSwitch' class."
                 )
+        ClShortcutDispatcher.check(win_actions + left_actions + right_actions)
+        if render_profile is not None and not isinstance(render_profile, ClRenderProfile):
+            raise ClError(
+                error="Argument Error: <<render_profile>> must be an instance of 'calet_render.ClRenderProfile' class."
+            )
         # INITIALIZATION
         super().__init__()
         self.theme = theme
@@ -141,6 +142,10 @@ class ClAppBar(ft.UserControl):
         self.title_icon = title_icon
         self.high_title_color = high_title_color
         self.left_icon = left_icon
+        self.left_icon_future = None
+        self.left_icon_waiting = False
+        if left_icon is not None and "/" in left_icon and ClAssetCache.thumbnails():
+            self.left_icon_future = ClAssetCache.default().submit(left_icon, content_size+4)
         self.content_size = content_size
         self.bar_size = bar_size
         self.defined_sections = defined_sections
@@ -151,9 +156,42 @@ class ClAppBar(ft.UserControl):
         self.can_maximize = can_maximize
         self.left_actions = left_actions
         self.right_actions = right_actions
+        self.render_profile = render_profile
     
+    def did_mount(self):
+        ClRenderProfile.mount(self)
+        if self.left_icon_future is not None and self.app_icon.src_base64 == ClAssetCache.PLACEHOLDER and not self.left_icon_waiting:
+            # called at once if the thumbnail is already prepared, and only once if the bar is mounted again
+            self.left_icon_waiting = True
+            self.left_icon_future.add_done_callback(self.left_icon_loaded)
+
+    def left_icon_src(self):
+        # thumbnail of the image icon if it's prepared, or a placeholder swapped when it's ready
+        if self.left_icon_future.done() and self.left_icon_future.exception() is None:
+            return self.left_icon_future.result()
+        return ClAssetCache.PLACEHOLDER
+
+    def left_icon_loaded(self, future):
+        self.left_icon_waiting = False
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is None:
+            self.app_icon.src_base64 = future.result()
+        else:
+            # an image that can't be decoded is left to the client by his path
+            self.app_icon.src = self.left_icon
+            self.app_icon.src_base64 = None
+        if self.app_icon.page is not None:
+            self.app_icon.update()
+        if error is not None:
+            ClAssetCache.default().failed(self.left_icon, error)
+
     def build(self):
 
+        if self.render_profile is None:
+            self.render_profile = ClRenderProfile.of(self.page)
+
         # APP BAR CONTENT
         # - app icon
         if self.left_icon is not None:
@@ -162,7 +200,8 @@ class ClAppBar(ft.UserControl):
                 color=self.theme.font_three if self.high_title_color else self.theme.primary,
                 size=self.content_size+4
             ) if "/" not in self.left_icon else ft.Image(
-                src=self.left_icon,
+                src=self.left_icon if self.left_icon_future is None else None,
+                src_base64=self.left_icon_src() if self.left_icon_future is not None else None,
                 fit=ft.ImageFit.CONTAIN,
                 width=self.content_size+4,
                 height=self.content_size+4
@@ -280,31 +319,48 @@ class ClAppBar(ft.UserControl):
         )
 
         # APP BAR
+        self.bar = ft.Container(
+            bgcolor=self.theme.transparent if self.transparent else self.theme.background_one,
+            blur=self.render_profile.blur(5) if self.with_blur else None,
+            height=self.bar_size if not self.expand else None,
+            padding=ft.padding.only(left=5, top=4, right=5, bottom=4),
+            content=ft.Row(
+                spacing=0,
+                alignment=ft.MainAxisAlignment.START,
+                controls=[
+                    self.left_items,
+                    self.right_items
+                ] if self.left_title and not self.left_actions else [
+                    self.left_items,
+                    self.mid_items,
+                    self.right_items
+                ]
+            )
+        )
+
         return ft.WindowDragArea(
             maximizable=self.can_maximize,
-            content=ft.Container(
-                bgcolor=self.theme.transparent if self.transparent else self.theme.background_one,
-                blur=5 if self.with_blur else None,
-                height=self.bar_size if not self.expand else None,
-                padding=ft.padding.only(left=5, top=4, right=5, bottom=4),
-                content=ft.Row(
-                    spacing=0,
-                    alignment=ft.MainAxisAlignment.START,
-                    controls=[
-                        self.left_items,
-                        self.right_items
-                    ] if self.left_title and not self.left_actions else [
-                        self.left_items,
-                        self.mid_items,
-                        self.right_items
-                    ]
-                )
-            )
+            content=self.bar
         )
 
+    def upd(self, render_profile:ClRenderProfile=None):
+        """Update the value of all given properties.\n
+        ---
+        - render_profile: an instance of ```calet_render.ClRenderProfile``` with the new effects for the bar.
+        """
+        if render_profile is not None and not isinstance(render_profile, ClRenderProfile):
+            raise ClError(
+                error="Argument Error: <<render_profile>> must be an instance of 'calet_render.ClRenderProfile' class."
+            )
+        if render_profile is not None:
+            self.render_profile = render_profile
+            self.bar.blur = self.render_profile.blur(5) if self.with_blur else None
+        self.update()
+
 # app menu bar section (ok)
 class ClMenuSection(ft.UserControl):
     """Represents a section of an app submenu bar to be used in ```calet_bar.ClSubmenuBar``` objects."""
+    TOKENS = ("transparent_05",)
     def __init__(self, theme:ClTheme, actions:list[list], lateral:bool=False, defined:bool=False, expand:bool|int=False):
         """Use this properties to personalize the menu section:\n
         ---
@@ -396,9 +452,10 @@ class ClMenuBar(ft.UserControl):
     """Represents an app menu bar to be used in Flet apps directly or combined with a ```calet_bar.ClNavBar``` or
     ```calet_bar.ClLateralNavBar```.
     """
+    TOKENS = ("background_two", "divider", "transparent")
     def __init__(self, theme:ClTheme, sections:list[ClMenuSection], lateral:bool=False, bar_size:int=100, 
                  defined:bool=False, expand:bool|int=False, transparent:bool=False, with_blur:bool=False,
-                 right_actions:list[ClTextButton|ClIconButton]=[]):
+                 right_actions:list[ClTextButton|ClIconButton]=[], render_profile:ClRenderProfile=None):
         """Use this properties to personalize the menu:\n
         ---
         - theme: is an instance of ```calet_theme.ClTheme``` with the colors set to paint the bar.
@@ -410,6 +467,7 @@ class ClMenuBar(ft.UserControl):
         - transparent: is a flag saying if the menu must be displayed transparent or colored.
         - with_blur: is a flag saying if the menu must be displayed with blur effect or not.
         - right_actions: is a list of ```calet_button.ClTextButton```, ```calet_button.ClIconButton```, ```calet_button.ClModeButton```, ```calet_button.ClSwitch``` objects to be displayed in the right side of the menu bar.
+        - render_profile: is the ```calet_render.ClRenderProfile``` used to paint the menu. If it isn't given, the default profile is used.
         """
         # VALIDATION
         if not isinstance(theme, ClTheme):
@@ -461,6 +519,10 @@ class ClMenuBar(ft.UserControl):
                     raise ClError(
                         error=f"Argument Error: <<right_actions[{i}]>> must be an instance of 'calet_button.ClTextButton', 'calet_button.ClIconButton', 'calet_button.ClModeButton', 'calet_button.ClSwitch' class."
                     )
+        if render_profile is not None and not isinstance(render_profile, ClRenderProfile):
+            raise ClError(
+                error="Argument Error: <<render_profile>> must be an instance of 'calet_render.ClRenderProfile' class."
+            )
         # INITIAlIZATION
         super().__init__()
         self.theme = theme
@@ -472,9 +534,16 @@ class ClMenuBar(ft.UserControl):
         self.transparent = transparent
         self.with_blur = with_blur
         self.right_actions = right_actions
+        self.render_profile = render_profile
+
+    def did_mount(self):
+        ClRenderProfile.mount(self)
 
     def build(self):
 
+        if self.render_profile is None:
+            self.render_profile = ClRenderProfile.of(self.page)
+
         # MENU
         # - creating the menu
         self.menu = ft.Row(
@@ -509,11 +578,11 @@ class ClMenuBar(ft.UserControl):
             height=self.bar_size if not self.expand and not self.lateral else None,
             width=self.bar_size if not self.expand and self.lateral else None,
             bgcolor=self.theme.background_two if not self.transparent else self.theme.transparent,
-            blur=5 if self.with_blur else None,
+            blur=self.render_profile.blur(5) if self.with_blur else None,
             border=ft.border.only(bottom=ft.BorderSide(1, self.theme.divider)) if not self.lateral else ft.border.only(right=ft.BorderSide(1, self.theme.divider)),
             alignment=ft.alignment.center_left if not self.lateral else ft.alignment.top_center,
             padding=5,
-            animate=ft.Animation(100, ft.AnimationCurve.EASE_OUT),
+            animate=self.render_profile.animation(100, ft.AnimationCurve.EASE_OUT),
             content=ft.Row(
                 spacing=0,
                 controls=[
@@ -533,23 +602,41 @@ class ClMenuBar(ft.UserControl):
 
         return self.bar
 
-    def upd(self, bar_size:int=None):
-
-        if bar_size is not None and not self.expand:
+    def resize(self, bar_size:int):
+        # changes the size without updating the menu, for bars that send several changes in one single update
+        if not self.expand:
             self.bar_size = bar_size
             if self.lateral:
                 self.bar.width = bar_size
             else:
                 self.bar.height = bar_size
+
+    def upd(self, bar_size:int=None, render_profile:ClRenderProfile=None):
+        """Update the value of all given properties.\n
+        ---
+        - bar_size: the new size of the bar.
+        - render_profile: an instance of ```calet_render.ClRenderProfile``` with the new effects for the bar.
+        """
+        if render_profile is not None and not isinstance(render_profile, ClRenderProfile):
+            raise ClError(
+                error="Argument Error: <<render_profile>> must be an instance of 'calet_render.ClRenderProfile' class."
+            )
+        if bar_size is not None:
+            self.resize(bar_size)
+        if render_profile is not None:
+            self.render_profile = render_profile
+            self.bar.blur = self.render_profile.blur(5) if self.with_blur else None
+            self.bar.animate = self.render_profile.animation(100, ft.AnimationCurve.EASE_OUT)
         self.update()
 
 # app nav bar (ok)
 class ClNavBar(ft.UserControl):
     """Represents a tabs navigation bar to be used in Flet Apps."""
+    TOKENS = ("background_one", "divider", "font_one", "font_two", "transparent", "transparent_05", "transparent_1")
     def __init__(self, theme:ClTheme, options:list[ClNavTab|ClSelectableTextButton], selected_option:int=0, 
                  bar_size:int=40, expand:bool|int=False, transparent:bool=False, with_blur:bool=False,
                  actions:list[ClTextButton|ClButton|ClIconButton|ClModeButton|ClSwitch]=[], 
-                 submenus:list[ClMenuBar]=[]):
+                 submenus:list[ClMenuBar]=[], render_profile:ClRenderProfile=None):
         """Use this properties to personalize the bar:\n
         ---
         - theme: is an instance of ```calet_theme.ClTheme``` with the colors set to paint the bar.
@@ -561,6 +648,7 @@ class ClNavBar(ft.UserControl):
         - with_blur: is a flag saying if the submenu must be displayed with blur effect or not.
         - actions: is a list of ```calet_button.ClTextButton```, ```calet_button.ClButton```, ```calet_button.ClIconButton```, ```calet_button.ClModeButton``` or ```calet_button.ClSwitch``` objects to be displayed as actions in the right side of the nav bar.
         - submenus: is a list of ```calet_bar.ClMenuBar``` objects where each object will be displayed as the submenu of a different option in the menu bar. If it's given, must have the same length of ```options``` list. 
+        - render_profile: is the ```calet_render.ClRenderProfile``` used to paint the bar and his options. If it isn't given, the default profile is used.
         """
         # VALIDATION
         if not isinstance(theme, ClTheme):
@@ -597,6 +685,7 @@ class ClNavBar(ft.UserControl):
                 raise ClError(
                     error="Argument Error: <<options>> must be a list with at least one option."
                 )
+            ClShortcutDispatcher.check(options)
             if not 0 <= selected_option < len(options):
                 raise ClError(
                     error="Argument Error: <<selected_option>> is out of the range of options."
@@ -652,6 +741,10 @@ class ClNavBar(ft.UserControl):
                 submenus_maxsize.append(submenus[i].bar_size)
                 submenus[i].expand = 2 if expand else False
                 submenus[i].lateral = False
+        if render_profile is not None and not isinstance(render_profile, ClRenderProfile):
+            raise ClError(
+                error="Argument Error: <<render_profile>> must be an instance of 'calet_render.ClRenderProfile' class."
+            )
         # INITIALIZATION
         super().__init__()
         self.theme = theme
@@ -665,9 +758,18 @@ class ClNavBar(ft.UserControl):
         self.submenus = submenus
         self.submenus_maxsize = submenus_maxsize
         self.options_map = options_map
+        self.render_profile = render_profile
+
+    def did_mount(self):
+        ClRenderProfile.mount(self)
 
     def build(self):
-        
+
+        if self.render_profile is None:
+            self.render_profile = ClRenderProfile.of(self.page)
+        # the options and submenus without profile are painted with the profile of the bar
+        self.render_profile.share(self.options + self.submenus)
+
         # NAV BAR
         # - bar left items
         self.left_items = ft.Container(
@@ -700,7 +802,7 @@ class ClNavBar(ft.UserControl):
                     color=self.theme.font_two,
                     size=self.options[0].content_size+4,
                     rotate=math.pi,
-                    animate_rotation=200
+                    animate_rotation=self.render_profile.animation(200)
                 ),
                 on_click=self.b_toggle_clicked
             )
@@ -743,29 +845,49 @@ class ClNavBar(ft.UserControl):
 
     def b_toggle_clicked(self, e:ft.TapEvent):
         e.control.selected = not e.control.selected
-        if not self.expand:
-            self.submenus[self.selected_option].upd(bar_size=self.submenus_maxsize[self.selected_option] if e.control.selected else 0)
-        else:
-            self.expand = e.control.data if e.control.selected else 1
-            self.submenus[self.selected_option].visible = True if e.control.selected else False
-        e.control.content.rotate = math.pi if e.control.selected else 0
-        e.control.content.color = self.theme.font_two if e.control.selected else self.theme.font_one
+        # the submenu and the bar are sent in one single update
+        with ClBatch(self.page):
+            if not self.expand:
+                self.submenus[self.selected_option].resize(self.submenus_maxsize[self.selected_option] if e.control.selected else 0)
+                self.submenus[self.selected_option].update()
+            else:
+                self.expand = e.control.data if e.control.selected else 1
+                self.submenus[self.selected_option].visible = True if e.control.selected else False
+            e.control.content.rotate = math.pi if e.control.selected else 0
+            e.control.content.color = self.theme.font_two if e.control.selected else self.theme.font_one
+            self.update()
+
+    def upd(self, render_profile:ClRenderProfile=None):
+        """Update the value of all given properties.\n
+        ---
+        - render_profile: an instance of ```calet_render.ClRenderProfile``` with the new effects for the bar.
+        """
+        if render_profile is not None and not isinstance(render_profile, ClRenderProfile):
+            raise ClError(
+                error="Argument Error: <<render_profile>> must be an instance of 'calet_render.ClRenderProfile' class."
+            )
+        if render_profile is not None:
+            self.render_profile = render_profile
+            if self.submenus:
+                self.b_toggle.content.animate_rotation = self.render_profile.animation(200)
         self.update()
 
     def option_clicked(self, e:ft.TapEvent):
         # mapping the index of the clicked option and updating selection
         clicked_index = self.options_map[e.control.data][0]
         if self.selected_option != clicked_index: # else nothing change in the selections
-            self.options[self.selected_option].upd(selected=False)
-            self.selected_option = clicked_index
-            # openning submenu of clicked option
-            if self.submenus:
-                self.bar.content.controls[1] = self.submenus[self.selected_option]
-                if self.expand:
-                    self.submenus[self.selected_option].visible = True if self.b_toggle.selected else False
-                else:
-                    self.submenus[self.selected_option].bar_size = self.submenus_maxsize[self.selected_option] if self.b_toggle.selected else 0
-            self.update()
+            # the old option and the bar are sent in one single update
+            with ClBatch(self.page):
+                self.options[self.selected_option].upd(selected=False)
+                self.selected_option = clicked_index
+                # openning submenu of clicked option
+                if self.submenus:
+                    self.bar.content.controls[1] = self.submenus[self.selected_option]
+                    if self.expand:
+                        self.submenus[self.selected_option].visible = True if self.b_toggle.selected else False
+                    else:
+                        self.submenus[self.selected_option].bar_size = self.submenus_maxsize[self.selected_option] if self.b_toggle.selected else 0
+                self.update()
         # mapping the custom action of the clicked option and redirecting it to the user
         clicked_action = self.options_map[e.control.data][1]
         if clicked_action is not None:
@@ -774,6 +896,7 @@ class ClNavBar(ft.UserControl):
 # filter bar (ok)
 class ClFilterBar(ft.UserControl):
     """Represents a container bar for filters to be used in Flet Apps."""
+    TOKENS = ("background_one", "divider")
     def __init__(self, theme:ClTheme, filters:list[ClFilterButton|ClCrystalFilterButton], selected_filters:list[int]=[], 
                  bar_size:int=40, expand:bool|int=False, transparent:bool=False, with_blur:bool=False):
         """Use this properties to personalize the submenu:\n
@@ -886,14 +1009,36 @@ class ClFilterBar(ft.UserControl):
     def get_selected_filters(self):
         return [self.filters[selected_filter] for selected_filter in self.selected_filters]
 
+    def add_filters(self, filters:list[ClFilterButton|ClCrystalFilterButton]):
+        """Add the given filters at the end of the bar with one single update, like the pages fed by a ```calet_source.ClPagedSource```.
+        """
+        if not isinstance(filters, list):
+            raise ClError(
+                error="Argument Error: <<filters>> must be a list."
+            )
+        if not filters:
+            return
+        # the class of the filters is decided by the bar, or by the given filters if the bar has none yet
+        first = self.filters[0] if self.filters else filters[0]
+        kind = ClFilterButton if isinstance(first, ClFilterButton) else ClCrystalFilterButton
+        for i in range(len(filters)):
+            if not isinstance(filters[i], kind):
+                raise ClError(
+                    error=f"Argument Error: <<filters[{i}]>> must be an instance of 'calet_bar.{kind.__name__}' class like the filters of the bar."
+                )
+        self.filters.extend(filters)
+        self.items.content.controls = self.filters
+        self.update()
+
 # lateral nav bar (ok)
 class ClLateralNavBar(ft.UserControl):
     """Represents a lateral navigation bar to be used in Flet Apps directly or combined with another 
     ```calet_bar.ClLateralNavBar```."""
+    TOKENS = ("background_one", "divider")
     def __init__(self, theme:ClTheme, options:list[ClNavButton|ClMarkTab], selected_option:int=-1, 
                  bar_size:int=80, separated:bool=False, expand:bool|int=False, transparent:bool=False, with_blur:bool=False,
                  actions:list[ClTextButton|ClButton|ClIconButton|ClModeButton|ClSwitch]=[], 
-                 submenus:list=[]):
+                 submenus:list=[], render_profile:ClRenderProfile=None):
         """Use this properties to personalize the bar:\n
         ---
         - theme: is an instance of ```calet_theme.ClTheme``` with the colors set to paint the bar.
@@ -906,6 +1051,7 @@ class ClLateralNavBar(ft.UserControl):
         - with_blur: is a flag saying if the submenu must be displayed with blur effect or not.
         - actions: is a list of ```calet_button.ClTextButton```, ```calet_button.ClButton```, ```calet_button.ClIconButton```, ```calet_button.ClModeButton``` or ```calet_button.ClSwitch``` objects to be displayed as actions in the right side of the nav bar.
         - submenus: is a list of ```calet_bar.ClMenuBar``` or ```calet_bar.ClLateralNavBar``` objects or None where each not None object will be displayed as the submenu of a different option in the menu bar. If it's given, must have the same length of ```options``` list. 
+        - render_profile: is the ```calet_render.ClRenderProfile``` used to paint the bar and his options. If it isn't given, the default profile is used.
         """
         # VALIDATION
         if not isinstance(theme, ClTheme):
@@ -946,6 +1092,7 @@ class ClLateralNavBar(ft.UserControl):
                 raise ClError(
                     error="Argument Error: <<options>> must be a list with at least one option."
                 )
+            ClShortcutDispatcher.check(options)
             if not -1 <= selected_option < len(options):
                 raise ClError(
                     error="Argument Error: <<selected_option>> is out of the range of possible options."
@@ -1004,6 +1151,10 @@ class ClLateralNavBar(ft.UserControl):
                 submenus[i].visible = False if expand else True
                 submenus[i].bar_size = 0 if not expand else None
                 submenus[i].lateral = True
+        if render_profile is not None and not isinstance(render_profile, ClRenderProfile):
+            raise ClError(
+                error="Argument Error: <<render_profile>> must be an instance of 'calet_render.ClRenderProfile' class."
+            )
         # INITIALIZATION
         super().__init__()
         self.theme = theme
@@ -1018,9 +1169,43 @@ class ClLateralNavBar(ft.UserControl):
         self.submenus = submenus
         self.options_map = options_map
         self.submenus_maxsize = submenus_maxsize
+        self.transitions = self.transitions_table()
+        self.render_profile = render_profile
   
+    def transitions_table(self):
+        # state transition of each option click from each selected option (-1 when no option is selected):
+        # (next selected option, submenu to close, submenu to open, expansion change)
+        has_menu = [
+            bool(self.submenus) and isinstance(self.submenus[i], (ClMenuBar, ClLateralNavBar)) for i in range(len(self.options))
+        ]
+        table = {}
+        for current in range(-1, len(self.options)):
+            for clicked in range(len(self.options)):
+                # case 1: open a new menu
+                if current == -1:
+                    opened = has_menu[clicked]
+                    table[current, clicked] = (clicked, None, clicked if opened else None, "open" if opened else None)
+                # case 2: close the menu of an option
+                elif current == clicked:
+                    closed = has_menu[clicked]
+                    table[current, clicked] = (-1, clicked if closed else None, None, "close" if closed else None)
+                # case 3: change to the menu of another option, the bar only expands or collapses if one of them has no menu
+                else:
+                    closed, opened = has_menu[current], has_menu[clicked]
+                    expansion = "open" if opened and not closed else "close" if closed and not opened else None
+                    table[current, clicked] = (clicked, current if closed else None, clicked if opened else None, expansion)
+        return table
+
+    def did_mount(self):
+        ClRenderProfile.mount(self)
+
     def build(self):
-        
+
+        if self.render_profile is None:
+            self.render_profile = ClRenderProfile.of(self.page)
+        # the options and submenus without profile are painted with the profile of the bar
+        self.render_profile.share(self.options + self.submenus)
+
         # NAV BAR
         # - bar top items
         self.top_items = ft.Container(
@@ -1049,13 +1234,15 @@ class ClLateralNavBar(ft.UserControl):
             border=ft.border.only(right=ft.BorderSide(1,self.theme.divider)),
             alignment=ft.alignment.center,
             padding=ft.padding.only(left=10, top=10, right=10, bottom=5) if isinstance(self.options[0], ClNavButton) else ft.padding.only(top=10, bottom=5),
-            animate=ft.Animation(100, ft.AnimationCurve.EASE_OUT),
+            animate=self.render_profile.animation(100, ft.AnimationCurve.EASE_OUT),
             content=ft.Column(
                 spacing=0,
                 controls=[self.top_items, self.bottom_items]
             ) if self.actions else self.top_items
         )
 
+        self.rail = self.bar
+
         # SUBMENUS
         if self.submenus:
             self.bar = ft.Container(
@@ -1079,70 +1266,62 @@ class ClLateralNavBar(ft.UserControl):
     def option_clicked(self, e:ft.TapEvent):
         # mapping the index of the clicked option and updating selection
         clicked_index = self.options_map[e.control.data][0]
-        # case 1: open a new menu
-        if self.selected_option == -1:
-            if self.submenus and isinstance(self.submenus[clicked_index], (ClMenuBar, ClLateralNavBar)):
-                if self.expand:
-                    self.expand = self.bar.data
-                    self.submenus[clicked_index].visible = True
-                else:
-                    self.submenus[clicked_index].upd(bar_size=self.submenus_maxsize[clicked_index])
-            self.selected_option = clicked_index
-        # case 2: close the menu of an option
-        elif self.selected_option == clicked_index:
-            if self.submenus and isinstance (self.submenus[clicked_index], (ClMenuBar, ClLateralNavBar)):
-                if self.expand:
-                    self.expand = 1
-                    self.submenus[clicked_index].visible = False
-                else:
-                    self.submenus[clicked_index].upd(bar_size=0)
-            self.selected_option = -1
-        # case 3: change to the menu of another option
-        elif self.selected_option != clicked_index:
-            if self.submenus:
-                # case 3.1: both option have menus -> then change old menu for the new one
-                if isinstance(self.submenus[self.selected_option], (ClMenuBar, ClLateralNavBar)) and isinstance(self.submenus[clicked_index], (ClMenuBar, ClLateralNavBar)):
-                    if self.expand:
-                        self.submenus[self.selected_option].visible = False
-                        self.submenus[clicked_index].visible = True
-                    else:
-                        self.submenus[self.selected_option].upd(bar_size=0)
-                        self.submenus[clicked_index].upd(bar_size=self.submenus_maxsize[clicked_index])
-                # case 3.2: only the new option has menu -> then open a new men
-                elif isinstance(self.submenus[clicked_index], (ClMenuBar, ClLateralNavBar)):
-                    if self.expand:
-                        self.expand = self.bar.data
-                        self.submenus[clicked_index].visible = True
-                    else:
-                        self.submenus[clicked_index].upd(bar_size=self.submenus_maxsize[clicked_index])
-                # case 3.3: only the old option has menu -> then close the old menu
-                elif isinstance(self.submenus[self.selected_option], (ClMenuBar, ClLateralNavBar)):
-                    if self.expand:
-                        self.expand = 1
-                        self.submenus[self.selected_option].visible = False
-                    else:
-                        self.submenus[self.selected_option].upd(bar_size=0)
-            self.options[self.selected_option].upd(selected=False)
-            self.selected_option = clicked_index
-        self.update()
+        selected, closed, opened, expansion = self.transitions[self.selected_option, clicked_index]
+        # all the size, visibility and selection changes are sent in one single update
+        with ClBatch(self.page):
+            if closed is not None:
+                self.show_submenu(closed, False)
+            if opened is not None:
+                self.show_submenu(opened, True)
+            if expansion is not None and self.expand:
+                self.expand = self.bar.data if expansion == "open" else 1
+            if self.selected_option not in (-1, clicked_index):
+                self.options[self.selected_option].upd(selected=False)
+            self.selected_option = selected
+            self.update()
         # mapping the custom action of the clicked option and redirecting it to the user
         clicked_action = self.options_map[e.control.data][1]
         if clicked_action is not None:
             clicked_action(e)
 
-    def upd(self, bar_size:int=None):
+    def show_submenu(self, index:int, opened:bool):
+        submenu = self.submenus[index]
+        if self.expand:
+            submenu.visible = opened
+        else:
+            submenu.resize(self.submenus_maxsize[index] if opened else 0)
+        submenu.update()
 
-        if bar_size is not None and not self.expand:
+    def resize(self, bar_size:int):
+        # changes the size without updating the bar, for bars that send several changes in one single update
+        if not self.expand:
             self.bar_size = bar_size
             self.bar.width = bar_size
+
+    def upd(self, bar_size:int=None, render_profile:ClRenderProfile=None):
+        """Update the value of all given properties.\n
+        ---
+        - bar_size: the new size of the bar.
+        - render_profile: an instance of ```calet_render.ClRenderProfile``` with the new effects for the bar.
+        """
+        if render_profile is not None and not isinstance(render_profile, ClRenderProfile):
+            raise ClError(
+                error="Argument Error: <<render_profile>> must be an instance of 'calet_render.ClRenderProfile' class."
+            )
+        if bar_size is not None:
+            self.resize(bar_size)
+        if render_profile is not None:
+            self.render_profile = render_profile
+            self.rail.animate = self.render_profile.animation(100, ft.AnimationCurve.EASE_OUT)
         self.update()
 
 # bottom nav bar
 class ClBottomNavBar(ft.UserControl):
     """Represents a bottom app navigation bar to be used in Flet Apps."""
+    TOKENS = ("background_one", "divider")
     def __init__(self, theme:ClTheme, options:list[ClNavButton], selected_option:int=0, 
                  bar_size:int=60, expand:bool|int=False, transparent:bool=False, with_blur:bool=False,
-                 with_shadow=False):
+                 with_shadow=False, render_profile:ClRenderProfile=None):
         """Use this properties to personalize the bar:\n
         ---
         - theme: is an instance of ```calet_theme.ClTheme``` with the colors set to paint the bar.
@@ -1153,6 +1332,7 @@ class ClBottomNavBar(ft.UserControl):
         - transparent: is a flag saying if the bar must be displayed transparent or colored.
         - with_blur: is a flag saying if the bar must be displayed with blur effect or not.
         - with_shadow: is a flag saying if the bar must be displayed with shadow or solid border.
+        - render_profile: is the ```calet_render.ClRenderProfile``` used to paint the options of the bar. If it isn't given, the default profile is used.
         """
         # VALIDATION
         if not isinstance(theme, ClTheme):
@@ -1193,6 +1373,7 @@ class ClBottomNavBar(ft.UserControl):
                 raise ClError(
                     error="Argument Error: <<options>> must be a list with at least one option."
                 )
+            ClShortcutDispatcher.check(options)
             if not -1 <= selected_option < len(options):
                 raise ClError(
                     error="Argument Error: <<selected_option>> is out of the range of possible options."
@@ -1205,6 +1386,10 @@ class ClBottomNavBar(ft.UserControl):
                 options[i].selected = True if i == selected_option else False
                 options_map[options[i]] = i, options[i].action
                 options[i].action = self.option_clicked
+        if render_profile is not None and not isinstance(render_profile, ClRenderProfile):
+            raise ClError(
+                error="Argument Error: <<render_profile>> must be an instance of 'calet_render.ClRenderProfile' class."
+            )
         # INITIALIZATION
         super().__init__()
         self.theme = theme
@@ -1216,9 +1401,14 @@ class ClBottomNavBar(ft.UserControl):
         self.with_blur = with_blur
         self.with_shadow = with_shadow
         self.options_map = options_map
+        self.render_profile = render_profile
     
     def build(self):
 
+        # the options without profile are painted with the profile of the bar
+        if self.render_profile is not None:
+            self.render_profile.share(self.options)
+
         # NAV BAR
         # - bar items
         self.items = ft.Row(
@@ -1263,8 +1453,10 @@ class ClBottomNavBar(ft.UserControl):
 # swap nav bar
 class ClSwapNavBar(ft.UserControl):
     """Represents a navigation bar with swapping style to be used in Flet Apps."""
+    TOKENS = ("font_four", "primary", "transparent_1", "transparent_5")
     def __init__(self, theme:ClTheme, options:list[ClSwapDestination], selected_option:int=0, 
-                 bar_size:int=40, expand:bool|int=False, primary_color:bool=True, with_blur:bool=False):
+                 bar_size:int=40, expand:bool|int=False, primary_color:bool=True, with_blur:bool=False,
+                 render_profile:ClRenderProfile=None):
         """Use this properties to personalize the bar:\n
         ---
         - theme: is an instance of ```calet_theme.ClTheme``` with the colors set to paint the bar.
@@ -1274,6 +1466,7 @@ class ClSwapNavBar(ft.UserControl):
         - expand: is the responsive expansion of the menu bar in his container. See ```expand``` Flet property for more information.
         - primary_color: is a flag saying if the option's selection mark must be painted with primary or non primary color.
         - with_blur: is a flag saying if the submenu must be displayed with blur effect or not.
+        - render_profile: is the ```calet_render.ClRenderProfile``` used to paint the bar. If it isn't given, the default profile is used.
         """
         # VALIDATION
         if not isinstance(theme, ClTheme):
@@ -1310,6 +1503,7 @@ class ClSwapNavBar(ft.UserControl):
                 raise ClError(
                     error="Argument Error: <<options>> must be a list with at least one option."
                 )
+            ClShortcutDispatcher.check(options)
             if not 0 <= selected_option < len(options):
                 raise ClError(
                     error="Argument Error: <<selected_option>> is out of the range of options."
@@ -1326,6 +1520,10 @@ class ClSwapNavBar(ft.UserControl):
                 # - using the same 'for' cicle to extend action of each option in the list
                 options_map[options[i]] = i, options[i].action
                 options[i].action = self.option_clicked
+        if render_profile is not None and not isinstance(render_profile, ClRenderProfile):
+            raise ClError(
+                error="Argument Error: <<render_profile>> must be an instance of 'calet_render.ClRenderProfile' class."
+            )
         # INITIALIZATION
         super().__init__()
         self.theme = theme
@@ -1336,9 +1534,16 @@ class ClSwapNavBar(ft.UserControl):
         self.primary_color = primary_color
         self.with_blur = with_blur
         self.options_map = options_map
+        self.render_profile = render_profile
     
+    def did_mount(self):
+        ClRenderProfile.mount(self)
+
     def build(self):
 
+        if self.render_profile is None:
+            self.render_profile = ClRenderProfile.of(self.page)
+
         # ITEMS
         # - items
         self.items = ft.Container(
@@ -1347,7 +1552,7 @@ class ClSwapNavBar(ft.UserControl):
             alignment=ft.alignment.center,
             padding=5,
             border_radius=10,
-            blur=5 if self.with_blur else None,
+            blur=self.render_profile.blur(5) if self.with_blur else None,
             content=ft.Row(
                 spacing=0,
                 controls=self.options
@@ -1362,7 +1567,7 @@ class ClSwapNavBar(ft.UserControl):
             margin=5,
             border_radius=5,
             offset=ft.Offset(self.selected_option,0),
-            animate_offset=ft.Animation(duration=200, curve=ft.AnimationCurve.LINEAR_TO_EASE_OUT),
+            animate_offset=self.render_profile.animation(200, ft.AnimationCurve.LINEAR_TO_EASE_OUT),
             content=ft.Text(
                 value=self.options[self.selected_option].text,
                 color=self.theme.font_four if self.primary_color else self.theme.primary,
@@ -1386,6 +1591,21 @@ class ClSwapNavBar(ft.UserControl):
 
         return self.bar
     
+    def upd(self, render_profile:ClRenderProfile=None):
+        """Update the value of all given properties.\n
+        ---
+        - render_profile: an instance of ```calet_render.ClRenderProfile``` with the new effects for the bar.
+        """
+        if render_profile is not None and not isinstance(render_profile, ClRenderProfile):
+            raise ClError(
+                error="Argument Error: <<render_profile>> must be an instance of 'calet_render.ClRenderProfile' class."
+            )
+        if render_profile is not None:
+            self.render_profile = render_profile
+            self.items.blur = self.render_profile.blur(5) if self.with_blur else None
+            self.selection_mark.animate_offset = self.render_profile.animation(200, ft.AnimationCurve.LINEAR_TO_EASE_OUT)
+        self.update()
+
     def option_clicked(self, e:ft.TapEvent):
         # mapping the index of the clicked option and updating selection
         clicked_index = self.options_map[e.control.data][0]
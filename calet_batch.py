@@ -0,0 +1,85 @@
+"""Calet: a visual components library based on Flet framework
+   - Batch updates module"""
+
+import threading
+import types
+import flet as ft
+from calet_errors import ClError
+
+# batched page updates
+class ClBatch:
+    """Represents a block of changes in Calet components that is sent to the page with one single update.\n
+    Use it as a context manager: every ```update()``` called by a control of the page inside the block
+    is recorded instead of sent, and all recorded controls are flushed together when the block ends.
+    Batches are tracked for each thread: they can be nested in the same thread, where the outermost one
+    sends the update, and the updates of other threads are never recorded by them.
+    """
+    # open batches of the current thread by page
+    _local = threading.local()
+    _lock = threading.Lock()
+
+    def __init__(self, page:ft.Page):
+        """Use this properties to personalize the batch:\n
+        ---
+        - page: is the Flet page whose updates will be grouped.
+        """
+        # VALIDATION BLOCK
+        if not isinstance(page, ft.Page):
+            raise ClError(
+                error="Argument Error: <<page>> must be an instance of 'flet.Page' class"
+            )
+        # INITIALIZATION BLOCK
+        self.page = page
+        self.controls = {}
+        self.outer = False
+
+    @classmethod
+    def batches(cls):
+        batches = getattr(cls._local, "batches", None)
+        if batches is None:
+            batches = cls._local.batches = {}
+        return batches
+
+    @classmethod
+    def install(cls, page:ft.Page):
+        # the page update is routed once and for all through the batches of the calling thread,
+        # so batches opened and closed in several threads never replace each other's function
+        with cls._lock:
+            if "update" not in vars(page):
+                page.update = types.MethodType(cls.page_update, page)
+
+    @staticmethod
+    def page_update(page:ft.Page, *controls):
+        batch = ClBatch.batches().get(id(page))
+        if batch is None:
+            ft.Page.update(page, *controls)
+        else:
+            batch.record(*controls)
+
+    def __enter__(self):
+        # another batch of this thread is already recording this page
+        batches = self.batches()
+        self.outer = id(self.page) in batches
+        if not self.outer:
+            self.install(self.page)
+            self.controls = {}
+            batches[id(self.page)] = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if not self.outer:
+            del self.batches()[id(self.page)]
+            self.flush()
+        return False
+
+    def record(self, *controls):
+        # controls are kept by identity and in recording order
+        for control in controls or (self.page,):
+            self.controls.setdefault(id(control), control)
+
+    def flush(self):
+        controls, self.controls = self.controls, {}
+        if id(self.page) in controls:
+            ft.Page.update(self.page)
+        elif controls:
+            ft.Page.update(self.page, *controls.values())
@@ -1,17 +1,26 @@
 """Calet: a visual components library based on Flet framework
    - Buttons module"""
 
+import weakref
 import flet as ft
 from calet_theme import ClTheme, ClLightTheme, ClDarkTheme
 from calet_errors import ClError
+from calet_shortcut import ClShortcutDispatcher
+from calet_color import normalize, variants
+from calet_render import ClRenderProfile
+from calet_window import ClWindowController
+from calet_batch import ClBatch
+from calet_badge import ClBadgeFlusher
 
 # - text button (ok) (ok)
 class ClTextButton(ft.UserControl):
     """Represents a text button to be used in Flet apps.\n
     """
+    # color tokens of the theme painted by this class, so 'calet_watch' only repaints it when they change
+    TOKENS = ("font_one", "font_two", "transparent", "transparent_05")
     def __init__(self, theme:ClTheme, text:str=None, icon:str=None, hover_icon:str=None, content_size:int=16, 
                  content_padding:int=5, width:int=None, height:int=None, radius:int=5, left_icon:bool=True, rounded:bool=True,
-                 expand:bool|int=False, enabled:bool=True, data=None, action=None):
+                 expand:bool|int=False, enabled:bool=True, data=None, action=None, shortcut:str=None):
         """Use this properties to personalize the button:\n
         ---
         - theme: is an instance of ```calet_theme.ClTheme``` with the colors set to paint the button.
@@ -29,6 +38,7 @@ class ClTextButton(ft.UserControl):
         - enabled: is a flag saying when the button is enabled or not.
         - data: is a custom and invisible data to be stored in this object for custom uses.
         - action: is the custom function to execute when the button is clicked.
+        - shortcut: is a keyboard shortcut like 'ctrl+s' that clicks the button when is pressed in his page.
         """
         # VALIDATION BLOCK
         if not isinstance(theme, ClTheme):
@@ -83,6 +93,8 @@ class ClTextButton(ft.UserControl):
             raise ClError(
                 error="Argument Error: <<enabled>> must be boolean"
             )
+        if shortcut is not None:
+            ClShortcutDispatcher.compile(shortcut)
 
         # INITIALIZATION BLOCK
         super().__init__()
@@ -101,7 +113,16 @@ class ClTextButton(ft.UserControl):
         self.enabled = enabled
         self.data = data
         self.action = action
+        self.shortcut = shortcut
     
+    def did_mount(self):
+        if self.shortcut is not None and self.page is not None:
+            ClShortcutDispatcher.of(self.page).register(self)
+
+    def will_unmount(self):
+        if self.shortcut is not None and self.page is not None:
+            ClShortcutDispatcher.of(self.page).unregister(self)
+
     def build(self):
         
         # BUTTON CONTENT
@@ -205,6 +226,7 @@ class ClTextButton(ft.UserControl):
 class ClOutlinedButton(ClTextButton):
     """Represents an outlined button to be used in Flet apps.\n
     """
+    TOKENS = ("primary", "transparent", "transparent_05")
     def build(self):
         super().build()
 
@@ -259,6 +281,7 @@ class ClOutlinedButton(ClTextButton):
 class ClTonalButton(ClTextButton):
     """Represents a tonal button to be used in Flet apps.
     """
+    TOKENS = ("tonal", "tonal_block")
     def build(self):
         super().build()
         if self.icon is not None:
@@ -293,6 +316,7 @@ class ClTonalButton(ClTextButton):
 class ClButton(ClTextButton):
     """Represents a button with normal aspect to be used in Flet apps.
     """
+    TOKENS = ("font_three", "font_two", "primary", "primary_hovered")
     def build(self):
         super().build()
         if self.icon is not None:
@@ -321,6 +345,7 @@ class ClButton(ClTextButton):
 class ClCrystalButton(ClTextButton):
     """Represents a button with semitransparent aspect to be used in Flet apps.
     """
+    TOKENS = ("transparent_1",)
     def build(self):
         super().build()
         self.button.style.bgcolor = {
@@ -337,6 +362,7 @@ class ClCrystalButton(ClTextButton):
 class ClAcceptButton(ClButton):
     """Represents a button with accept aspect to be used in Flet apps.
     """
+    TOKENS = ("accept", "accept_hovered")
     def build(self):
         super().build()
         self.button.style.bgcolor = {
@@ -353,6 +379,7 @@ class ClAcceptButton(ClButton):
 class ClCancelButton(ClButton):
     """Represents a button with cancel aspect to be used in Flet apps.
     """
+    TOKENS = ("cancel", "cancel_hovered")
     def build(self):
         super().build()
         self.button.style.bgcolor = {
@@ -370,10 +397,11 @@ class ClModeButton(ClTextButton):
     """Represents a button that alternate between two modes when is clicked to be used in 
     Flet apps.
     """
+    TOKENS = ("font_one",)
     def __init__(self, theme:ClTheme, text:str=None, second_text:str=None, icon:str=None, hover_icon:str=None, 
                  second_icon:str=None, hover_second_icon:str=None, content_size:int=16, content_padding:int=5, 
                  width:int=None, height:int=None, radius:int=5, left_icon:bool=True, rounded:bool=True, expand:bool|int=False, 
-                 enabled:bool=True, first_mode=True, data=None, action=None):
+                 enabled:bool=True, first_mode=True, data=None, action=None, shortcut:str=None):
         """Use this properties to personalize the button:\n
         ---
         - theme: is an instance of ```calet_theme.ClTheme``` with the colors set to paint the button. 
@@ -395,6 +423,7 @@ class ClModeButton(ClTextButton):
         - fist_mode: is a flag saying when the button is in the first mode or not.
         - data: is a custom and invisible data to be stored in this object for custom uses.
         - action: is the custom function to execute when the button is clicked.
+        - shortcut: is a keyboard shortcut like 'ctrl+s' that clicks the button when is pressed in his page.
         """
         # SUPER BLOCK
         super().__init__(
@@ -412,7 +441,8 @@ class ClModeButton(ClTextButton):
             expand=expand,
             enabled=enabled,
             data=data,
-            action=action
+            action=action,
+            shortcut=shortcut
         )
         # VALIDATION BLOCK
         if second_text is not None and not isinstance(second_text, str):
@@ -498,10 +528,11 @@ class ClModeButton(ClTextButton):
 class ClSelectableTextButton(ClTextButton):
     """Represents a button with selected and not selected statuses changing on click to be used in Flet apps.
     """
+    TOKENS = ("font_one", "font_three", "font_two", "transparent", "transparent_05", "transparent_1")
     def __init__(self, theme:ClTheme, text:str=None, icon:str=None, hover_icon:str=None, selected_icon:str=None, 
                  hover_selected_icon:str=None, content_size:int=16, content_padding:int=5, width:int=None, height:int=None,
                  radius:int=5, left_icon:bool=True, rounded:bool=True, expand:bool|int=False, enabled:bool=True, selected:bool=False,
-                 data=None, action=None):
+                 data=None, action=None, shortcut:str=None):
         """Use this properties to personalize the button:\n
         ---
         - theme: is an instance of ```calet_theme.ClTheme``` with the colors set to paint the button.
@@ -522,6 +553,7 @@ class ClSelectableTextButton(ClTextButton):
         - selected: is a flag saying when the button is selected or not.
         - data: is a custom and invisible data to be stored in this object for custom uses.
         - action: is the custom function to execute when the button is clicked.
+        - shortcut: is a keyboard shortcut like 'ctrl+s' that clicks the button when is pressed in his page.
         """
         # SUPER BLOCK
         super().__init__(
@@ -539,7 +571,8 @@ class ClSelectableTextButton(ClTextButton):
             expand=expand,
             enabled=enabled,
             data=data,
-            action=action
+            action=action,
+            shortcut=shortcut
         )
         # VALIDATION BLOCK
         if selected_icon is not None and not isinstance(selected_icon, str):
@@ -670,6 +703,7 @@ class ClSelectableButton(ClSelectableTextButton):
     """Represents a button with selected and not selected statuses changing on click and solid colors aspect 
     to be used in Flet apps.
     """
+    TOKENS = ("font_four", "primary", "primary_hovered", "transparent", "transparent_05")
     def build(self):
 
         super().build()
@@ -729,7 +763,7 @@ class ClSelectableButton(ClSelectableTextButton):
         - enabled: a flag saying the new available status of the button.
         - selected: a flag saying the new selection status of the button.
         """
-        super().upd(enabled)
+        super().upd(enabled=enabled)
         if theme is not None and not isinstance(theme, ClTheme):
             raise ClError(
                 error="Argument Error: <<theme>> must be an instance of 'calet_theme.ClTheme' Calet class"
@@ -771,6 +805,7 @@ class ClSelectableCrystalButton(ClSelectableTextButton):
     """Represents a button with selected and not selected statuses changing on click and semi-transparent colors aspect 
     to be used in Flet apps.
     """
+    TOKENS = ("font_one", "font_two", "primary", "primary_block", "transparent_1")
     def build(self):
 
         super().build()
@@ -838,7 +873,7 @@ class ClSelectableCrystalButton(ClSelectableTextButton):
         - enabled: a flag saying the new available status of the button.
         - selected: a flag saying the new selection status of the button.
         """
-        super().upd(enabled)
+        super().upd(enabled=enabled)
         if theme is not None and not isinstance(theme, ClTheme):
             raise ClError(
                 error="Argument Error: <<theme>> must be an instance of 'calet_theme.ClTheme' Calet class"
@@ -885,6 +920,7 @@ class ClSelectableCrystalButton(ClSelectableTextButton):
 class ClFilterButton(ClSelectableButton):
     """Represents a filter button to be used in Flet apps directly or as an option in ```calet_bar.ClFilterBar```.
     """
+    TOKENS = ()
     def __init__(self, theme:ClTheme, text:str=None, content_size:int=16, content_padding:int=5, width:int=None, height:int=None,
                  radius:int=5, filter_color:str=None, rounded:bool=True, expand:bool|int=False, enabled:bool=True, 
                  selected:bool=False, data=None, action=None):
@@ -932,6 +968,11 @@ class ClFilterButton(ClSelectableButton):
             )
         # INITIALIZATION
         self.filter_color = filter_color
+
+    def filter_states(self):
+        # resting and hovered colors of the selected filter, computed once for each filter color
+        default, hovered = variants(self.filter_color, 0.8, 1.0)
+        return {ft.MaterialState.DEFAULT: default, ft.MaterialState.HOVERED: hovered}
     
     def build(self):
 
@@ -939,16 +980,13 @@ class ClFilterButton(ClSelectableButton):
         
         if self.filter_color is not None:
             if self.selected:
-                self.button.style.bgcolor = {
-                    ft.MaterialState.DEFAULT: ft.colors.with_opacity(0.8, self.filter_color),
-                    ft.MaterialState.HOVERED: self.filter_color,
-                }
+                self.button.style.bgcolor = self.filter_states()
             else:
                 if self.icon is not None or self.selected_icon is not None:
-                    self.button_icon.color = self.filter_color
+                    self.button_icon.color = normalize(self.filter_color)
                 if self.text is not None:
-                    self.button_text.color = self.filter_color
-                self.button.style.side = ft.BorderSide(width=1, color=self.filter_color)
+                    self.button_text.color = normalize(self.filter_color)
+                self.button.style.side = ft.BorderSide(width=1, color=normalize(self.filter_color))
             
         return self.button
 
@@ -957,17 +995,14 @@ class ClFilterButton(ClSelectableButton):
         super().b_clicked(e)
         if self.filter_color is not None:
             if self.selected:
-                self.button.style.bgcolor = {
-                    ft.MaterialState.DEFAULT: ft.colors.with_opacity(0.8, self.filter_color),
-                    ft.MaterialState.HOVERED: self.filter_color,
-                }
+                self.button.style.bgcolor = self.filter_states()
                 self.button.style.side = None
             else:
                 if self.icon is not None or self.selected_icon is not None:
-                    self.button_icon.color = self.filter_color
+                    self.button_icon.color = normalize(self.filter_color)
                 if self.text is not None:
-                    self.button_text.color = self.filter_color
-                self.button.style.side = ft.BorderSide(width=1, color=self.filter_color)
+                    self.button_text.color = normalize(self.filter_color)
+                self.button.style.side = ft.BorderSide(width=1, color=normalize(self.filter_color))
             self.update()
     
     # override
@@ -982,29 +1017,23 @@ class ClFilterButton(ClSelectableButton):
         if self.filter_color is not None:
             if theme is not None or selected is not None:
                 if self.selected:
-                    self.button.style.bgcolor = {
-                        ft.MaterialState.DEFAULT: ft.colors.with_opacity(0.8, self.filter_color),
-                        ft.MaterialState.HOVERED: self.filter_color,
-                    }
+                    self.button.style.bgcolor = self.filter_states()
                 else:
                     if self.icon is not None or self.selected_icon is not None:
-                        self.button_icon.color = self.filter_color
+                        self.button_icon.color = normalize(self.filter_color)
                     if self.text is not None:
-                        self.button_text.color = self.filter_color
-                    self.button.style.side = ft.BorderSide(width=1, color=self.filter_color)
+                        self.button_text.color = normalize(self.filter_color)
+                    self.button.style.side = ft.BorderSide(width=1, color=normalize(self.filter_color))
             if filter_color is not None:
                 self.filter_color = filter_color
                 if self.selected:
-                    self.button.style.bgcolor = {
-                        ft.MaterialState.DEFAULT: ft.colors.with_opacity(0.8, self.filter_color),
-                        ft.MaterialState.HOVERED: self.filter_color,
-                    }
+                    self.button.style.bgcolor = self.filter_states()
                 else:
                     if self.icon is not None or self.selected_icon is not None:
-                        self.button_icon.color = self.filter_color
+                        self.button_icon.color = normalize(self.filter_color)
                     if self.text is not None:
-                        self.button_text.color = self.filter_color
-                    self.button.style.side = ft.BorderSide(width=1, color=self.filter_color)
+                        self.button_text.color = normalize(self.filter_color)
+                    self.button.style.side = ft.BorderSide(width=1, color=normalize(self.filter_color))
             self.update()
 
 # filter crystal button (ok) (ok)
@@ -1013,6 +1042,7 @@ class ClCrystalFilterButton(ClSelectableCrystalButton):
     """ 
     """Represents a filter button to be used in Flet apps directly or as an option in ```calet_bar.ClFilterBar```.
     """
+    TOKENS = ()
     def __init__(self, theme:ClTheme, text:str=None, content_size:int=16, content_padding:int=5, width:int=None, height:int=None,
                  radius:int=5, filter_color:str=None, rounded:bool=True, expand:bool|int=False, enabled:bool=True, 
                  selected:bool=False, data=None, action=None):
@@ -1062,16 +1092,18 @@ class ClCrystalFilterButton(ClSelectableCrystalButton):
         # INITIALIZATION
         self.filter_color = filter_color
 
+    def filter_states(self):
+        # resting and hovered colors of the selected filter, computed once for each filter color
+        default, hovered = variants(self.filter_color, 0.2, 0.2)
+        return {ft.MaterialState.DEFAULT: default, ft.MaterialState.HOVERED: hovered}
+
     def build(self):
 
         super().build()
         
         if self.filter_color is not None:
             if self.selected:
-                self.button.style.bgcolor = {
-                    ft.MaterialState.DEFAULT: ft.colors.with_opacity(0.2, self.filter_color),
-                    ft.MaterialState.HOVERED: ft.colors.with_opacity(0.2, self.filter_color),
-                }
+                self.button.style.bgcolor = self.filter_states()
             
         return self.button
 
@@ -1080,10 +1112,7 @@ class ClCrystalFilterButton(ClSelectableCrystalButton):
         super().b_clicked(e)
         if self.filter_color is not None:
             if self.selected:
-                self.button.style.bgcolor = {
-                    ft.MaterialState.DEFAULT: ft.colors.with_opacity(0.2, self.filter_color),
-                    ft.MaterialState.HOVERED: ft.colors.with_opacity(0.2, self.filter_color),
-                }
+                self.button.style.bgcolor = self.filter_states()
             self.update()
     
     # override
@@ -1098,23 +1127,18 @@ class ClCrystalFilterButton(ClSelectableCrystalButton):
         if self.filter_color is not None:
             if theme is not None or selected is not None:
                 if self.selected:
-                    self.button.style.bgcolor = {
-                        ft.MaterialState.DEFAULT: ft.colors.with_opacity(0.2, self.filter_color),
-                        ft.MaterialState.HOVERED: ft.colors.with_opacity(0.2, self.filter_color),
-                    }
+                    self.button.style.bgcolor = self.filter_states()
             if filter_color is not None:
                 self.filter_color = filter_color
                 if self.selected:
-                    self.button.style.bgcolor = {
-                        ft.MaterialState.DEFAULT: ft.colors.with_opacity(0.2, self.filter_color),
-                        ft.MaterialState.HOVERED: ft.colors.with_opacity(0.2, self.filter_color),
-                    }
+                    self.button.style.bgcolor = self.filter_states()
             self.update()
 
 # removable filter button (ok) (ok)
 class ClRemovableFilter(ClFilterButton):
     """Represents a filter button with a close button attached and solid style to be used in Flet apps.
     """
+    TOKENS = ("font_four", "primary", "transparent", "transparent_05")
     def __init__(self, theme:ClTheme, text:str=None, content_size:int=16, content_padding:int=5, width:int=None, height:int=None,
                  radius:int=5, filter_color:str=None, rounded:bool=True, expand:bool|int=False, enabled:bool=True, selected:bool=False,
                  data=None, action=None, remove_action=None):
@@ -1229,6 +1253,7 @@ class ClRemovableFilter(ClFilterButton):
 class ClRemovableCrystalFilter(ClCrystalFilterButton):
     """Represents a filter button with a close button attached to be used in Flet apps.
     """
+    TOKENS = ("font_three", "font_two", "primary", "transparent", "transparent_05")
     def __init__(self, theme:ClTheme, text:str=None, content_size:int=16, content_padding:int=5, width:int=None, height:int=None,
                  radius:int=5, filter_color:str=None, rounded:bool=True, expand:bool|int=False, enabled:bool=True, selected:bool=False,
                  data=None, action=None, remove_action=None):
@@ -1350,6 +1375,10 @@ class ClRemovableCrystalFilter(ClCrystalFilterButton):
 class ClSwapDestination(ClSelectableTextButton):
     """Represents a button to be used as a destination in a ```calet_bar.ClSwapNavBar```.
     """
+    TOKENS = ("background_one", "error", "font_one", "transparent")
+    # value of the badge, see 'set_badge'
+    badge = None
+
     def build(self):
         
         super().build()
@@ -1363,7 +1392,8 @@ class ClSwapDestination(ClSelectableTextButton):
             ft.MaterialState.DEFAULT: self.theme.transparent,
             ft.MaterialState.HOVERED: self.theme.transparent,
         }
-        return self.button
+        self.badge_control = ClBadgeFlusher.control(self.theme, self.badge, self.button)
+        return self.badge_control
 
     # override
     def b_clicked(self, e:ft.TapEvent):
@@ -1372,6 +1402,15 @@ class ClSwapDestination(ClSelectableTextButton):
         self.update()
         if self.action is not None:
             self.action(e)
+
+    def set_badge(self, value:int|str=None):
+        """Change the badge of the button from any thread, like a counter of unread messages. Zero or None hide it.
+        The change is sent with the next update of the badges of the page, see ```calet_badge.ClBadgeFlusher```.
+        """
+        ClBadgeFlusher.validate(value)
+        self.badge = value
+        if self.page is not None:
+            ClBadgeFlusher.of(self.page).post(self)
     
     # override
     def upd(self, theme:ClTheme=None, enabled:bool=None, selected:bool=None):
@@ -1386,6 +1425,9 @@ class ClSwapDestination(ClSelectableTextButton):
             raise ClError(
                 error="Argument Error: <<selected>> must be boolean"
             )
+        if theme is not None:
+            self.badge_control.bgcolor = self.theme.error
+            self.badge_control.text_color = self.theme.background_one
         if selected is not None:
             self.selected = selected
             self.opacity = 0 if self.selected else 1
@@ -1398,10 +1440,14 @@ class ClSwapDestination(ClSelectableTextButton):
 # nav tab button (ok) (ok)
 class ClNavTab(ft.UserControl):
     """Represents a nav tab button to be used as an option tab in ```calet_bar.ClNavBar```."""
+    TOKENS = ("background_one", "background_two", "error", "font_one", "font_two")
+    # value of the badge, see 'set_badge'
+    badge = None
+
     def __init__(self, theme:ClTheme, text:str=None, icon:str=None, hover_icon:str=None, 
                  selected_icon:str=None, hover_selected_icon:str=None, content_size:int=16, width:int=None, height:int=None,
                  left_icon:bool=True, expand:bool|int=None, enabled:bool=True, selected:bool=False,
-                 data=None, action=None):
+                 data=None, action=None, shortcut:str=None, render_profile:ClRenderProfile=None):
         """Use this properties to personalize the button:\n
         ---
         - theme: is an instance of ```calet_theme.ClTheme``` with the colors set to paint the button.
@@ -1419,6 +1465,8 @@ class ClNavTab(ft.UserControl):
         - selected: is a flag saying when the button is selected or not.
         - data: is a custom and invisible data to be stored in this object for custom uses.
         - action: is the custom function to execute when the button is clicked.
+        - shortcut: is a keyboard shortcut like 'ctrl+s' that clicks the button when is pressed in his page.
+        - render_profile: is the ```calet_render.ClRenderProfile``` used to paint the button. If it isn't given, the profile of his bar or the default one is used.
         """
         # VALIDATION
         if not isinstance(theme, ClTheme):
@@ -1473,6 +1521,12 @@ class ClNavTab(ft.UserControl):
             raise ClError(
                 error="Argument Error: <<selected>> must be boolean"
             )
+        if shortcut is not None:
+            ClShortcutDispatcher.compile(shortcut)
+        if render_profile is not None and not isinstance(render_profile, ClRenderProfile):
+            raise ClError(
+                error="Argument Error: <<render_profile>> must be an instance of 'calet_render.ClRenderProfile' Calet class"
+            )
         # INITIALIZATION
         super().__init__()
         self.theme = theme
@@ -1490,9 +1544,23 @@ class ClNavTab(ft.UserControl):
         self.selected = selected
         self.data = data
         self.action = action
+        self.shortcut = shortcut
+        self.render_profile = render_profile
     
+    def did_mount(self):
+        if self.shortcut is not None and self.page is not None:
+            ClShortcutDispatcher.of(self.page).register(self)
+        ClRenderProfile.mount(self)
+
+    def will_unmount(self):
+        if self.shortcut is not None and self.page is not None:
+            ClShortcutDispatcher.of(self.page).unregister(self)
+
     def build(self):
 
+        if self.render_profile is None:
+            self.render_profile = ClRenderProfile.of(self.page)
+
         # BUTTON CONTENT
         # - button icon
         if self.icon is not None or self.selected_icon is not None:
@@ -1521,7 +1589,7 @@ class ClNavTab(ft.UserControl):
             padding=ft.padding.only(left=10, top=5, right=10, bottom=5),
             border_radius=ft.border_radius.only(top_left=10, top_right=10),
             disabled=not self.enabled,
-            animate=150,
+            animate=self.render_profile.animation(150),
             on_hover=self.b_hovered,
             on_click=self.b_clicked,
             content=ft.Row(
@@ -1538,8 +1606,9 @@ class ClNavTab(ft.UserControl):
                 self.button.content.controls.insert(0, self.button_icon)
             else:
                 self.button.content.controls.append(self.button_icon)
+        self.badge_control = ClBadgeFlusher.control(self.theme, self.badge, self.button)
 
-        return self.button
+        return self.badge_control
 
     def b_hovered(self, e:ft.HoverEvent):
         if not self.selected:
@@ -1565,13 +1634,23 @@ class ClNavTab(ft.UserControl):
             self.update()
             if self.action is not None:
                 self.action(e)
-    
-    def upd(self, theme:ClTheme=None, enabled:bool=None, selected:bool=None):
+
+    def set_badge(self, value:int|str=None):
+        """Change the badge of the button from any thread, like a counter of unread messages. Zero or None hide it.
+        The change is sent with the next update of the badges of the page, see ```calet_badge.ClBadgeFlusher```.
+        """
+        ClBadgeFlusher.validate(value)
+        self.badge = value
+        if self.page is not None:
+            ClBadgeFlusher.of(self.page).post(self)
+
+    def upd(self, theme:ClTheme=None, enabled:bool=None, selected:bool=None, render_profile:ClRenderProfile=None):
         """Update the value of all given properties.\n
         ---
         - theme: an instance of ```calet_theme.ClTheme``` containing the new colors set for the button.
         - enabled: a flag saying the new available status of the button.
         - selected: a flag saying the new selection status of the button.
+        - render_profile: an instance of ```calet_render.ClRenderProfile``` with the new effects for the button.
         """
         if theme is not None and not isinstance(theme, ClTheme):
             raise ClError(
@@ -1585,6 +1664,10 @@ class ClNavTab(ft.UserControl):
             raise ClError(
                 error="Argument Error: <<selected>> must be boolean"
             )
+        if render_profile is not None and not isinstance(render_profile, ClRenderProfile):
+            raise ClError(
+                error="Argument Error: <<render_profile>> must be an instance of 'calet_render.ClRenderProfile' Calet class"
+            )
         if theme is not None:
             self.theme = theme
             if self.icon is not None or self.selected_icon is not None:
@@ -1592,6 +1675,9 @@ class ClNavTab(ft.UserControl):
             if self.text is not None:
                 self.button_text.color = self.theme.font_one if not self.selected else self.theme.font_two
             self.button.bgcolor = self.theme.background_one if not self.selected else self.theme.background_two
+            if self.badge_control is not None:
+                self.badge_control.bgcolor = self.theme.error
+                self.badge_control.text_color = self.theme.background_one
         if enabled is not None:
             self.enabled = enabled
             self.button.disabled = not enabled
@@ -1603,6 +1689,9 @@ class ClNavTab(ft.UserControl):
             if self.text is not None:
                 self.button_text.color = self.theme.font_two if selected else self.theme.font_one
             self.button.bgcolor = self.theme.background_two if selected else self.theme.background_one
+        if render_profile is not None:
+            self.render_profile = render_profile
+            self.button.animate = self.render_profile.animation(150)
         self.update()
 
 # mark tab button (ok) (ok)
@@ -1610,10 +1699,41 @@ class ClMarkTab(ClNavTab):
     """Represents a nav tab button with a selection indicator to be used as an option tab in ```calet_bar.ClNavBar```
     or ```calet_bar.ClLateralNavBar```.
     """
+    TOKENS = ("background_one", "background_two", "font_one", "font_two", "primary", "tonal")
+    # layout of the button and his mark in each side, computed once and shared by all the mark tabs
+    SIDES = {
+        "left": {
+            "begin": ft.alignment.center_left, "end": ft.alignment.center_right, "alignment": ft.alignment.center_left,
+            "content_alignment": ft.MainAxisAlignment.START, "text_align": ft.TextAlign.LEFT,
+            "mark_alignment": ft.alignment.center_left, "mark_padding": ft.padding.only(top=5, bottom=5),
+            "mark_radius": ft.border_radius.only(top_right=5, bottom_right=5), "lateral": True, "leading": True
+        },
+        "right": {
+            "begin": ft.alignment.center_right, "end": ft.alignment.center_left, "alignment": ft.alignment.center_right,
+            "content_alignment": ft.MainAxisAlignment.END, "text_align": ft.TextAlign.RIGHT,
+            "mark_alignment": ft.alignment.center_right, "mark_padding": ft.padding.only(top=5, bottom=5),
+            "mark_radius": ft.border_radius.only(top_left=5, bottom_left=5), "lateral": True, "leading": False
+        },
+        "top": {
+            "begin": ft.alignment.top_center, "end": ft.alignment.bottom_center, "alignment": ft.alignment.center,
+            "content_alignment": ft.MainAxisAlignment.END, "text_align": None,
+            "mark_alignment": ft.alignment.top_center, "mark_padding": ft.padding.only(left=5, right=5),
+            "mark_radius": ft.border_radius.only(bottom_left=5, bottom_right=5), "lateral": False, "leading": True
+        },
+        "bottom": {
+            "begin": ft.alignment.bottom_center, "end": ft.alignment.top_center, "alignment": ft.alignment.center,
+            "content_alignment": ft.MainAxisAlignment.START, "text_align": None,
+            "mark_alignment": ft.alignment.bottom_center, "mark_padding": ft.padding.only(left=5, right=5),
+            "mark_radius": ft.border_radius.only(top_left=5, top_right=5), "lateral": False, "leading": False
+        },
+    }
+    # gradient colors of the button at rest and highlighted, by palette
+    _gradients = weakref.WeakKeyDictionary()
+
     def __init__(self, theme:ClTheme, text:str=None, icon:str=None, hover_icon:str=None, 
                  selected_icon:str=None, hover_selected_icon:str=None, content_size:int=16, width:int=None, height:int=None,
                  mark_side:str="left", expand:bool|int=None, enabled:bool=True, selected:bool=False,
-                 data=None, action=None):
+                 data=None, action=None, shortcut:str=None, render_profile:ClRenderProfile=None):
         """Use this properties to personalize the button:\n
         ---
         - theme: is an instance of ```calet_theme.ClTheme``` with the colors set to paint the button.
@@ -1631,6 +1751,8 @@ class ClMarkTab(ClNavTab):
         - selected: is a flag saying when the button is selected or not.
         - data: is a custom and invisible data to be stored in this object for custom uses.
         - action: is the custom function to execute when the button is clicked.
+        - shortcut: is a keyboard shortcut like 'ctrl+s' that clicks the button when is pressed in his page.
+        - render_profile: is the ```calet_render.ClRenderProfile``` used to paint the button. If it isn't given, the profile of his bar or the default one is used.
         """
         # SUPER INITIALIZATION
         super().__init__(
@@ -1647,7 +1769,9 @@ class ClMarkTab(ClNavTab):
             enabled=enabled,
             selected=selected,
             data=data,
-            action=action
+            action=action,
+            shortcut=shortcut,
+            render_profile=render_profile
         )
         # VALIDATION
         if not isinstance(mark_side, str):
@@ -1660,10 +1784,57 @@ class ClMarkTab(ClNavTab):
             )
         # INITIALIZATION
         self.mark_side = mark_side
+
+    @classmethod
+    def gradients(cls, theme:ClTheme):
+        # rest, leading and trailing gradient colors, shared by all the mark tabs painted with the same palette;
+        # they're tuples, so every gradient receives his own list of colors
+        gradients = cls._gradients.get(theme.palette)
+        if gradients is None:
+            gradients = (
+                (theme.background_one, theme.background_one),
+                (theme.background_two, theme.background_one),
+                (theme.background_one, theme.background_two)
+            )
+            cls._gradients[theme.palette] = gradients
+        return gradients
+
+    def gradient(self, highlighted:bool):
+        rest, leading, trailing = self.gradients(self.theme)
+        if not highlighted:
+            return list(rest)
+        return list(leading if self.SIDES[self.mark_side]["leading"] else trailing)
+
+    def paint_gradient(self):
+        # gradient of the button at rest, or a flat color for the profiles without gradients
+        side = self.SIDES[self.mark_side]
+        if self.render_profile.gradients:
+            self.button.bgcolor = None
+            self.button.gradient = ft.LinearGradient(colors=self.gradient(False), begin=side["begin"], end=side["end"])
+        else:
+            self.button.gradient = None
+            self.button.bgcolor = self.theme.background_one
+
+    def paint(self, highlighted:bool):
+        # profiles without gradients paint the button with a flat color
+        if self.button.gradient is not None:
+            self.button.gradient.colors = self.gradient(highlighted)
+        else:
+            self.button.bgcolor = self.theme.background_two if highlighted else self.theme.background_one
+
+    # override
+    def set_badge(self, value:int|str=None):
+        """Mark tabs have no badge, so setting it raises a ```ClError```.
+        """
+        raise ClError(
+            error="Argument Error: <<badge>> can not be set in a 'calet_button.ClMarkTab', it has no badge"
+        )
     
     def build(self):
 
         super().build()
+        # the button expands next to the mark, so it has no badge
+        self.badge_control = None
 
         # BUTTON CONTENT
         if self.selected:
@@ -1672,80 +1843,41 @@ class ClMarkTab(ClNavTab):
             if self.text is not None:
                 self.button_text.color = self.theme.primary
                 self.button_text.weight = ft.FontWeight.BOLD
-        if self.text is not None and self.mark_side in ("left","right"):
-            self.button_text.text_align = ft.TextAlign.LEFT if self.mark_side == "left" else ft.TextAlign.RIGHT
+        side = self.SIDES[self.mark_side]
+        if self.text is not None and side["text_align"] is not None:
+            self.button_text.text_align = side["text_align"]
 
         # BUTTON
         self.button.expand = True
-        self.button.bgcolor = None
-        self.button.gradient = ft.LinearGradient(
-            colors=[self.theme.background_one, self.theme.background_one],
-            begin={
-                "left": ft.alignment.center_left,
-                "right": ft.alignment.center_right,
-                "top": ft.alignment.top_center,
-                "bottom": ft.alignment.bottom_center
-            }[self.mark_side],
-            end={
-                "left": ft.alignment.center_right,
-                "right": ft.alignment.center_left,
-                "top": ft.alignment.bottom_center,
-                "bottom": ft.alignment.top_center
-            }[self.mark_side]
-        )
-        self.button.alignment = {
-            "left": ft.alignment.center_left,
-            "right": ft.alignment.center_right,
-            "top": ft.alignment.center,
-            "bottom": ft.alignment.center
-        }[self.mark_side]
+        self.paint_gradient()
+        self.button.alignment = side["alignment"]
         self.button.border_radius = None
-        self.button.content.alignment = ft.MainAxisAlignment.START if self.mark_side in ("left", "bottom") else ft.MainAxisAlignment.END
+        self.button.content.alignment = side["content_alignment"]
 
         # MARK
         self.mark = ft.Container(
             bgcolor=self.theme.background_two,
-            width=0 if self.mark_side in ("left","right") else None,
-            height=0 if self.mark_side in ("top","bottom") else None,
-            padding=ft.padding.only(top=5, bottom=5) if self.mark_side in ("left","right") else ft.padding.only(left=5, right=5),
-            alignment={
-                "left": ft.alignment.center_left,
-                "right": ft.alignment.center_right,
-                "top": ft.alignment.top_center,
-                "bottom": ft.alignment.bottom_center
-            }[self.mark_side],
+            width=0 if side["lateral"] else None,
+            height=None if side["lateral"] else 0,
+            padding=side["mark_padding"],
+            alignment=side["mark_alignment"],
             content=ft.Container(
                 bgcolor=self.theme.tonal,
                 # bgcolor=self.theme.primary,
-                border_radius={
-                    "left": ft.border_radius.only(top_right=5, bottom_right=5),
-                    "right": ft.border_radius.only(top_left=5, bottom_left=5),
-                    "top": ft.border_radius.only(bottom_left=5, bottom_right=5),
-                    "bottom": ft.border_radius.only(top_left=5, top_right=5),
-                }[self.mark_side]
+                border_radius=side["mark_radius"]
             ),
-            animate=ft.Animation(500, ft.AnimationCurve.ELASTIC_OUT)
+            animate=self.render_profile.animation(500, ft.AnimationCurve.ELASTIC_OUT)
         )
 
-        if self.mark_side in ("left","right"):
-            return ft.Row(
-                spacing=0,
-                alignment=ft.MainAxisAlignment.CENTER,
-                controls=[self.mark, self.button] if self.mark_side == "left" else [self.button, self.mark]
-            )
+        controls = [self.mark, self.button] if side["leading"] else [self.button, self.mark]
+        if side["lateral"]:
+            return ft.Row(spacing=0, alignment=ft.MainAxisAlignment.CENTER, controls=controls)
         else:
-            return ft.Column(
-                spacing=0,
-                alignment=ft.MainAxisAlignment.CENTER,
-                controls=[self.mark, self.button] if self.mark_side == "top" else [self.button, self.mark]
-            )
+            return ft.Column(spacing=0, alignment=ft.MainAxisAlignment.CENTER, controls=controls)
 
     def b_hovered(self, e:ft.HoverEvent):
         if not self.selected:
-            if self.mark_side in ("left","top"):
-                self.button.gradient.colors = [self.theme.background_two, self.theme.background_one] if e.data == "true" else [self.theme.background_one, self.theme.background_one]
-            else:
-                self.button.gradient.colors = [self.theme.background_one, self.theme.background_two] if e.data == "true" else [self.theme.background_one, self.theme.background_one]
+            self.paint(e.data == "true")
             super().b_hovered(e)
     
     def b_clicked(self, e:ft.TapEvent):
@@ -1756,8 +1888,8 @@ class ClMarkTab(ClNavTab):
         if self.text is not None:
             self.button_text.color = self.theme.tonal if self.selected else self.theme.font_two
             self.button_text.weight = ft.FontWeight.BOLD if self.selected else None
-        self.button.gradient.colors = [self.theme.background_two, self.theme.background_one] if self.mark_side in ("left","top") else [self.theme.background_one, self.theme.background_two]
-        if self.mark_side in ("left","right"):
+        self.paint(True)
+        if self.SIDES[self.mark_side]["lateral"]:
             self.mark.width = 3 if self.selected else 0
         else:
             self.mark.height = 3 if self.selected else 0
@@ -1765,12 +1897,13 @@ class ClMarkTab(ClNavTab):
         if self.action is not None:
             self.action(e)
 
-    def upd(self, theme:ClTheme=None, enabled:bool=None, selected:bool=None):
+    def upd(self, theme:ClTheme=None, enabled:bool=None, selected:bool=None, render_profile:ClRenderProfile=None):
         """Update the value of all given properties.\n
         ---
         - theme: an instance of ```calet_theme.ClTheme``` containing the new colors set for the button.
         - enabled: a flag saying the new available status of the button.
         - selected: a flag saying the new selection status of the button.
+        - render_profile: an instance of ```calet_render.ClRenderProfile``` with the new effects for the button.
         """
         if theme is not None and not isinstance(theme, ClTheme):
             raise ClError(
@@ -1784,16 +1917,17 @@ class ClMarkTab(ClNavTab):
             raise ClError(
                 error="Argument Error: <<selected>> must be boolean"
             )
+        if render_profile is not None and not isinstance(render_profile, ClRenderProfile):
+            raise ClError(
+                error="Argument Error: <<render_profile>> must be an instance of 'calet_render.ClRenderProfile' Calet class"
+            )
         if theme is not None:
             self.theme = theme
             if self.icon is not None or self.selected_icon is not None:
                 self.button_icon.color = self.theme.tonal if self.selected else self.theme.font_one
             if self.text is not None:
                 self.button_text.color = self.theme.tonal if self.selected else self.theme.font_one
-            if self.mark_side in ("left","top"):
-                self.button.gradient.colors = [self.theme.background_two, self.theme.background_one] if self.selected else [self.theme.background_one, self.theme.background_one]
-            else:
-                self.button.gradient.colors = [self.theme.background_one, self.theme.background_two] if self.selected else [self.theme.background_one, self.theme.background_one]
+            self.paint(self.selected)
             self.mark.bgcolor = self.theme.background_two
             self.mark.content.bgcolor = self.theme.tonal
         if enabled is not None:
@@ -1807,23 +1941,27 @@ class ClMarkTab(ClNavTab):
             if self.text is not None:
                 self.button_text.color = self.theme.tonal if self.selected else self.theme.font_one
                 self.button_text.weight = ft.FontWeight.BOLD if self.selected else None
-            if self.mark_side in ("left","top"):
-                self.button.gradient.colors = [self.theme.background_two, self.theme.background_one] if self.selected else [self.theme.background_one, self.theme.background_one]
-            else:
-                self.button.gradient.colors = [self.theme.background_one, self.theme.background_two] if self.selected else [self.theme.background_one, self.theme.background_one]
-            if self.mark_side in ("left","right"):
+            self.paint(self.selected)
+            if self.SIDES[self.mark_side]["lateral"]:
                 self.mark.width = 3 if self.selected else 0
             else:
                 self.mark.height = 3 if self.selected else 0
+        if render_profile is not None:
+            self.render_profile = render_profile
+            self.button.animate = self.render_profile.animation(150)
+            self.mark.animate = self.render_profile.animation(500, ft.AnimationCurve.ELASTIC_OUT)
+            self.paint_gradient()
+            self.paint(self.selected)
         self.update()
 
 # icon button (ok) (ok)
 class ClIconButton(ft.UserControl):
     """Represents an icon button to be used in Flet apps.
     """
+    TOKENS = ("font_one", "font_two", "transparent", "transparent_05", "transparent_1")
     def __init__(self, theme:ClTheme, icon:str=None, selected_icon:str=None, content_size:int=16, width:int=None,
                  height:int=None, expand:bool|int=None, rounded:bool=True, enabled:bool=True, selected:bool=False,
-                 data=None, action=None):
+                 data=None, action=None, shortcut:str=None):
         """Use this properties to personalize the button:\n
         ---
         - theme: is an instance of ```calet_theme.ClTheme``` with the colors set to paint the button.
@@ -1838,6 +1976,7 @@ class ClIconButton(ft.UserControl):
         - selected: is a flag saying when the button is selected or not.
         - data: is a custom and invisible data to be stored in this object for custom uses.
         - action: is the custom function to execute when the button is clicked.
+        - shortcut: is a keyboard shortcut like 'ctrl+s' that clicks the button when is pressed in his page.
         """
         # VALIDATION BLOCK
         if not isinstance(theme, ClTheme):
@@ -1880,6 +2019,8 @@ class ClIconButton(ft.UserControl):
             raise ClError(
                 error="Argument Error: <<selected>> must be boolean"
             )
+        if shortcut is not None:
+            ClShortcutDispatcher.compile(shortcut)
 
         # INITIALIZATION BLOCK
         super().__init__()
@@ -1895,7 +2036,16 @@ class ClIconButton(ft.UserControl):
         self.selected = selected
         self.data = data
         self.action = action
+        self.shortcut = shortcut
     
+    def did_mount(self):
+        if self.shortcut is not None and self.page is not None:
+            ClShortcutDispatcher.of(self.page).register(self)
+
+    def will_unmount(self):
+        if self.shortcut is not None and self.page is not None:
+            ClShortcutDispatcher.of(self.page).unregister(self)
+
     def build(self):
         
         # BUTTON
@@ -1990,9 +2140,14 @@ class ClIconButton(ft.UserControl):
 class ClNavButton(ft.UserControl):
     """Represents a navigation button to be used in Flet apps.
     """
+    TOKENS = ("background_one", "error", "font_one", "font_two", "primary", "primary_block", "transparent", "transparent_05")
+    # value of the badge, see 'set_badge'
+    badge = None
+
     def __init__(self, theme:ClTheme, label:str, icon:str, selected_icon:str=None, content_size:int=16, 
                  width:int=None, height:int=None, expand:bool|int=None, rounded:bool=True, 
-                 enabled:bool=True, selected:bool=False, all_as_button:bool=False, data=None, action=None):
+                 enabled:bool=True, selected:bool=False, all_as_button:bool=False, data=None, action=None,
+                 render_profile:ClRenderProfile=None):
         """Use this properties to personalize the button:\n
         ---
         - theme: is an instance of ```calet_theme.ClTheme``` with the colors set to paint the button.
@@ -2009,6 +2164,7 @@ class ClNavButton(ft.UserControl):
         - all_as_button: is a flag saying if both elements, label and icon, must be displayed together as an entire button. If is True, ```rounded``` property will be ignored.
         - data: is a custom and invisible data to be stored in this object for custom uses.
         - action: is the custom function to execute when the button is clicked.
+        - render_profile: is the ```calet_render.ClRenderProfile``` used to paint the button. If it isn't given, the profile of his bar or the default one is used.
         """
         # VALIDATION BLOCK
         if not isinstance(theme, ClTheme):
@@ -2059,6 +2215,10 @@ class ClNavButton(ft.UserControl):
             raise ClError(
                 error="Argument Error: <<all_as_button>> must be boolean"
             )
+        if render_profile is not None and not isinstance(render_profile, ClRenderProfile):
+            raise ClError(
+                error="Argument Error: <<render_profile>> must be an instance of 'calet_render.ClRenderProfile' Calet class"
+            )
         # INITIALIZATION BLOCK
         super().__init__()
         self.theme = theme
@@ -2075,9 +2235,16 @@ class ClNavButton(ft.UserControl):
         self.all_as_button = all_as_button
         self.data = data
         self.action = action
+        self.render_profile = render_profile
+
+    def did_mount(self):
+        ClRenderProfile.mount(self)
 
     def build(self):
 
+        if self.render_profile is None:
+            self.render_profile = ClRenderProfile.of(self.page)
+
         # BUTTON CONTENT
         # - button icon
         self.button_icon = ft.Container(
@@ -2085,7 +2252,7 @@ class ClNavButton(ft.UserControl):
             alignment=ft.alignment.center,
             padding=ft.padding.only(left=10, top=2, right=10, bottom=2) if self.selected else ft.padding.only(left=5, top=2, right=5, bottom=2),
             border_radius=5 if self.rounded else 50,
-            animate=ft.Animation(500, ft.AnimationCurve.ELASTIC_OUT),
+            animate=self.render_profile.animation(500, ft.AnimationCurve.ELASTIC_OUT),
             content=ft.Icon(
                 name=self.icon if not self.selected else self.selected_icon,
                 color=self.theme.font_one if not self.selected else self.theme.primary,
@@ -2105,6 +2272,8 @@ class ClNavButton(ft.UserControl):
         )
         if self.selected:
             self.button_label.content.color = self.theme.primary if self.all_as_button else self.theme.font_two
+        # - button badge over the icon
+        self.badge_control = ClBadgeFlusher.control(self.theme, self.badge, self.button_icon)
 
         # BUTTON
         self.button = ft.Container(
@@ -2115,15 +2284,15 @@ class ClNavButton(ft.UserControl):
             alignment=ft.alignment.center,
             padding=5,
             border_radius=5,
-            animate=100,
-            animate_scale=ft.Animation(500, ft.AnimationCurve.ELASTIC_OUT) if self.selected else ft.Animation(200, ft.AnimationCurve.EASE_OUT),
+            animate=self.render_profile.animation(100),
+            animate_scale=self.render_profile.animation(500, ft.AnimationCurve.ELASTIC_OUT) if self.selected else self.render_profile.animation(200, ft.AnimationCurve.EASE_OUT),
             content=ft.Column(
                 spacing=5,
                 alignment=ft.MainAxisAlignment.CENTER,
                 controls=[
                     ft.Row(
                         alignment=ft.MainAxisAlignment.CENTER,
-                        controls=[self.button_icon]
+                        controls=[self.badge_control]
                     ),
                     ft.Row(
                         alignment=ft.MainAxisAlignment.CENTER,
@@ -2155,7 +2324,7 @@ class ClNavButton(ft.UserControl):
             self.button.bgcolor = self.theme.transparent_05 if not self.selected else self.theme.primary_block
             self.button_label.content.color = self.theme.font_two if not self.selected else self.theme.primary
             self.button.scale = 1 if not self.selected else 1.1
-            self.button.animate_scale = ft.Animation(500, ft.AnimationCurve.ELASTIC_OUT) if self.selected else ft.Animation(200, ft.AnimationCurve.EASE_OUT)
+            self.button.animate_scale = self.render_profile.animation(500, ft.AnimationCurve.ELASTIC_OUT) if self.selected else self.render_profile.animation(200, ft.AnimationCurve.EASE_OUT)
         else:
             self.button_icon.bgcolor = self.theme.transparent_05 if not self.selected else self.theme.primary_block
             self.button_icon.padding = ft.padding.only(left=10, top=2, right=10, bottom=2) if self.selected else ft.padding.only(left=5, top=2, right=5, bottom=2)
@@ -2165,14 +2334,28 @@ class ClNavButton(ft.UserControl):
         self.update()
         if self.action is not None:
             self.action(e)
-    
-    def upd(self, theme: ClTheme = None, enabled: bool = None, selected=None):
+
+    def set_badge(self, value:int|str=None):
+        """Change the badge of the button from any thread, like a counter of unread messages. Zero or None hide it.
+        The change is sent with the next update of the badges of the page, see ```calet_badge.ClBadgeFlusher```.
+        """
+        ClBadgeFlusher.validate(value)
+        self.badge = value
+        if self.page is not None:
+            ClBadgeFlusher.of(self.page).post(self)
+
+    def upd(self, theme: ClTheme = None, enabled: bool = None, selected=None, render_profile:ClRenderProfile=None):
         """Update the value of all given properties.\n
         ---
         - theme: an instance of ```calet_theme.ClTheme``` containing the new colors set for the button.
         - enabled: a flag saying the new available status of the button.
         - selected: a flag saying the new selection status of the button.
+        - render_profile: an instance of ```calet_render.ClRenderProfile``` with the new effects for the button.
         """
+        if render_profile is not None and not isinstance(render_profile, ClRenderProfile):
+            raise ClError(
+                error="Argument Error: <<render_profile>> must be an instance of 'calet_render.ClRenderProfile' Calet class"
+            )
         if theme is not None:
             self.theme = theme
             self.button_icon.content.color = self.theme.primary if self.selected else self.theme.font_one
@@ -2182,6 +2365,8 @@ class ClNavButton(ft.UserControl):
             else:
                 self.button_icon.bgcolor = self.theme.primary_block if self.selected else self.theme.transparent
                 self.button_label.content.color = self.theme.font_two if self.selected else self.theme.font_one
+            self.badge_control.bgcolor = self.theme.error
+            self.badge_control.text_color = self.theme.background_one
         if enabled is not None:
             self.enabled = enabled
             if self.all_as_button:
@@ -2195,21 +2380,27 @@ class ClNavButton(ft.UserControl):
             self.button_label.content.weight = ft.FontWeight.NORMAL if not self.selected else ft.FontWeight.BOLD
             if self.all_as_button:
                 self.button.scale = 1.1 if self.selected else 1
-                self.button.animate_scale = ft.Animation(500, ft.AnimationCurve.ELASTIC_OUT) if self.selected else ft.Animation(200, ft.AnimationCurve.EASE_OUT)
+                self.button.animate_scale = self.render_profile.animation(500, ft.AnimationCurve.ELASTIC_OUT) if self.selected else self.render_profile.animation(200, ft.AnimationCurve.EASE_OUT)
                 self.button.bgcolor = self.theme.primary_block if self.selected else self.theme.transparent
                 self.button_label.content.color = self.theme.primary if self.selected else self.theme.font_two
             else:
                 self.button_icon.padding = ft.padding.only(left=10, top=2, right=10, bottom=2) if self.selected else ft.padding.only(left=5, top=2, right=5, bottom=2)
                 self.button_icon.bgcolor = self.theme.primary_block if self.selected else self.theme.transparent
                 self.button_label.content.color = self.theme.font_two if self.selected else self.theme.font_one
+        if render_profile is not None:
+            self.render_profile = render_profile
+            self.button_icon.animate = self.render_profile.animation(500, ft.AnimationCurve.ELASTIC_OUT)
+            self.button.animate = self.render_profile.animation(100)
+            self.button.animate_scale = self.render_profile.animation(500, ft.AnimationCurve.ELASTIC_OUT) if self.selected else self.render_profile.animation(200, ft.AnimationCurve.EASE_OUT)
         self.update()
 
 # window button (ok) (ok)
 class ClWinButton(ft.UserControl):
     """Represents a window action button to be used in Flet apps.
     """
+    TOKENS = ("cancel", "font_one", "font_two", "transparent", "transparent_05")
     def __init__(self, theme:ClTheme, winaction="close", content_size:int=16, width:int=None, height:int=None,
-                 expand:bool|int=None, data=None, action=None):
+                 expand:bool|int=None, data=None, action=None, shortcut:str=None):
         """Use this properties to personalize the button:\n
         ---
         - theme: is an instance of ```calet_theme.ClTheme``` with the colors set to paint the button.
@@ -2220,6 +2411,7 @@ class ClWinButton(ft.UserControl):
         - expand: is the responsive expansion of the button in his container. See ```expand``` Flet property for more information.
         - data: is a custom and invisible data to be stored in this object for custom uses.
         - action: is the custom function to execute when the button is clicked. If it's None, the executed action will depends on the ```winaction``` by default.
+        - shortcut: is a keyboard shortcut like 'ctrl+s' that clicks the button when is pressed in his page.
         """
         # VALIDATION BLOCK
         if not isinstance(theme, ClTheme):
@@ -2246,6 +2438,8 @@ class ClWinButton(ft.UserControl):
             raise ClError(
                 error="Argument Error: <<expand>> must be integer or boolean"
             )
+        if shortcut is not None:
+            ClShortcutDispatcher.compile(shortcut)
         # INITIALIZATION BLOCK
         super().__init__()
         self.theme = theme
@@ -2260,6 +2454,19 @@ class ClWinButton(ft.UserControl):
         self.expand = expand
         self.data = data
         self.action = action
+        self.shortcut = shortcut
+
+    def did_mount(self):
+        if self.shortcut is not None and self.page is not None:
+            ClShortcutDispatcher.of(self.page).register(self)
+        if self.winaction in ("maximize", "unmaximize") and self.page is not None and ClWindowController.of(self.page).register(self):
+            self.update()
+
+    def will_unmount(self):
+        if self.shortcut is not None and self.page is not None:
+            ClShortcutDispatcher.of(self.page).unregister(self)
+        if self.winaction in ("maximize", "unmaximize") and self.page is not None:
+            ClWindowController.of(self.page).unregister(self)
 
     def build(self):
 
@@ -2299,23 +2506,10 @@ class ClWinButton(ft.UserControl):
         if self.action is not None:
             self.action(e)
         else:
-            if self.winaction == "close":
-                self.page.window_destroy()
-            elif self.winaction == "minimize":
-                self.page.window_minimized = True
-                self.page.update()
-            elif self.winaction == "maximize":
-                self.page.window_maximized = True
-                self.button.icon = ft.icons.SQUARE
-                self.winaction = "unmaximize"
-                self.update()
-                self.page.update()
-            elif self.winaction == "unmaximize":
-                self.page.window_maximized = False
-                self.button.icon = ft.icons.SQUARE_OUTLINED
-                self.winaction = "maximize"
-                self.update()
-                self.page.update()
+            # the window controller of the page sends the operation and the icons of all the maximize buttons
+            ClWindowController.of(self.page).request(
+                self.winaction if self.winaction in ("close", "minimize") else "toggle"
+            )
 
     def upd(self, theme:ClTheme=None):
         """Update the value of all given properties.\n
@@ -2346,6 +2540,7 @@ class ClWinButton(ft.UserControl):
 class ClColorButton(ClIconButton):
     """Represents a color selection button to be used in Flet apps.
     """
+    TOKENS = ()
     def __init__(self, theme:ClTheme, color:str="blue", content_size:int=30, width:int=None, height:int=None, 
                  expand:bool|int=None, rounded:bool=True, enabled:bool=True, selected:bool=False, data=None, action=None):
         """Use this properties to personalize the button:\n
@@ -2394,9 +2589,10 @@ class ClColorButton(ClIconButton):
 class ClOptionButton(ft.UserControl):
     """Represents a menu option button to be used in Flet apps.
     """
+    TOKENS = ("background_one", "background_two", "divider", "font_one", "font_two", "transparent", "transparent_05")
     def __init__(self, theme:ClTheme, sub_options:list=None, text:str=None, icon:str=None, 
                  hover_icon:str=None, content_size:int=16, width:int=None, height:int=None, expand:bool|int=None, 
-                 enabled:bool=True, data=None, action=None):
+                 enabled:bool=True, data=None, action=None, shortcut:str=None):
         """Use this properties to personalize the button:\n
         ---
         - theme: is an instance of ```calet_theme.ClTheme``` with the colors set to paint the button.
@@ -2411,6 +2607,7 @@ class ClOptionButton(ft.UserControl):
         - enabled: is a flag saying when the button is enabled or not.
         - data: is a custom and invisible data to be stored in this object for custom uses.
         - action: is the custom function to execute when the button is clicked.
+        - shortcut: is a keyboard shortcut like 'ctrl+s' that clicks the button when is pressed in his page.
         """
         # VALIDATION BLOCK
         if not isinstance(theme, ClTheme):
@@ -2460,6 +2657,8 @@ class ClOptionButton(ft.UserControl):
                         raise ClError(
                             error=f"Argument Error: <<sub_options[{i}]>> must be a 'calet_button.ClOptionButton' object"
                         )
+        if shortcut is not None:
+            ClShortcutDispatcher.compile(shortcut)
         # INITIALIZATION BLOCK
         super().__init__()
         self.theme = theme
@@ -2473,7 +2672,16 @@ class ClOptionButton(ft.UserControl):
         self.enabled = enabled
         self.data = data
         self.action = action
+        self.shortcut = shortcut
     
+    def did_mount(self):
+        if self.shortcut is not None and self.page is not None:
+            ClShortcutDispatcher.of(self.page).register(self)
+
+    def will_unmount(self):
+        if self.shortcut is not None and self.page is not None:
+            ClShortcutDispatcher.of(self.page).unregister(self)
+
     def build(self):
 
         # BUTTON CONTENT
@@ -2615,6 +2823,7 @@ class ClMenuButton(ft.UserControl):
     """Represents a menu button that display a context menu when is clicked
     to be used in Flet apps.
     """
+    TOKENS = ("background_one", "background_two", "divider", "font_one", "font_two", "transparent", "transparent_05")
     def __init__(self, theme:ClTheme, options:list[ClOptionButton], main_button:ClTextButton=None, main_to_left:bool=True, 
                  text:str=None, icon:str=None, hover_icon:str=None, icon_to_left:bool=True, content_size:int=16,
                  width:int=None, height:int=None, expand:bool|int=None, rounded:bool=True, enabled:bool=True, data=None):
@@ -2861,6 +3070,7 @@ class ClMenuButton(ft.UserControl):
 class ClSwitch(ft.UserControl):
     """Represents a switch button to be used in Flet apps.
     """
+    TOKENS = ("font_one", "font_three", "primary", "primary_block", "secondary", "secondary_block")
     def __init__(self, theme:ClTheme, inactive_label:str=None, active_label:str=None, left_label:bool=True,
                  inactive_icon:str=None, active_icon:str=None, inversed_colors:bool=False,
                  expand:bool=None, active:bool=False, enabled:bool=True, data=None, 
@@ -3043,6 +3253,7 @@ class ClSwitch(ft.UserControl):
 class ClRadio(ft.UserControl):
     """Represents a radio button to be used in Flet apps.
     """
+    TOKENS = ("font_one", "font_three", "primary")
     def __init__(self, theme:ClTheme, value:str, label:str=None, left_label:bool=True,
                  inversed_colors:bool=False, expand:bool=None, enabled:bool=True, data=None):
         """Use this properties to personalize the radio button:\n
@@ -3151,10 +3362,183 @@ class ClRadio(ft.UserControl):
             self.radio.disabled = not enabled
         self.update()
 
+# radio group
+class ClRadioGroup(ft.UserControl):
+    """Represents a group of ```ClRadio``` buttons with one single selected value, to be used in Flet apps.\n
+    The radios are indexed by value, so selecting a value, finding his radio or reading the current value
+    never scans the group, and bulk changes of theme or availability are sent in one single update.
+    """
+    TOKENS = ()
+    # default of the 'upd' value, so None can clear the selection
+    UNSET = object()
+    # flet radio group, created when the group is built
+    group = None
+
+    def __init__(self, theme:ClTheme, radios:list[ClRadio], value:str=None, horizontal:bool=False, spacing:int=5,
+                 expand:bool|int=None, enabled:bool=True, data=None, action=None):
+        """Use this properties to personalize the radio group:\n
+        ---
+        - theme: is an instance of ```calet_theme.ClTheme``` with the colors set to paint the radios.
+        - radios: is a list of ```ClRadio``` objects with different values.
+        - value: is the value of the selected radio. If it's None, no radio is selected.
+        - horizontal: is a flag saying if the radios must be placed in a row (True) or in a column (False).
+        - spacing: is the space between two radios.
+        - expand: is the responsive expansion of the group in his container. See ```expand``` Flet property for more information.
+        - enabled: is a flag saying when the radios are enabled or not.
+        - data: is a custom and invisible data to be stored in this object for custom uses.
+        - action: is the custom function to execute when the selected radio changes.
+        """
+        # VALIDATION BLOCK
+        if not isinstance(theme, ClTheme):
+            raise ClError(
+                error="Argument Error: <<theme>> must be an instance of 'calet_theme.ClTheme' Calet class"
+            )
+        if not isinstance(radios, list):
+            raise ClError(
+                error="Argument Error: <<radios>> must be a list"
+            )
+        radios_map = {}
+        for i in range(len(radios)):
+            if not isinstance(radios[i], ClRadio):
+                raise ClError(
+                    error=f"Argument Error: <<radios[{i}]>> must be an instance of 'calet_button.ClRadio' Calet class"
+                )
+            if radios[i].value in radios_map:
+                raise ClError(
+                    error=f"Argument Error: <<radios[{i}]>> has the value '{radios[i].value}' of another radio"
+                )
+            radios_map[radios[i].value] = radios[i]
+        if value is not None and value not in radios_map:
+            raise ClError(
+                error="Argument Error: <<value>> must be the value of one of the radios"
+            )
+        if not isinstance(horizontal, bool):
+            raise ClError(
+                error="Argument Error: <<horizontal>> must be boolean"
+            )
+        if not isinstance(spacing, int):
+            raise ClError(
+                error="Argument Error: <<spacing>> must be integer"
+            )
+        if expand is not None and not isinstance(expand, (bool,int)):
+            raise ClError(
+                error="Argument Error: <<expand>> must be integer or boolean"
+            )
+        if not isinstance(enabled, bool):
+            raise ClError(
+                error="Argument Error: <<enabled>> must be boolean"
+            )
+        # INITIALIZATION BLOCK
+        super().__init__()
+        self.theme = theme
+        self.radios = radios
+        self.radios_map = radios_map
+        self.value = value
+        self.horizontal = horizontal
+        self.spacing = spacing
+        self.expand = expand
+        self.enabled = enabled
+        self.data = data
+        self.action = action
+        if not enabled:
+            for radio in radios:
+                radio.enabled = False
+
+    def build(self):
+
+        # GROUP
+        self.group = ft.RadioGroup(
+            data=self,
+            value=self.value,
+            on_change=self.changed,
+            content=ft.Row(
+                spacing=self.spacing,
+                wrap=True,
+                controls=self.radios
+            ) if self.horizontal else ft.Column(
+                spacing=self.spacing,
+                controls=self.radios
+            )
+        )
+
+        return self.group
+
+    def changed(self, e:ft.ControlEvent):
+        self.value = e.control.value if e.control.value else None
+        if self.action is not None:
+            self.action(e)
+
+    def radio(self, value:str):
+        """Return the radio of the given value, or None if there isn't one.
+        """
+        return self.radios_map.get(value)
+
+    def selected(self):
+        """Return the selected radio, or None if no radio is selected.
+        """
+        return self.radios_map.get(self.value)
+
+    def select(self, value:str=None):
+        """Select the radio of the given value, or clear the selection if it's None.
+        Only the group is sent to the page, the radios don't change.
+        """
+        if value is not None and value not in self.radios_map:
+            raise ClError(
+                error="Argument Error: <<value>> must be the value of one of the radios"
+            )
+        self.value = value
+        # before the group is mounted, the value is only kept for his build
+        if self.group is not None:
+            self.group.value = value
+        if self.page is not None:
+            self.group.update()
+
+    def upd(self, theme:ClTheme=None, enabled:bool=None, value:str=UNSET):
+        """Update the value of all given properties, for all the radios of the group in one single update.\n
+        ---
+        - theme: an instance of ```calet_theme.ClTheme``` containing the new colors set for the radios.
+        - enabled: a flag saying the new available status of the radios.
+        - value: the value of the radio to select, or None to clear the selection.
+        """
+        if theme is not None and not isinstance(theme, ClTheme):
+            raise ClError(
+                error="Argument Error: <<theme>> must be an instance of 'calet_theme.ClTheme' Calet class"
+            )
+        if enabled is not None and not isinstance(enabled, bool):
+            raise ClError(
+                error="Argument Error: <<enabled>> must be boolean"
+            )
+        if value is not self.UNSET and value is not None and value not in self.radios_map:
+            raise ClError(
+                error="Argument Error: <<value>> must be the value of one of the radios"
+            )
+        if theme is not None:
+            self.theme = theme
+        if enabled is not None:
+            self.enabled = enabled
+        if value is not self.UNSET:
+            self.value = value
+            if self.group is not None:
+                self.group.value = value
+        if self.page is None:
+            # before the group is mounted, the radios are only given the new state for their build
+            for radio in self.radios:
+                if theme is not None:
+                    radio.theme = theme
+                if enabled is not None:
+                    radio.enabled = enabled
+            return
+        with ClBatch(self.page):
+            if theme is not None or enabled is not None:
+                for radio in self.radios:
+                    radio.upd(theme=theme, enabled=enabled)
+            self.update()
+
 # check button (ok) (ok)
 class ClCheck(ft.UserControl):
     """Represents a check button to be used in Flet apps.
     """
+    TOKENS = ("font_one", "font_three", "primary")
     def __init__(self, theme:ClTheme, value:bool=False, label:str=None, left_label:bool=True,
                  expand:bool=None, three_states:bool=False, inversed_colors:bool=False, enabled:bool=True, data=None,
                  activated_action=None, deactivated_action=None, limbo_action=None):
@@ -3260,13 +3644,15 @@ class ClCheck(ft.UserControl):
     
     def b_changed(self, e:ft.ControlEvent):
         self.value = self.check.value
-        if self.value and self.activated_action is not None:
-            self.activated_action(e)
-        elif not self.value and self.deactivated_action is not None:
-            self.deactivated_action(e)
-        elif self.limbo_action is not None:
-            self.limbo_action(e)
-        self.update()
+        # the check and the changes made by the actions, like the header of a ```calet_list.ClCheckList```, are sent in one single update
+        with ClBatch(self.page):
+            if self.value and self.activated_action is not None:
+                self.activated_action(e)
+            elif not self.value and self.deactivated_action is not None:
+                self.deactivated_action(e)
+            elif self.limbo_action is not None:
+                self.limbo_action(e)
+            self.update()
     
     def upd(self, theme:ClTheme=None, enabled:bool=None, value:str=None):
         """Update the value of all given properties of the check.\n
@@ -3287,7 +3673,7 @@ class ClCheck(ft.UserControl):
             raise ClError(
                 error="Argument Error: <<value>> must be string"
             )
-        elif value not in ("true","false","none"):
+        elif value is not None and value not in ("true","false","none"):
             raise ClError(
                 error="Argument Error: <<value>> must be 'true', 'false' or 'none'"
             )
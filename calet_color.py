@@ -0,0 +1,322 @@
+"""Calet: a visual components library based on Flet framework
+   - Colors module"""
+
+from functools import lru_cache
+from calet_errors import ClError
+from calet_theme import ClLightTheme, ClDarkTheme, ClTheme
+
+# NumPy is optional, and it's imported only when the first palettes are generated, so the
+# components that only normalize colors don't pay his import time
+numpy = None
+numpy_checked = False
+
+def vector_math():
+    global numpy, numpy_checked
+    if not numpy_checked:
+        numpy_checked = True
+        try:
+            import numpy
+        except ImportError:
+            # the palettes are generated with pure Python color math
+            numpy = None
+    return numpy
+
+# Material colors by Flet name, with the shades 50, 100, 200, ..., 900
+MATERIAL = {
+    "red": "FFEBEE FFCDD2 EF9A9A E57373 EF5350 F44336 E53935 D32F2F C62828 B71C1C",
+    "pink": "FCE4EC F8BBD0 F48FB1 F06292 EC407A E91E63 D81B60 C2185B AD1457 880E4F",
+    "purple": "F3E5F5 E1BEE7 CE93D8 BA68C8 AB47BC 9C27B0 8E24AA 7B1FA2 6A1B9A 4A148C",
+    "deeppurple": "EDE7F6 D1C4E9 B39DDB 9575CD 7E57C2 673AB7 5E35B1 512DA8 4527A0 311B92",
+    "indigo": "E8EAF6 C5CAE9 9FA8DA 7986CB 5C6BC0 3F51B5 3949AB 303F9F 283593 1A237E",
+    "blue": "E3F2FD BBDEFB 90CAF9 64B5F6 42A5F5 2196F3 1E88E5 1976D2 1565C0 0D47A1",
+    "lightblue": "E1F5FE B3E5FC 81D4FA 4FC3F7 29B6F6 03A9F4 039BE5 0288D1 0277BD 01579B",
+    "cyan": "E0F7FA B2EBF2 80DEEA 4DD0E1 26C6DA 00BCD4 00ACC1 0097A7 00838F 006064",
+    "teal": "E0F2F1 B2DFDB 80CBC4 4DB6AC 26A69A 009688 00897B 00796B 00695C 004D40",
+    "green": "E8F5E9 C8E6C9 A5D6A7 81C784 66BB6A 4CAF50 43A047 388E3C 2E7D32 1B5E20",
+    "lightgreen": "F1F8E9 DCEDC8 C5E1A5 AED581 9CCC65 8BC34A 7CB342 689F38 558B2F 33691E",
+    "lime": "F9FBE7 F0F4C3 E6EE9C DCE775 D4E157 CDDC39 C0CA33 AFB42B 9E9D24 827717",
+    "yellow": "FFFDE7 FFF9C4 FFF59D FFF176 FFEE58 FFEB3B FDD835 FBC02D F9A825 F57F17",
+    "amber": "FFF8E1 FFECB3 FFE082 FFD54F FFCA28 FFC107 FFB300 FFA000 FF8F00 FF6F00",
+    "orange": "FFF3E0 FFE0B2 FFCC80 FFB74D FFA726 FF9800 FB8C00 F57C00 EF6C00 E65100",
+    "deeporange": "FBE9E7 FFCCBC FFAB91 FF8A65 FF7043 FF5722 F4511E E64A19 D84315 BF360C",
+    "brown": "EFEBE9 D7CCC8 BCAAA4 A1887F 8D6E63 795548 6D4C41 5D4037 4E342E 3E2723",
+    "grey": "FAFAFA F5F5F5 EEEEEE E0E0E0 BDBDBD 9E9E9E 757575 616161 424242 212121",
+    "bluegrey": "ECEFF1 CFD8DC B0BEC5 90A4AE 78909C 607D8B 546E7A 455A64 37474F 263238",
+}
+# Material accent colors by Flet name, with the shades 100, 200, 400 and 700
+MATERIAL_ACCENTS = {
+    "red": "FF8A80 FF5252 FF1744 D50000",
+    "pink": "FF80AB FF4081 F50057 C51162",
+    "purple": "EA80FC E040FB D500F9 AA00FF",
+    "deeppurple": "B388FF 7C4DFF 651FFF 6200EA",
+    "indigo": "8C9EFF 536DFE 3D5AFE 304FFE",
+    "blue": "82B1FF 448AFF 2979FF 2962FF",
+    "lightblue": "80D8FF 40C4FF 00B0FF 0091EA",
+    "cyan": "84FFFF 18FFFF 00E5FF 00B8D4",
+    "teal": "A7FFEB 64FFDA 1DE9B6 00BFA5",
+    "green": "B9F6CA 69F0AE 00E676 00C853",
+    "lightgreen": "CCFF90 B2FF59 76FF03 64DD17",
+    "lime": "F4FF81 EEFF41 C6FF00 AEEA00",
+    "yellow": "FFFF8D FFFF00 FFEA00 FFD600",
+    "amber": "FFE57F FFD740 FFC400 FFAB00",
+    "orange": "FFD180 FFAB40 FF9100 FF6D00",
+    "deeporange": "FF9E80 FF6E40 FF3D00 DD2C00",
+}
+# named colors that aren't Material palettes, as (red, green, blue, alpha)
+NAMED = {
+    "white": (1.0, 1.0, 1.0, 1.0),
+    "black": (0.0, 0.0, 0.0, 1.0),
+    "transparent": (0.0, 0.0, 0.0, 0.0),
+}
+NAMED.update({f"white{alpha}": (1.0, 1.0, 1.0, alpha / 100) for alpha in (10, 12, 24, 30, 38, 54, 60, 70)})
+NAMED.update({f"black{alpha}": (0.0, 0.0, 0.0, alpha / 100) for alpha in (12, 26, 38, 45, 54, 87)})
+for name, shades in MATERIAL.items():
+    for shade, code in zip((50, 100, 200, 300, 400, 500, 600, 700, 800, 900), shades.split()):
+        NAMED[f"{name}{shade}"] = tuple(int(code[i:i+2], 16) / 255 for i in (0, 2, 4)) + (1.0,)
+    NAMED[name] = NAMED[f"{name}500"]
+for name, shades in MATERIAL_ACCENTS.items():
+    for shade, code in zip((100, 200, 400, 700), shades.split()):
+        NAMED[f"{name}accent{shade}"] = tuple(int(code[i:i+2], 16) / 255 for i in (0, 2, 4)) + (1.0,)
+    NAMED[f"{name}accent"] = NAMED[f"{name}accent200"]
+del name, shades, shade, code
+
+@lru_cache(maxsize=1024)
+def to_rgba(color:str):
+    """Return a color as a tuple ```(red, green, blue, alpha)``` of floats from 0 to 1.\n
+    The color can be a hex code like '#RGB', '#RRGGBB' or '#AARRGGBB', a Flet color name like 'blue300'
+    or 'bluegrey', or a color with opacity like 'blue,0.2'.
+    """
+    if not isinstance(color, str):
+        raise ClError(
+            error="Argument Error: <<color>> must be string"
+        )
+    code = color.strip().lower()
+    if "," in code:
+        # color with opacity, as written by Flet
+        base, opacity = code.rsplit(",", 1)
+        red, green, blue, alpha = to_rgba(base)
+        try:
+            return (red, green, blue, alpha * float(opacity))
+        except ValueError:
+            raise ClError(
+                error=f"Argument Error: '{color}' has an invalid opacity"
+            )
+    if code in NAMED:
+        return NAMED[code]
+    # like in Flet, hex codes need the '#', so names like 'bad' or 'faded' are not read as hex
+    digits = code[1:] if code.startswith("#") else ""
+    if len(digits) == 3:
+        digits = "".join(digit * 2 for digit in digits)
+    if len(digits) == 6:
+        digits = "ff" + digits
+    try:
+        if len(digits) != 8:
+            raise ValueError
+        alpha, red, green, blue = (int(digits[i:i+2], 16) / 255 for i in (0, 2, 4, 6))
+    except ValueError:
+        raise ClError(
+            error=f"Argument Error: '{color}' is not a valid color. Must be a hex code or a Flet color name"
+        )
+    return (red, green, blue, alpha)
+
+def to_hex(red:float, green:float, blue:float, alpha:float=1.0):
+    """Return the hex code of a color given as floats from 0 to 1, like '#RRGGBB' or '#AARRGGBB' if it's transparent.
+    """
+    channels = [min(255, max(0, round(channel * 255))) for channel in (alpha, red, green, blue)]
+    if channels[0] == 255:
+        return "#{:02X}{:02X}{:02X}".format(*channels[1:])
+    return "#{:02X}{:02X}{:02X}{:02X}".format(*channels)
+
+@lru_cache(maxsize=1024)
+def normalize(color:str):
+    """Return the canonical form of a color, the hex code given by ```to_hex```, so the same color written
+    in different ways, like 'blue', 'BLUE500' or '#2196f3', is sent to Flet as one single string.\n
+    Colors that Calet can't parse, like the Flet theme colors 'primary' or 'surfacevariant', are kept as given.
+    """
+    try:
+        return to_hex(*to_rgba(color))
+    except ClError:
+        if not isinstance(color, str):
+            raise
+        return color.strip().lower()
+
+@lru_cache(maxsize=1024)
+def with_opacity(opacity:float, color:str):
+    """Return the canonical form of a color with his alpha multiplied by the given opacity.
+    """
+    if not isinstance(opacity, (int, float)) or not 0 <= opacity <= 1:
+        raise ClError(
+            error="Argument Error: <<opacity>> must be a number between 0 and 1"
+        )
+    try:
+        red, green, blue, alpha = to_rgba(color)
+    except ClError:
+        if not isinstance(color, str):
+            raise
+        # resolved by Flet
+        return f"{normalize(color)},{opacity}"
+    return to_hex(red, green, blue, alpha * opacity)
+
+@lru_cache(maxsize=1024)
+def variants(color:str, *opacities:float):
+    """Return a tuple with the canonical form of a color in each given opacity, like the colors of
+    the default and hovered states of a component, computed only once for each color.
+    """
+    return tuple(with_opacity(opacity, color) for opacity in opacities)
+
+# palette generator from seed colors
+class ClSeedPalette:
+    """Represents a pair of light and dark palettes generated from one or more seed colors.\n
+    Every color token is a mix of the seeds, white, black and the grey tone of the primary seed.
+    All tokens are computed together as one matrix product, with NumPy if it's installed,
+    and the generated palettes are cached for each set of seeds.
+    """
+    # sources mixed to get the tokens
+    SOURCES = ("primary", "secondary", "success", "error", "warning", "neutral", "white", "black")
+    # recipe of each token in each mode: mixed sources with their weights, and the alpha of the result
+    RECIPES = {
+        "light": {
+            "transparent": ({"black": 1}, 0.0),
+            "transparent_05": ({"black": 1}, 0.05),
+            "transparent_1": ({"black": 1}, 0.1),
+            "transparent_3": ({"black": 1}, 0.3),
+            "transparent_5": ({"black": 1}, 0.5),
+            "transparent_8": ({"black": 1}, 0.8),
+            "transparent_inverse": ({"white": 1}, 0.8),
+            "background_one": ({"primary": 0.75, "black": 0.25}, 1.0),
+            "background_two": ({"primary": 0.3, "white": 0.7}, 1.0),
+            "divider": ({"neutral": 0.1, "white": 0.9}, 1.0),
+            "font_one": ({"neutral": 0.3, "black": 0.6, "white": 0.1}, 1.0),
+            "font_two": ({"neutral": 0.1, "black": 0.85, "white": 0.05}, 1.0),
+            "font_three": ({"black": 1}, 1.0),
+            "font_four": ({"white": 1}, 1.0),
+        },
+        "dark": {
+            "transparent": ({"black": 1}, 0.0),
+            "transparent_05": ({"white": 1}, 0.05),
+            "transparent_1": ({"white": 1}, 0.1),
+            "transparent_3": ({"white": 1}, 0.3),
+            "transparent_5": ({"white": 1}, 0.5),
+            "transparent_8": ({"white": 1}, 0.8),
+            "transparent_inverse": ({"black": 1}, 0.8),
+            "background_one": ({"primary": 0.05, "neutral": 0.1, "white": 0.15, "black": 0.7}, 1.0),
+            "background_two": ({"primary": 0.05, "neutral": 0.1, "white": 0.2, "black": 0.65}, 1.0),
+            "divider": ({"neutral": 0.3, "white": 0.25, "black": 0.45}, 1.0),
+            "font_one": ({"neutral": 0.3, "white": 0.55, "black": 0.15}, 1.0),
+            "font_two": ({"neutral": 0.1, "white": 0.87, "black": 0.03}, 1.0),
+            "font_three": ({"white": 1}, 1.0),
+            "font_four": ({"black": 1}, 1.0),
+        },
+    }
+    # tokens with the same recipe in both modes: the seeds, their blocks and their hovered variants
+    for mode in RECIPES:
+        for seed, tokens in (("primary", ("primary", "tonal")), ("secondary", ("secondary",)),
+                             ("success", ("success", "accept")), ("error", ("error", "cancel")), ("warning", ("warning",))):
+            RECIPES[mode][tokens[0]] = ({seed: 1}, 1.0)
+            RECIPES[mode][f"{seed}_block"] = ({seed: 1}, 0.2)
+            for token in tokens[1:]:
+                RECIPES[mode][token] = ({seed: 1}, 1.0)
+                RECIPES[mode][f"{token}_block"] = ({seed: 1}, 0.2)
+        for seed, token in (("primary", "primary_hovered"), ("success", "accept_hovered"), ("error", "cancel_hovered")):
+            RECIPES[mode][token] = ({seed: 0.7, "white": 0.3}, 1.0)
+    del mode, seed, tokens, token
+    # default seeds, the same colors of the default palettes
+    DEFAULTS = {"secondary": None, "success": "green", "error": "red", "warning": "yellow"}
+    # generated palettes for each set of seeds
+    _cache = {}
+
+    def __init__(self, primary:str, secondary:str=None, success:str=None, error:str=None, warning:str=None):
+        """Use this properties to personalize the palettes:\n
+        ---
+        - primary: is the main seed color, used for the primary tokens and to tint backgrounds, fonts and dividers.
+        - secondary: is the seed of the secondary tokens. If it isn't given, the grey tone of the primary seed is used.
+        - success: is the seed of the success and accept tokens.
+        - error: is the seed of the error and cancel tokens.
+        - warning: is the seed of the warning tokens.
+        """
+        # VALIDATION BLOCK
+        seeds = self.normalize(primary, secondary, success, error, warning)
+        # INITIALIZATION BLOCK
+        self.seeds = seeds
+        if seeds not in self._cache:
+            self.generate([seeds])
+        self.light, self.dark = self._cache[seeds]
+
+    @classmethod
+    def normalize(cls, primary:str, secondary:str=None, success:str=None, error:str=None, warning:str=None):
+        # the seeds as a tuple of hex codes, so equal colors written in different ways share the cache
+        seeds = []
+        for name, seed in zip(cls.SOURCES, (primary, secondary, success, error, warning)):
+            seed = cls.DEFAULTS.get(name) if seed is None else seed
+            if seed is None:
+                seeds.append(None)
+                continue
+            if not isinstance(seed, str):
+                raise ClError(
+                    error=f"Argument Error: <<{name}>> must be string"
+                )
+            seeds.append(to_hex(*to_rgba(seed)[:3]))
+        return tuple(seeds)
+
+    @classmethod
+    def sources(cls, seeds:tuple):
+        # rgb of every source: the seeds, the grey tone of the primary seed, white and black
+        primary = to_rgba(seeds[0])[:3]
+        luma = 0.2126 * primary[0] + 0.7152 * primary[1] + 0.0722 * primary[2]
+        neutral = (luma, luma, luma)
+        rgb = [to_rgba(seed)[:3] if seed is not None else neutral for seed in seeds]
+        return rgb + [neutral, (1.0, 1.0, 1.0), (0.0, 0.0, 0.0)]
+
+    @classmethod
+    def weights(cls, mode:str):
+        # the recipes of a mode as a matrix, with one row for each token and one column for each source
+        return [
+            [cls.RECIPES[mode][token][0].get(source, 0) for source in cls.SOURCES]
+            for token in ClLightTheme.TOKENS
+        ]
+
+    @classmethod
+    def generate(cls, seeds_list:list):
+        """Generate and cache the palettes of every tuple of normalized seeds in the given list, all in one batch.
+        """
+        seeds_list = [seeds for seeds in dict.fromkeys(seeds_list) if seeds not in cls._cache]
+        if not seeds_list:
+            return
+        sources = [cls.sources(seeds) for seeds in seeds_list]
+        colors = {}
+        for mode in ("light", "dark"):
+            weights = cls.weights(mode)
+            if vector_math() is not None:
+                # (tokens x sources) @ (palettes x sources x rgb) -> (palettes x tokens x rgb)
+                colors[mode] = (numpy.array(weights) @ numpy.array(sources)).tolist()
+            else:
+                colors[mode] = [
+                    [[sum(weight * rgb[channel] for weight, rgb in zip(row, palette_sources)) for channel in range(3)]
+                     for row in weights]
+                    for palette_sources in sources
+                ]
+        for index, seeds in enumerate(seeds_list):
+            palettes = []
+            for mode, palette_class in (("light", ClLightTheme), ("dark", ClDarkTheme)):
+                palettes.append(palette_class(**{
+                    token: to_hex(*rgb, cls.RECIPES[mode][token][1])
+                    for token, rgb in zip(ClLightTheme.TOKENS, colors[mode][index])
+                }))
+            cls._cache[seeds] = tuple(palettes)
+
+    @classmethod
+    def batch(cls, seeds:list[dict]):
+        """Return a list of ```ClSeedPalette``` objects, one for each dict of seeds in the given list.
+        All the palettes not cached yet are generated together in one batch.
+        """
+        if not isinstance(seeds, list):
+            raise ClError(
+                error="Argument Error: <<seeds>> must be a list of dicts"
+            )
+        cls.generate([cls.normalize(**palette_seeds) for palette_seeds in seeds])
+        return [cls(**palette_seeds) for palette_seeds in seeds]
+
+    def theme(self, mode:str="light"):
+        """Return a new ```calet_theme.ClTheme``` with the generated palettes, in the given mode.
+        """
+        return ClTheme(on_light=self.light, on_dark=self.dark, mode=mode)
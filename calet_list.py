@@ -0,0 +1,554 @@
+"""Calet: a visual components library based on Flet framework
+   - Lists module"""
+
+import itertools
+import threading
+from collections.abc import Sequence
+import flet as ft
+from calet_errors import ClError
+from calet_theme import ClTheme
+from calet_button import ClCheck
+from calet_batch import ClBatch
+from calet_template import ClTemplate
+from calet_source import ClPagedSource
+from calet_loop import ClLoop
+
+# check list
+class ClCheckList(ft.UserControl):
+    """Represents a list of ```calet_button.ClCheck``` buttons with a master check to select or clear all of them.\n
+    The checked items and their count are kept on every change of a check, so the three states of the master
+    check and the selected count are always known without reading the checks, and selecting or clearing all
+    the checks is sent to the page in one single update.
+    """
+    # color tokens of the theme painted by this class, so 'calet_watch' only repaints it when they change
+    TOKENS = ("divider", "font_three", "font_two", "primary")
+    def __init__(self, theme:ClTheme, checks:list[ClCheck], master_label:str="Select all", count_text:str="{count} selected",
+                 spacing:int=5, height:int=None, expand:bool|int=None, data=None, action=None):
+        """Use this properties to personalize the check list:\n
+        ---
+        - theme: is an instance of ```calet_theme.ClTheme``` with the colors set to paint the list.
+        - checks: is a list of ```calet_button.ClCheck``` objects with two states.
+        - master_label: is the text to display near the master check.
+        - count_text: is the text with the number of checked items, where '{count}' and '{total}' are replaced. If it's None, the count isn't displayed.
+        - spacing: is the space between two checks.
+        - height: is a custom height for the list, that scrolls the checks when they don't fit in.
+        - expand: is the responsive expansion of the list in his container. See ```expand``` Flet property for more information.
+        - data: is a custom and invisible data to be stored in this object for custom uses.
+        - action: is the custom function to execute when the checked items change. It receives the check list.
+        """
+        # VALIDATION BLOCK
+        if not isinstance(theme, ClTheme):
+            raise ClError(
+                error="Argument Error: <<theme>> must be an instance of 'calet_theme.ClTheme' Calet class"
+            )
+        if not isinstance(checks, list):
+            raise ClError(
+                error="Argument Error: <<checks>> must be a list"
+            )
+        checks_map = {}
+        checked = set()
+        for i in range(len(checks)):
+            if not isinstance(checks[i], ClCheck) or checks[i].three_states:
+                raise ClError(
+                    error=f"Argument Error: <<checks[{i}]>> must be an instance of 'calet_button.ClCheck' Calet class with two states"
+                )
+            # index of the check and his custom actions, that are called after the list updates his counts
+            checks_map[checks[i]] = i, checks[i].activated_action, checks[i].deactivated_action
+            if checks[i].value:
+                checked.add(i)
+        if not isinstance(master_label, str):
+            raise ClError(
+                error="Argument Error: <<master_label>> must be string"
+            )
+        if count_text is not None and not isinstance(count_text, str):
+            raise ClError(
+                error="Argument Error: <<count_text>> must be string"
+            )
+        if not isinstance(spacing, int):
+            raise ClError(
+                error="Argument Error: <<spacing>> must be integer"
+            )
+        if height is not None and not isinstance(height, int):
+            raise ClError(
+                error="Argument Error: <<height>> must be integer"
+            )
+        if expand is not None and not isinstance(expand, (bool,int)):
+            raise ClError(
+                error="Argument Error: <<expand>> must be integer or boolean"
+            )
+        # INITIALIZATION BLOCK
+        super().__init__()
+        self.theme = theme
+        self.checks = checks
+        self.checks_map = checks_map
+        self.checked = checked
+        self.master_label = master_label
+        self.count_text = count_text
+        self.spacing = spacing
+        self.height = height
+        self.expand = expand
+        self.data = data
+        self.action = action
+        for check in checks:
+            check.activated_action = self.check_changed
+            check.deactivated_action = self.check_changed
+
+    @property
+    def count(self):
+        return len(self.checked)
+
+    @property
+    def state(self):
+        """Three states value of the master check: True if all the items are checked, False if none is checked, else None.
+        """
+        if not self.checked:
+            return False
+        return True if len(self.checked) == len(self.checks) else None
+
+    def build(self):
+
+        # HEADER
+        self.master = ft.Checkbox(
+            data=self,
+            label=self.master_label,
+            tristate=True,
+            value=self.state,
+            active_color=self.theme.primary,
+            check_color=self.theme.font_three,
+            on_change=self.master_changed
+        )
+        self.count_label = ft.Text(
+            value=self.count_text.format(count=self.count, total=len(self.checks)) if self.count_text is not None else None,
+            color=self.theme.font_two,
+            visible=self.count_text is not None
+        )
+        self.header = ft.Row(
+            spacing=10,
+            alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
+            controls=[self.master, self.count_label]
+        )
+
+        # LIST
+        return ft.Column(
+            spacing=self.spacing,
+            controls=[
+                self.header,
+                ft.Divider(height=1, color=self.theme.divider),
+                ft.Column(
+                    expand=True if self.height is None and self.expand else None,
+                    height=self.height,
+                    spacing=self.spacing,
+                    scroll=ft.ScrollMode.AUTO if self.height is not None or self.expand else None,
+                    controls=self.checks
+                )
+            ]
+        )
+
+    def paint_header(self):
+        # the master check and the count follow the counters, no check is read
+        self.master.value = self.state
+        if self.count_text is not None:
+            self.count_label.value = self.count_text.format(count=self.count, total=len(self.checks))
+
+    def check_changed(self, e:ft.ControlEvent):
+        check = e.control.data
+        index, activated_action, deactivated_action = self.checks_map[check]
+        if check.value:
+            self.checked.add(index)
+        else:
+            self.checked.discard(index)
+        self.paint_header()
+        self.header.update()
+        if check.value and activated_action is not None:
+            activated_action(e)
+        elif not check.value and deactivated_action is not None:
+            deactivated_action(e)
+        if self.action is not None:
+            self.action(self)
+
+    def master_changed(self, e:ft.ControlEvent):
+        # the master check only selects all the items, or clears them when all are already selected
+        if self.state is True:
+            self.clear()
+        else:
+            self.select_all()
+
+    def set_values(self, indexes, value:bool):
+        """Check or uncheck the items of the given indexes, sending all the changes in one single update.
+        """
+        if not isinstance(value, bool):
+            raise ClError(
+                error="Argument Error: <<value>> must be boolean"
+            )
+        with ClBatch(self.page):
+            for index in indexes:
+                if (index in self.checked) != value:
+                    check = self.checks[index]
+                    check.value = value
+                    check.check.value = value
+                    check.update()
+                    if value:
+                        self.checked.add(index)
+                    else:
+                        self.checked.discard(index)
+            self.paint_header()
+            self.header.update()
+        if self.action is not None:
+            self.action(self)
+
+    def select_all(self):
+        """Check all the items with one single update.
+        """
+        self.set_values(range(len(self.checks)), True)
+
+    def clear(self):
+        """Uncheck all the items with one single update.
+        """
+        self.set_values(list(self.checked), False)
+
+    def is_checked(self, index:int):
+        return index in self.checked
+
+    def get_checked(self):
+        """Return the sorted indexes of the checked items.
+        """
+        return sorted(self.checked)
+
+    def upd(self, theme:ClTheme=None, enabled:bool=None):
+        """Update the value of all given properties, for the master check and all the items in one single update.\n
+        ---
+        - theme: an instance of ```calet_theme.ClTheme``` containing the new colors set for the list.
+        - enabled: a flag saying the new available status of the checks.
+        """
+        if theme is not None and not isinstance(theme, ClTheme):
+            raise ClError(
+                error="Argument Error: <<theme>> must be an instance of 'calet_theme.ClTheme' Calet class"
+            )
+        if enabled is not None and not isinstance(enabled, bool):
+            raise ClError(
+                error="Argument Error: <<enabled>> must be boolean"
+            )
+        with ClBatch(self.page):
+            if theme is not None:
+                self.theme = theme
+                self.master.active_color = self.theme.primary
+                self.master.check_color = self.theme.font_three
+                self.count_label.color = self.theme.font_two
+            if enabled is not None:
+                self.master.disabled = not enabled
+            if theme is not None or enabled is not None:
+                for check in self.checks:
+                    check.upd(theme=theme, enabled=enabled)
+            self.update()
+
+# virtual list
+class ClVirtualList(ft.UserControl):
+    """Represents a scrollable list of Calet components that only renders the rows around the viewport.\n
+    Rows are stamped from a ```calet_template.ClTemplate``` and recycled: when the list scrolls, the rows that
+    leave the viewport are moved and bound to the items that enter it, so only the entering rows are sent to the page.
+    Items are read from a list, pulled in chunks from an iterator or an async iterator while the list scrolls,
+    or fetched by pages around the viewport from a ```calet_source.ClPagedSource```.
+    """
+    TOKENS = ()
+
+    def __init__(self, theme:ClTheme, template:ClTemplate, source, row=None, row_height:int=40, height:int=400,
+                 overscan:int=5, chunk:int=100, expand:bool|int=None, data=None):
+        """Use this properties to personalize the virtual list:\n
+        ---
+        - theme: is an instance of ```calet_theme.ClTheme``` with the colors set to paint the rows.
+        - template: is an instance of ```calet_template.ClTemplate``` of the rows component, like ```ClTemplate(ClCheck, theme=theme)```.
+        - source: is a list of items, an iterator or async iterator that yields them, or a ```calet_source.ClPagedSource```. Rows of the items not fetched yet are displayed with the template properties.
+        - row: is a function that receives an item and returns the template overrides of his row, like ```lambda item: {"label": item.name}```. It must return the same overrides for all the items. If it isn't given, the items must be dicts of overrides. When 'data' isn't overridden, the item is the data of his row.
+        - row_height: is the fixed height of each row.
+        - height: is the height of the list. If it's None, the list must be expanded in his container.
+        - overscan: is the number of rows rendered out of the viewport at each side.
+        - chunk: is the number of items pulled from an iterator at once.
+        - expand: is the responsive expansion of the list in his container. See ```expand``` Flet property for more information.
+        - data: is a custom and invisible data to be stored in this object for custom uses.
+        """
+        # VALIDATION BLOCK
+        if not isinstance(theme, ClTheme):
+            raise ClError(
+                error="Argument Error: <<theme>> must be an instance of 'calet_theme.ClTheme' Calet class"
+            )
+        if not isinstance(template, ClTemplate):
+            raise ClError(
+                error="Argument Error: <<template>> must be an instance of 'calet_template.ClTemplate' Calet class"
+            )
+        if not isinstance(source, ClPagedSource) and not hasattr(source, "__aiter__") and not hasattr(source, "__iter__"):
+            raise ClError(
+                error="Argument Error: <<source>> must be a list, an iterator, an async iterator or a 'calet_source.ClPagedSource'"
+            )
+        if row is not None and not callable(row):
+            raise ClError(
+                error="Argument Error: <<row>> must be callable"
+            )
+        for name, value in (("row_height", row_height), ("overscan", overscan), ("chunk", chunk)):
+            if not isinstance(value, int) or value < (0 if name == "overscan" else 1):
+                raise ClError(
+                    error=f"Argument Error: <<{name}>> must be a positive integer"
+                )
+        if height is not None and not isinstance(height, int):
+            raise ClError(
+                error="Argument Error: <<height>> must be integer"
+            )
+        if height is None and not expand:
+            raise ClError(
+                error="Argument Error: <<height>> must be given when the list isn't expanded"
+            )
+        if expand is not None and not isinstance(expand, (bool,int)):
+            raise ClError(
+                error="Argument Error: <<expand>> must be integer or boolean"
+            )
+        # INITIALIZATION BLOCK
+        super().__init__()
+        self.theme = theme
+        self.template = template
+        self.row = row
+        self.row_height = row_height
+        self.height = height
+        self.overscan = overscan
+        self.chunk = chunk
+        self.expand = expand
+        self.data = data
+        # - loaded items, and the iterator or async iterator of the items not loaded yet
+        self.iterator = None
+        self.stream = None
+        self.paged = None
+        if isinstance(source, ClPagedSource):
+            self.items = []
+            self.paged = source
+            # rows waiting for their page are filled when it arrives
+            self.paged.subscribe(self.page_loaded)
+        elif isinstance(source, list):
+            self.items = source
+        elif isinstance(source, Sequence):
+            self.items = list(source)
+        elif hasattr(source, "__aiter__"):
+            self.items = []
+            self.stream = source.__aiter__()
+        else:
+            self.items = []
+            self.iterator = iter(source)
+        self.exhausted = self.iterator is None and self.stream is None
+        self.loading = False
+        self.error = None
+        # - rendered rows by item index, and released rows to be bound again
+        self.rows = {}
+        self.free = []
+        self.waiting = set()
+        self.keys = ()
+        self.window = (0, 0)
+        self.offset = 0
+        self.viewport = height if height is not None else 600
+        self.lock = threading.RLock()
+
+    def build(self):
+        # rows are placed by their offset in a stack as high as all the items, and they belong to it,
+        # so a new build starts with new rows
+        self.rows = {}
+        self.free = []
+        self.window = (0, 0)
+        self.stack = ft.Stack(height=0, controls=[])
+        self.render()
+        return ft.Column(
+            height=self.height,
+            expand=self.expand,
+            spacing=0,
+            scroll=ft.ScrollMode.AUTO,
+            on_scroll=self.scrolled,
+            on_scroll_interval=20,
+            controls=[self.stack]
+        )
+
+    def did_mount(self):
+        if self.stream is not None:
+            # the chunk pulled while the list was built could arrive before his page was set
+            self.refresh()
+        if self.waiting:
+            self.fill()
+
+    def size(self):
+        return self.paged.extent() if self.paged is not None else len(self.items)
+
+    def overrides(self, index:int):
+        item = self.paged.get(index) if self.paged is not None else self.items[index]
+        if item is None:
+            # placeholder row with the template properties, until his page is fetched
+            self.waiting.add(index)
+            overrides = {name: getattr(self.template.prototype, name, None) for name in self.keys}
+            overrides["data"] = None
+            return overrides
+        self.waiting.discard(index)
+        overrides = dict(self.row(item) if self.row is not None else item)
+        overrides.setdefault("data", item)
+        self.keys = tuple(overrides)
+        return overrides
+
+    def bind(self, slot:ft.Container, index:int):
+        # a recycled row stays in his place of the stack and only moves, and his component is built again
+        # in place with the new item; returns the component if it must be updated
+        overrides = self.overrides(index)
+        slot.top = index * self.row_height
+        slot.visible = True
+        slot.data = index
+        if slot.content is None:
+            slot.content = self.template.stamp(**overrides)
+            return None
+        ClTemplate.validate(self.template.component, overrides)
+        for name, value in overrides.items():
+            setattr(slot.content, name, value)
+        if not slot.content.controls:
+            # not built yet, it's built with the new item when it's sent
+            return None
+        slot.content._build()
+        return slot.content
+
+    def render(self):
+        """Bind the rows of the current window and return the recycled components built again, or None if the window didn't change.
+        """
+        with self.lock:
+            count = -(-self.viewport // self.row_height) + 2 * self.overscan
+            if not self.exhausted and self.offset // self.row_height + count + self.chunk // 2 > len(self.items):
+                self.load()
+            total = self.size()
+            first = max(0, min(self.offset // self.row_height - self.overscan, total - count))
+            last = min(total, first + count)
+            if (first, last) == self.window and self.stack.height == total * self.row_height:
+                return None
+            leaving = [slot for index, slot in self.rows.items() if not first <= index < last]
+            rows = {}
+            rebuilt = []
+            for index in range(first, last):
+                slot = self.rows.get(index)
+                if slot is None:
+                    if leaving:
+                        slot = leaving.pop()
+                    elif self.free:
+                        slot = self.free.pop()
+                    else:
+                        slot = ft.Container(left=0, right=0, height=self.row_height)
+                        self.stack.controls.append(slot)
+                    component = self.bind(slot, index)
+                    if component is not None:
+                        rebuilt.append(component)
+                rows[index] = slot
+            # rows out of the window are hidden and kept in the stack, so they're never removed and added again
+            for slot in leaving:
+                slot.visible = False
+            self.free.extend(leaving)
+            self.waiting.intersection_update(rows)
+            self.rows = rows
+            self.window = (first, last)
+            self.stack.height = total * self.row_height
+        if self.paged is not None:
+            self.paged.request(first, last)
+        return rebuilt
+
+    def refresh(self):
+        if self.page is None:
+            # rendered when the list is built
+            return
+        rebuilt = self.render()
+        if rebuilt is not None:
+            with ClBatch(self.page):
+                for component in rebuilt:
+                    component.update()
+                self.update()
+
+    def scrolled(self, e:ft.OnScrollEvent):
+        self.offset = int(e.pixels)
+        if e.viewport_dimension:
+            self.viewport = int(e.viewport_dimension)
+        self.refresh()
+
+    def load(self):
+        """Pull the next chunk of items from the source, in the background for async sources.
+        """
+        if self.exhausted or self.loading:
+            return
+        if self.stream is None:
+            items = list(itertools.islice(self.iterator, self.chunk))
+            self.exhausted = len(items) < self.chunk
+            self.items.extend(items)
+            return
+        self.loading = True
+        future = ClLoop.submit(self.pull())
+        future.add_done_callback(self.pulled)
+
+    async def pull(self):
+        items = []
+        try:
+            while len(items) < self.chunk:
+                items.append(await self.stream.__anext__())
+        except StopAsyncIteration:
+            self.exhausted = True
+        return items
+
+    def pulled(self, future):
+        try:
+            items = future.result()
+        except Exception as e:
+            # the source failed, the loaded items are kept
+            self.error = e
+            self.exhausted = True
+            items = []
+        with self.lock:
+            self.items.extend(items)
+            self.loading = False
+        self.refresh()
+
+    def page_loaded(self, page:int, items:list):
+        if self.page is not None:
+            self.fill()
+
+    def fill(self):
+        # rows bound to placeholders are bound again to their fetched items and built again in one single update
+        with self.lock:
+            filled = [
+                self.rows[index] for index in sorted(self.waiting)
+                if index in self.rows and self.paged.get(index) is not None
+            ]
+            rebuilt = [component for component in (self.bind(slot, slot.data) for slot in filled) if component is not None]
+        # the extent grows while the pages are fetched
+        more = self.render()
+        with ClBatch(self.page):
+            for component in rebuilt + (more or []):
+                component.update()
+            if more is not None:
+                self.update()
+
+    def extend(self, items:list):
+        """Add the given items at the end of the list, rendering them if they're in the viewport.
+        """
+        with self.lock:
+            self.items.extend(items)
+        self.refresh()
+
+    def scroll_to(self, index:int, duration:int=0):
+        """Scroll the list to the row of the given item index.
+        """
+        if not isinstance(index, int):
+            raise ClError(
+                error="Argument Error: <<index>> must be integer"
+            )
+        self.controls[0].scroll_to(offset=index * self.row_height, duration=duration)
+
+    def upd(self, theme:ClTheme=None):
+        """Update the value of all given properties, for the rendered rows in one single update.\n
+        ---
+        - theme: an instance of ```calet_theme.ClTheme``` containing the new colors set for the list.
+        """
+        if theme is not None and not isinstance(theme, ClTheme):
+            raise ClError(
+                error="Argument Error: <<theme>> must be an instance of 'calet_theme.ClTheme' Calet class"
+            )
+        if theme is not None:
+            self.theme = theme
+            self.template.prototype.theme = theme
+            # released rows are built again with the new theme when they're bound
+            for slot in self.free:
+                slot.content.theme = theme
+            with ClBatch(self.page):
+                for slot in self.rows.values():
+                    slot.content.upd(theme=theme)
@@ -0,0 +1,29 @@
+"""Calet: a visual components library based on Flet framework
+   - Event loop module"""
+
+import asyncio
+import threading
+
+# background event loop
+class ClLoop:
+    """Represents the event loop where the async work of Calet runs, like fetching pages or following async
+    streams. It runs in his own thread, it's started the first time it's used and it's shared by all the modules.
+    """
+    _loop = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls):
+        """Return the shared event loop, starting his thread the first time.
+        """
+        with cls._lock:
+            if cls._loop is None:
+                cls._loop = asyncio.new_event_loop()
+                threading.Thread(target=cls._loop.run_forever, daemon=True, name="calet_loop").start()
+            return cls._loop
+
+    @classmethod
+    def submit(cls, coroutine):
+        """Run the given coroutine in the shared event loop and return a ```concurrent.futures.Future``` with his result.
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, cls.get())
@@ -0,0 +1,144 @@
+"""Calet: a visual components library based on Flet framework
+   - Memory module"""
+
+import sys
+import types
+from enum import Enum
+import flet as ft
+from calet_errors import ClError
+from calet_theme import ClTheme, ClPalette
+
+# memory footprint profile
+class ClMemoryProfile:
+    """Represents the memory footprint of a tree of Calet components.\n
+    Every object reachable from the root is counted once, and his size is given to the Flet control
+    that holds it, and to the Calet component that holds that control. Objects shared between
+    sessions, like themes, pages, classes, functions and enums, are never counted.
+    """
+    # objects shared between sessions that are not retained by the tree
+    SHARED = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, Enum, ft.Page,
+              ClTheme, ClPalette)
+
+    def __init__(self, root:ft.Control, build:bool=True):
+        """Use this properties to personalize the profile:\n
+        ---
+        - root: is the Calet component or Flet control at the top of the profiled tree.
+        - build: is a flag saying if the tree must be built before it's profiled, when it isn't added to a page yet.
+          The components are built in place, so they keep their Flet controls after the profile, and they're built
+          again when the tree is added to a page. With False, the tree is profiled as it is and nothing is built.
+        """
+        # VALIDATION BLOCK
+        if not isinstance(root, ft.Control):
+            raise ClError(
+                error="Argument Error: <<root>> must be a Calet component or a Flet control"
+            )
+        if not isinstance(build, bool):
+            raise ClError(
+                error="Argument Error: <<build>> must be boolean"
+            )
+        # INITIALIZATION BLOCK
+        self.root = root
+        self.components = {}
+        self.controls = {}
+        self.total_bytes = 0
+        self.total_controls = 0
+        if build and root.page is None:
+            # the same build that Flet runs when the tree is added to a page; the commands are dropped,
+            # but the Flet controls built by the components stay in them
+            root._build_add_commands()
+        self.profile()
+
+    @staticmethod
+    def is_component(control:ft.Control):
+        return type(control).__module__.startswith("calet")
+
+    def profile(self):
+        seen = set()
+        pending = [(self.root, None)]
+        while pending:
+            control, owner = pending.pop()
+            if id(control) in seen:
+                continue
+            seen.add(id(control))
+            if self.is_component(control):
+                owner = self.components.setdefault(
+                    type(control).__name__, {"instances": 0, "built": 0, "bytes": 0, "flet_controls": 0}
+                )
+                owner["instances"] += 1
+                # components out of the page tree, like hidden submenus, are not built yet
+                owner["built"] += 1 if control.controls else 0
+            nested = []
+            size = self.sizeof(control, seen, nested)
+            self.total_bytes += size
+            if not self.is_component(control):
+                self.total_controls += 1
+                counter = self.controls.setdefault(type(control).__name__, {"instances": 0, "bytes": 0})
+                counter["instances"] += 1
+                counter["bytes"] += size
+                if owner is not None:
+                    owner["flet_controls"] += 1
+            if owner is not None:
+                owner["bytes"] += size
+            pending.extend((child, owner) for child in reversed(nested))
+
+    def sizeof(self, control:ft.Control, seen:set, nested:list):
+        # size of the objects only reachable through the control, the controls found on the way are returned in nested
+        size = 0
+        pending = [control]
+        while pending:
+            item = pending.pop()
+            if item is not control:
+                if item is None or isinstance(item, (bool, self.SHARED)) or id(item) in seen:
+                    continue
+                if isinstance(item, ft.Control):
+                    nested.append(item)
+                    continue
+                seen.add(id(item))
+            size += sys.getsizeof(item)
+            if isinstance(item, dict):
+                pending.extend(item.keys())
+                pending.extend(item.values())
+            elif isinstance(item, (list, tuple, set, frozenset)):
+                pending.extend(item)
+            elif isinstance(item, types.MethodType):
+                pending.append(item.__self__)
+            else:
+                if hasattr(item, "__dict__"):
+                    pending.append(vars(item))
+                for slot in getattr(type(item), "__slots__", ()):
+                    pending.append(getattr(item, slot, None))
+        return size
+
+    def report(self):
+        """Return a dict with the total size in bytes and Flet controls of the tree, and the counters of each
+        Calet component class and each Flet control type. The Flet controls of each component are counted
+        only in his built instances.
+        """
+        return {
+            "total_bytes": self.total_bytes,
+            "total_controls": self.total_controls,
+            "components": {
+                name: dict(counter, bytes_per_instance=counter["bytes"] // counter["instances"],
+                           controls_per_instance=counter["flet_controls"] / counter["built"] if counter["built"] else 0.0)
+                for name, counter in sorted(self.components.items(), key=lambda item: -item[1]["bytes"])
+            },
+            "controls": dict(sorted(self.controls.items(), key=lambda item: -item[1]["bytes"])),
+        }
+
+    def table(self, top:int=20):
+        """Return the report as a text table with the ```top``` most expensive component classes and control types.
+        """
+        report = self.report()
+        lines = [f"{'Calet component':<28}{'instances':>10}{'bytes':>12}{'bytes/inst':>12}{'controls/inst':>15}"]
+        for name, counter in list(report["components"].items())[:top]:
+            lines.append(
+                f"{name:<28}{counter['instances']:>10}{counter['bytes']:>12}"
+                f"{counter['bytes_per_instance']:>12}{counter['controls_per_instance']:>15.1f}"
+            )
+        lines.append("")
+        lines.append(f"{'Flet control':<28}{'instances':>10}{'bytes':>12}")
+        for name, counter in list(report["controls"].items())[:top]:
+            lines.append(f"{name:<28}{counter['instances']:>10}{counter['bytes']:>12}")
+        lines.append("")
+        lines.append(f"Total: {self.total_bytes} bytes in {self.total_controls} Flet controls")
+        return "\n".join(lines)
@@ -0,0 +1,153 @@
+"""Calet: a visual components library based on Flet framework
+   - Pool module"""
+
+import inspect
+import weakref
+import flet as ft
+from calet_errors import ClError
+from calet_template import ClTemplate
+
+# components pool
+class ClPool:
+    """Represents a page level pool of detached Calet components to be recycled.\n
+    Released components are kept for each class and handed back out by ```acquire``` with
+    their properties reset, instead of being constructed again. Only the properties that can
+    change between similar components are reset (see ```ClTemplate.STAMPABLE```), when any
+    other property is different a new component is constructed.
+    """
+    # one pool for each live page
+    _pools = weakref.WeakKeyDictionary()
+
+    def __init__(self, page:ft.Page=None, size:int=32, sizes:dict=None):
+        """Use ```ClPool.of(page)``` instead of this constructor to get the pool of a page.\n
+        ---
+        - page: is the Flet page of the pooled components. Components added to a page can only be recycled in that page.
+        - size: is the maximum number of released components kept for each class.
+        - sizes: is a dict with a custom maximum size for some classes, like ```{ClCheck: 100}```.
+        """
+        # VALIDATION BLOCK
+        if page is not None and not isinstance(page, ft.Page):
+            raise ClError(
+                error="Argument Error: <<page>> must be an instance of 'flet.Page' class"
+            )
+        if not isinstance(size, int) or size < 0:
+            raise ClError(
+                error="Argument Error: <<size>> must be a positive integer"
+            )
+        if sizes is not None and not isinstance(sizes, dict):
+            raise ClError(
+                error="Argument Error: <<sizes>> must be a dict"
+            )
+        # INITIALIZATION BLOCK
+        self.page = page
+        self.size = size
+        self.sizes = {}
+        self.free = {}
+        self.counters = {}
+        for component, component_size in (sizes or {}).items():
+            self.resize(component, component_size)
+
+    @classmethod
+    def of(cls, page:ft.Page):
+        """Return the pool of the given page, creating it the first time.
+        """
+        pool = cls._pools.get(page)
+        if pool is None:
+            pool = cls(page)
+            cls._pools[page] = pool
+        return pool
+
+    def resize(self, component:type, size:int):
+        """Change the maximum number of released components kept for the given class.
+        """
+        if not isinstance(component, type) or not issubclass(component, ft.UserControl):
+            raise ClError(
+                error="Argument Error: <<component>> must be a Calet component class"
+            )
+        if not isinstance(size, int) or size < 0:
+            raise ClError(
+                error="Argument Error: <<size>> must be a positive integer"
+            )
+        self.sizes[component] = size
+        del self.free.get(component, [])[size:]
+
+    def count(self, component:type, counter:str):
+        # counters of each class: acquired, reused, released and dropped components
+        counters = self.counters.setdefault(component, {"acquired": 0, "reused": 0, "released": 0, "dropped": 0})
+        counters[counter] += 1
+
+    def acquire(self, component:type, **properties):
+        """Return a component of the given class with the given constructor properties.
+        A released component is recycled if there is any, otherwise a new one is constructed.
+        """
+        self.count(component, "acquired")
+        free = self.free.get(component)
+        if free:
+            control = free.pop()
+            # properties not given go back to their default values
+            wanted = {
+                name: default for name, default in ClTemplate.parameters(component).items()
+                if default is not inspect.Parameter.empty
+            }
+            wanted.update(properties)
+            changes = {name: value for name, value in wanted.items() if getattr(control, name, None) != value}
+            if all(name in ClTemplate.STAMPABLE for name in changes):
+                ClTemplate.validate(component, changes)
+                # the control is detached, so his Flet controls will be built again from these attributes
+                for name, value in changes.items():
+                    setattr(control, name, value)
+                self.count(component, "reused")
+                return control
+            free.append(control)
+        return component(**properties)
+
+    def release(self, *controls:ft.UserControl):
+        """Give back to the pool components that were removed from the page and will not be used anymore.
+        """
+        for control in controls:
+            if not isinstance(control, ft.UserControl):
+                raise ClError(
+                    error="Argument Error: <<controls>> must be Calet components"
+                )
+            if control.page is not None and self.page is not None and control.page is not self.page:
+                raise ClError(
+                    error="Pool Error: the control belongs to another page"
+                )
+            if control.page is not None and control.page.get_control(control.uid) is control:
+                raise ClError(
+                    error="Pool Error: the control must be removed from his page before being released"
+                )
+            component = type(control)
+            free = self.free.setdefault(component, [])
+            if any(pooled is control for pooled in free):
+                continue
+            self.count(component, "released")
+            if len(free) < self.sizes.get(component, self.size):
+                free.append(control)
+            else:
+                self.count(component, "dropped")
+
+    def clear(self, component:type=None):
+        """Forget the released components of the given class, or of all classes if it isn't given.
+        """
+        if component is None:
+            self.free.clear()
+        else:
+            self.free.pop(component, None)
+
+    def stats(self, component:type=None):
+        """Return the counters and the reuse rate of the given class, or of all classes if it isn't given.
+        """
+        counters = {"acquired": 0, "reused": 0, "released": 0, "dropped": 0}
+        for counted, class_counters in self.counters.items():
+            if component is None or counted is component:
+                for counter, value in class_counters.items():
+                    counters[counter] += value
+        counters["pooled"] = sum(
+            len(free) for pooled, free in self.free.items() if component is None or pooled is component
+        )
+        counters["reuse_rate"] = counters["reused"] / counters["acquired"] if counters["acquired"] else 0.0
+        return counters
+
+    def __len__(self):
+        return sum(len(free) for free in self.free.values())
@@ -0,0 +1,111 @@
+"""Calet: a visual components library based on Flet framework
+   - Registry module"""
+
+import weakref
+from fnmatch import fnmatchcase
+import flet as ft
+from calet_errors import ClError
+from calet_batch import ClBatch
+
+# components registry
+class ClRegistry:
+    """Represents a page level registry where Calet components can be found by a key.\n
+    Controls are kept by weak reference, so a control is removed from the registry when it's
+    garbage collected and the registry never keeps a dead session alive.
+    """
+    # one registry for each live page
+    _registries = weakref.WeakKeyDictionary()
+
+    def __init__(self, page:ft.Page=None):
+        """Use ```ClRegistry.of(page)``` instead of this constructor to get the registry of a page.\n
+        ---
+        - page: is the Flet page of the registered controls. If it's given, bulk updates are sent in one single page update.
+        """
+        # VALIDATION BLOCK
+        if page is not None and not isinstance(page, ft.Page):
+            raise ClError(
+                error="Argument Error: <<page>> must be an instance of 'flet.Page' class"
+            )
+        # INITIALIZATION BLOCK
+        self.page = page
+        self.controls = {}
+
+    @classmethod
+    def of(cls, page:ft.Page):
+        """Return the registry of the given page, creating it the first time.
+        """
+        registry = cls._registries.get(page)
+        if registry is None:
+            registry = cls(page)
+            cls._registries[page] = registry
+        return registry
+
+    def register(self, key:str, control:ft.UserControl):
+        """Register a Calet control under the given key, replacing the control registered before with the same key.
+        """
+        if not isinstance(key, str):
+            raise ClError(
+                error="Argument Error: <<key>> must be string"
+            )
+        if not isinstance(control, ft.UserControl):
+            raise ClError(
+                error="Argument Error: <<control>> must be a Calet component"
+            )
+        self.controls[key] = weakref.ref(control, lambda ref, key=key: self.forget(key, ref))
+        return control
+
+    def unregister(self, key:str):
+        """Remove the control registered under the given key, if any.
+        """
+        self.controls.pop(key, None)
+
+    def forget(self, key:str, ref:weakref.ref):
+        # weak reference callback: the key could have been registered again with a newer control
+        if self.controls.get(key) is ref:
+            del self.controls[key]
+
+    def get(self, key:str, default=None):
+        """Return the control registered under the given key, or ```default``` if there is no one.
+        """
+        ref = self.controls.get(key)
+        control = ref() if ref is not None else None
+        return control if control is not None else default
+
+    def find(self, pattern:str):
+        """Return a dict with all the live controls whose key matches the given pattern.
+        The pattern can use shell wildcards like 'filters.*' or 'tab_?'.
+        """
+        if not isinstance(pattern, str):
+            raise ClError(
+                error="Argument Error: <<pattern>> must be string"
+            )
+        if not any(char in pattern for char in "*?["):
+            control = self.get(pattern)
+            return {pattern: control} if control is not None else {}
+        found = {}
+        for key, ref in list(self.controls.items()):
+            control = ref()
+            if control is not None and fnmatchcase(key, pattern):
+                found[key] = control
+        return found
+
+    def upd(self, pattern:str, **properties):
+        """Call ```upd``` with the given properties in every control whose key matches the given pattern.
+        If the registry belongs to a page, all the changes are sent in one single update.
+        Return the number of updated controls.
+        """
+        found = self.find(pattern)
+        if self.page is None:
+            for control in found.values():
+                control.upd(**properties)
+        else:
+            with ClBatch(self.page):
+                for control in found.values():
+                    control.upd(**properties)
+        return len(found)
+
+    def __contains__(self, key:str):
+        return self.get(key) is not None
+
+    def __len__(self):
+        return len(self.controls)
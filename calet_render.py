@@ -0,0 +1,137 @@
+"""Calet: a visual components library based on Flet framework
+   - Render profiles module"""
+
+import weakref
+import flet as ft
+from calet_errors import ClError
+from calet_batch import ClBatch
+
+# page render profile
+class ClRenderProfile:
+    """Represents the level of visual effects used by the Calet components of a page:\n
+    - 'full': blur, gradients and all the animations.
+    - 'reduced': no blur, and shorter animations without elastic curves.
+    - 'minimal': no blur, flat colors instead of gradients and no animations, for weak clients.\n
+    Components are painted with the profile given to their constructor, or with the profile of their parent
+    bar, or with the default one. When the profile of a page is switched, the properties of all his mounted
+    components are updated in one single page update, without building them again.
+    """
+    # effects of each profile, speed multiplies the duration of the animations
+    PROFILES = {
+        "full": {"blur": True, "gradients": True, "elastic": True, "speed": 1.0},
+        "reduced": {"blur": False, "gradients": True, "elastic": False, "speed": 0.5},
+        "minimal": {"blur": False, "gradients": False, "elastic": False, "speed": 0.0},
+    }
+    ELASTIC = (ft.AnimationCurve.ELASTIC_IN, ft.AnimationCurve.ELASTIC_OUT, ft.AnimationCurve.ELASTIC_IN_OUT)
+    # profile used when no profile is selected in a page
+    default = "full"
+    # one profile for each live page
+    _profiles = weakref.WeakKeyDictionary()
+    # animations of each profile, shared by all the components
+    _animations = {}
+
+    def __init__(self, page:ft.Page=None, name:str=None):
+        """Use ```ClRenderProfile.of(page)``` instead of this constructor to get the profile of a page.\n
+        ---
+        - page: is the Flet page whose components are painted with this profile.
+        - name: is the name of the profile. Can be 'full', 'reduced' or 'minimal'. If it isn't given, the default profile is used.
+        """
+        # VALIDATION BLOCK
+        if page is not None and not isinstance(page, ft.Page):
+            raise ClError(
+                error="Argument Error: <<page>> must be an instance of 'flet.Page' class"
+            )
+        if name is not None and name not in self.PROFILES:
+            raise ClError(
+                error="Argument Error: <<name>> must be 'full', 'reduced' or 'minimal'"
+            )
+        # INITIALIZATION BLOCK
+        self.page = page
+        self.name = name if name is not None else self.default
+        self.effects = self.PROFILES[self.name]
+        # mounted components painted with this profile
+        self.components = weakref.WeakSet()
+
+    @classmethod
+    def of(cls, page:ft.Page):
+        """Return the profile of the given page, creating it the first time. Without page, a default profile is returned.
+        """
+        if page is None:
+            return cls(name=cls.default)
+        profile = cls._profiles.get(page)
+        if profile is None:
+            profile = cls(page)
+            cls._profiles[page] = profile
+        return profile
+
+    @property
+    def gradients(self):
+        return self.effects["gradients"]
+
+    def blur(self, radius:int):
+        """Return the given blur radius, or None if this profile has no blur.
+        """
+        return radius if self.effects["blur"] else None
+
+    def animation(self, duration:int, curve:ft.AnimationCurve=None):
+        """Return the animation for the ```animate``` properties of the Flet controls with the given duration and curve,
+        shortened or removed by this profile. Elastic curves are replaced by an ease out curve when not allowed.
+        """
+        key = (self.name, duration, curve)
+        if key not in self._animations:
+            duration = int(duration * self.effects["speed"])
+            if curve in self.ELASTIC and not self.effects["elastic"]:
+                curve = ft.AnimationCurve.EASE_OUT
+            if not duration:
+                animation = None
+            elif curve is None:
+                animation = duration
+            else:
+                animation = ft.Animation(duration, curve)
+            self._animations[key] = animation
+        return self._animations[key]
+
+    def share(self, components:list):
+        """Give this profile to the Calet components of the list that have no profile, like the options of a bar.
+        """
+        for component in components:
+            if getattr(component, "render_profile", False) is None:
+                component.render_profile = self
+
+    @classmethod
+    def mount(cls, component:ft.UserControl):
+        """Attach a mounted component to the profile of his page, so it's painted again when the profile is switched.
+        Calet components call it when they are mounted. A component built with another profile than the one of
+        his page is painted with the page profile by his ```upd``` method, so pass the page profile to the
+        components when they're constructed to avoid that extra update.
+        """
+        if component.page is None:
+            return
+        profile = cls.of(component.page)
+        profile.components.add(component)
+        built = getattr(component, "render_profile", None)
+        if built is profile:
+            return
+        if built is not None and built.name != profile.name:
+            component.upd(render_profile=profile)
+        else:
+            component.render_profile = profile
+
+    def switch(self, name:str):
+        """Change the profile of the page and paint again all his mounted Calet components with one single update.
+        Only the properties changed by the profile are updated, the components are not built again.
+        """
+        if name not in self.PROFILES:
+            raise ClError(
+                error="Argument Error: <<name>> must be 'full', 'reduced' or 'minimal'"
+            )
+        if name == self.name:
+            return
+        self.name = name
+        self.effects = self.PROFILES[name]
+        if self.page is None:
+            return
+        components = [component for component in list(self.components) if component.page is self.page]
+        with ClBatch(self.page):
+            for component in components:
+                component.upd(render_profile=self)
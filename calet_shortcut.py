@@ -0,0 +1,131 @@
+"""Calet: a visual components library based on Flet framework
+   - Shortcuts module"""
+
+import weakref
+import flet as ft
+from calet_errors import ClError
+
+# keyboard shortcuts dispatcher
+class ClShortcutDispatcher:
+    """Represents a page level keyboard shortcuts dispatcher for Calet buttons.\n
+    All shortcuts registered in the page are compiled into a single keymap, so each key press
+    is routed to his button with one dictionary lookup, whatever the number of buttons in the page.
+    """
+    # modifier aliases accepted in shortcut strings
+    MODIFIERS = {
+        "ctrl": "ctrl", "control": "ctrl",
+        "shift": "shift",
+        "alt": "alt", "option": "alt",
+        "meta": "meta", "cmd": "meta", "command": "meta", "super": "meta"
+    }
+    # tap position sent to the click handlers, containers parse it as a tap event
+    TAP_DATA = '{"lx":0,"ly":0,"gx":0,"gy":0}'
+    # one dispatcher for each live page
+    _dispatchers = weakref.WeakKeyDictionary()
+
+    def __init__(self, page:ft.Page):
+        """Use ```ClShortcutDispatcher.of(page)``` instead of this constructor to get the dispatcher of a page.\n
+        ---
+        - page: is the Flet page whose keyboard events will be dispatched.
+        """
+        # VALIDATION BLOCK
+        if not isinstance(page, ft.Page):
+            raise ClError(
+                error="Argument Error: <<page>> must be an instance of 'flet.Page' class"
+            )
+        # INITIALIZATION BLOCK
+        self.page = page
+        self.keymap = {}
+        self.page.on_keyboard_event = self.key_pressed
+        # the client only sends key presses once the page handler is known, so it's sent a single time here
+        if self.page is not None:
+            self.page.update()
+
+    @classmethod
+    def of(cls, page:ft.Page):
+        """Return the shortcuts dispatcher of the given page, creating it the first time.
+        """
+        if not isinstance(page, ft.Page):
+            raise ClError(
+                error="Argument Error: <<page>> must be an instance of 'flet.Page' class"
+            )
+        dispatcher = cls._dispatchers.get(page)
+        if dispatcher is None:
+            dispatcher = cls(page)
+            cls._dispatchers[page] = dispatcher
+        return dispatcher
+
+    @classmethod
+    def compile(cls, shortcut:str):
+        """Return the keymap key of a shortcut string like 'ctrl+shift+s' or 'F5'.\n
+        The key is a tuple ```(key, ctrl, shift, alt, meta)``` built in the same way that the page
+        keyboard events are read, so a shortcut and his key press always share the same hash.
+        """
+        if not isinstance(shortcut, str):
+            raise ClError(
+                error="Argument Error: <<shortcut>> must be string"
+            )
+        parts = [part.strip().lower() for part in shortcut.split("+")]
+        modifiers = set()
+        for part in parts[:-1]:
+            if part not in cls.MODIFIERS:
+                raise ClError(
+                    error=f"Argument Error: <<shortcut>> has an unknown modifier '{part}'. Must be 'ctrl', 'shift', 'alt' or 'meta'"
+                )
+            modifiers.add(cls.MODIFIERS[part])
+        if not parts[-1] or parts[-1] in cls.MODIFIERS:
+            raise ClError(
+                error="Argument Error: <<shortcut>> must end with a key, like 'ctrl+shift+s'"
+            )
+        return (parts[-1], "ctrl" in modifiers, "shift" in modifiers, "alt" in modifiers, "meta" in modifiers)
+
+    @classmethod
+    def check(cls, controls:list):
+        """Validate that the given Calet controls don't share any shortcut, so a bar can reject them when it's constructed.
+        """
+        used = {}
+        for control in controls:
+            shortcut = getattr(control, "shortcut", None)
+            if shortcut is None:
+                continue
+            key = cls.compile(shortcut)
+            if key in used:
+                raise ClError(
+                    error=f"Argument Error: <<shortcut>> '{shortcut}' is already used by '{used[key]}'"
+                )
+            used[key] = shortcut
+
+    def register(self, control):
+        """Register the shortcut of a Calet button in the page keymap. Registering the same button again does nothing.\n
+        The page is already updated when the buttons are mounted, so a shortcut used by another live control is kept
+        for that control and ```False``` is returned instead of raising.
+        """
+        key = self.compile(control.shortcut)
+        registered = self.keymap.get(key)
+        if registered is not None and registered() is not None and registered() is not control:
+            return False
+        self.keymap[key] = weakref.ref(control)
+        return True
+
+    def unregister(self, control):
+        """Remove the shortcut of a Calet button from the page keymap. A button that isn't registered is ignored.
+        """
+        key = self.compile(control.shortcut)
+        registered = self.keymap.get(key)
+        if registered is not None and registered() in (None, control):
+            del self.keymap[key]
+
+    def key_pressed(self, e:ft.KeyboardEvent):
+        registered = self.keymap.get((e.key.lower(), e.ctrl, e.shift, e.alt, e.meta))
+        control = registered() if registered is not None else None
+        if control is None or not getattr(control, "enabled", True):
+            return
+        # the button click handler receives the same event that a real click would send
+        handler = control.button.on_click
+        if handler is not None:
+            event = ft.ControlEvent(target=control.button.uid, name="click", data=self.TAP_DATA, control=control.button, page=self.page)
+            if hasattr(handler, "get_sync_handler"):
+                # containers keep their click handlers subscribed in an event handler object
+                handler.get_sync_handler()(event)
+            else:
+                handler(event)
@@ -0,0 +1,211 @@
+"""Calet: a visual components library based on Flet framework
+   - Data sources module"""
+
+import asyncio
+import inspect
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from calet_errors import ClError
+from calet_loop import ClLoop
+
+# paged data source
+class ClPagedSource:
+    """Represents a source of items read by pages from a slow store, like a database or a web service.\n
+    Pages are fetched asynchronously around the requested window of items and ahead of it in the scroll
+    direction, and the last used pages are kept in a bounded cache. When the window jumps, the fetches of
+    the pages that are not wanted anymore are cancelled. Every loaded page is announced to the subscribed
+    functions, so the controls that show it can be rendered incrementally.
+    """
+    def __init__(self, fetch, page_size:int=50, cache_pages:int=10, prefetch:int=2, total:int=None):
+        """Use this properties to personalize the source:\n
+        ---
+        - fetch: is the function or coroutine function that receives a page number and the page size, and returns the list of items of that page. A page shorter than the page size is the last one. Functions run in a background thread.
+        - page_size: is the number of items of each page.
+        - cache_pages: is the maximum number of pages kept in the cache. It must hold the displayed pages plus the prefetched ones.
+        - prefetch: is the number of pages fetched ahead of the requested window.
+        - total: is the number of items of the store, if it's known. Otherwise it's known when the last page is loaded.
+        """
+        # VALIDATION BLOCK
+        if not callable(fetch):
+            raise ClError(
+                error="Argument Error: <<fetch>> must be callable"
+            )
+        if not isinstance(page_size, int) or page_size < 1:
+            raise ClError(
+                error="Argument Error: <<page_size>> must be an integer greater than 0"
+            )
+        if not isinstance(cache_pages, int) or cache_pages < 1:
+            raise ClError(
+                error="Argument Error: <<cache_pages>> must be an integer greater than 0"
+            )
+        if not isinstance(prefetch, int) or prefetch < 0:
+            raise ClError(
+                error="Argument Error: <<prefetch>> must be a positive integer"
+            )
+        if total is not None and (not isinstance(total, int) or total < 0):
+            raise ClError(
+                error="Argument Error: <<total>> must be a positive integer"
+            )
+        # INITIALIZATION BLOCK
+        self.fetch = fetch
+        self.page_size = page_size
+        self.cache_pages = cache_pages
+        self.prefetch = prefetch
+        self.total = total
+        # - loaded pages from the least to the most recently used, and the fetches in flight by page number
+        self.cache = OrderedDict()
+        self.pending = {}
+        self.reached = 0
+        self.first = 0
+        self.listeners = []
+        self.error = None
+        self.stats = {"fetched": 0, "cancelled": 0, "hits": 0, "misses": 0}
+        self.lock = threading.RLock()
+
+    def extent(self):
+        """Return the number of items to display: the total if it's known, or the reached items plus one page.
+        """
+        if self.total is not None:
+            return self.total
+        return (self.reached + 1) * self.page_size
+
+    def get(self, index:int):
+        """Return the item of the given index, or None if his page isn't loaded.
+        """
+        page = index // self.page_size
+        with self.lock:
+            items = self.cache.get(page)
+            if items is None:
+                self.stats["misses"] += 1
+                return None
+            self.cache.move_to_end(page)
+            self.stats["hits"] += 1
+        offset = index % self.page_size
+        return items[offset] if offset < len(items) else None
+
+    def request(self, first:int, last:int):
+        """Fetch the pages of the items from ```first``` to ```last``` (excluded) and the next ones in the scroll direction,
+        cancelling the fetches of any other page.
+        """
+        with self.lock:
+            direction = 1 if first >= self.first else -1
+            self.first = first
+            start, end = first // self.page_size, max(first, last - 1) // self.page_size
+            ahead = range(end + 1, end + 1 + self.prefetch) if direction > 0 else range(start - 1, start - 1 - self.prefetch, -1)
+            wanted = [
+                page for page in (*range(start, end + 1), *ahead)
+                if page >= 0 and (self.total is None or page * self.page_size < self.total)
+            ]
+            for page in list(self.pending):
+                if page not in wanted:
+                    # the window jumped away from this page
+                    self.pending.pop(page).cancel()
+                    self.stats["cancelled"] += 1
+            for page in wanted:
+                if page not in self.cache and page not in self.pending:
+                    self.submit(page)
+
+    def future(self, page:int):
+        """Return a ```concurrent.futures.Future``` with the items of the given page, fetching it if it isn't loaded.
+        """
+        with self.lock:
+            items = self.cache.get(page)
+            if items is not None:
+                self.cache.move_to_end(page)
+                future = Future()
+                future.set_result(items)
+                return future
+            future = self.pending.get(page)
+            if future is None:
+                future = self.submit(page)
+            return future
+
+    def submit(self, page:int):
+        future = ClLoop.submit(self.load(page))
+        # pending before the callback, that runs at once in this thread if the page is already loaded
+        with self.lock:
+            self.pending[page] = future
+        future.add_done_callback(lambda done, page=page: self.loaded(page, done))
+        return future
+
+    async def load(self, page:int):
+        if inspect.iscoroutinefunction(self.fetch):
+            items = await self.fetch(page, self.page_size)
+        else:
+            items = await asyncio.get_running_loop().run_in_executor(None, self.fetch, page, self.page_size)
+        return list(items)
+
+    def loaded(self, page:int, future:Future):
+        with self.lock:
+            if self.pending.get(page) is future:
+                del self.pending[page]
+            if future.cancelled():
+                return
+            try:
+                items = future.result()
+            except Exception as e:
+                # the page isn't cached, so it's fetched again the next time it's requested
+                self.error = e
+                return
+            self.error = None
+            self.stats["fetched"] += 1
+            self.cache[page] = items
+            self.cache.move_to_end(page)
+            while len(self.cache) > self.cache_pages:
+                self.cache.popitem(last=False)
+            if len(items) < self.page_size:
+                # prefetched pages after the last one are empty, the shortest total is the real one
+                total = page * self.page_size + len(items)
+                self.total = total if self.total is None else min(self.total, total)
+            if items:
+                self.reached = max(self.reached, page + 1)
+            listeners = list(self.listeners)
+        for listener in listeners:
+            listener(page, items)
+
+    def subscribe(self, listener):
+        """Call the given function with the page number and the items of every loaded page, from the loop thread.
+        """
+        if not callable(listener):
+            raise ClError(
+                error="Argument Error: <<listener>> must be callable"
+            )
+        with self.lock:
+            self.listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        with self.lock:
+            if listener in self.listeners:
+                self.listeners.remove(listener)
+
+    def feed(self, callback, pages:int=None):
+        """Call the given function with the items of each page in order, from the first one, while the next pages
+        are fetched ahead. It's useful to add controls incrementally, like the filters of a ```calet_bar.ClFilterBar```.
+        Return a future that can be cancelled to stop feeding.
+        """
+        if not callable(callback):
+            raise ClError(
+                error="Argument Error: <<callback>> must be callable"
+            )
+        return ClLoop.submit(self.feeding(callback, pages))
+
+    async def feeding(self, callback, pages:int=None):
+        page = 0
+        while (pages is None or page < pages) and (self.total is None or page * self.page_size < self.total):
+            self.request(page * self.page_size, (page + 1) * self.page_size)
+            items = await asyncio.wrap_future(self.future(page))
+            callback(items)
+            if len(items) < self.page_size:
+                break
+            page += 1
+
+    def clear(self):
+        """Forget the loaded pages and cancel the fetches in flight, to read the store again.
+        """
+        with self.lock:
+            for future in self.pending.values():
+                future.cancel()
+            self.pending.clear()
+            self.cache.clear()
+            self.reached = 0
@@ -0,0 +1,228 @@
+"""Calet: a visual components library based on Flet framework
+   - State module"""
+
+import functools
+import inspect
+import weakref
+import flet as ft
+from calet_errors import ClError
+from calet_batch import ClBatch
+from calet_button import ClCheck
+
+# observable value
+class ClSignal:
+    """Represents an observable value that notifies his subscribers only when it really changes.
+    """
+    def __init__(self, value=None):
+        """Use this properties to personalize the signal:\n
+        ---
+        - value: is the initial value of the signal.
+        """
+        self.value = value
+        self.subscribers = []
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        """Change the value of the signal and notify the subscribers. Return False if the value didn't change.
+        """
+        if value == self.value:
+            return False
+        self.value = value
+        for subscriber in list(self.subscribers):
+            subscriber(value)
+        return True
+
+    def subscribe(self, subscriber):
+        """Add a function to be called with the new value every time the signal changes.
+        """
+        if not callable(subscriber):
+            raise ClError(
+                error="Argument Error: <<subscriber>> must be callable"
+            )
+        self.subscribers.append(subscriber)
+
+    def unsubscribe(self, subscriber):
+        if subscriber in self.subscribers:
+            self.subscribers.remove(subscriber)
+
+# computed value
+class ClComputed(ClSignal):
+    """Represents an observable value computed from other signals, that is recomputed when any of them changes.
+    """
+    def __init__(self, function, *signals:ClSignal):
+        """Use this properties to personalize the computed value:\n
+        ---
+        - function: is the function that computes the value, receiving the values of ```signals``` in the same order.
+        - signals: are the ```ClSignal``` objects the value depends on.
+        """
+        # VALIDATION BLOCK
+        if not callable(function):
+            raise ClError(
+                error="Argument Error: <<function>> must be callable"
+            )
+        for i in range(len(signals)):
+            if not isinstance(signals[i], ClSignal):
+                raise ClError(
+                    error=f"Argument Error: <<signals[{i}]>> must be an instance of 'calet_state.ClSignal' class"
+                )
+        # INITIALIZATION BLOCK
+        self.function = function
+        self.signals = signals
+        super().__init__(self.compute())
+        for signal in signals:
+            signal.subscribe(self.recompute)
+
+    def compute(self):
+        return self.function(*(signal.value for signal in self.signals))
+
+    def recompute(self, value=None):
+        self.set(self.compute())
+
+# state store
+class ClStore:
+    """Represents a state store whose signals drive the properties of Calet components.\n
+    Components are bound to the store signals, and every change set given to ```set``` only
+    reaches the controls whose bound values really changed, with one ```upd``` for each control
+    and one single page update for the whole change set.
+    """
+    # properties of Calet components that can be bound to a signal
+    BINDABLE = ("selected", "enabled", "active", "value")
+
+    def __init__(self, page:ft.Page=None, **values):
+        """Use this properties to personalize the store:\n
+        ---
+        - page: is the Flet page of the bound controls. If it's given, every change set is sent in one single page update.
+        - values: are the names and initial values of the store signals.
+        """
+        # VALIDATION BLOCK
+        if page is not None and not isinstance(page, ft.Page):
+            raise ClError(
+                error="Argument Error: <<page>> must be an instance of 'flet.Page' class"
+            )
+        # INITIALIZATION BLOCK
+        self.page = page
+        self.signals = {name: ClSignal(value) for name, value in values.items()}
+        self.pending = {}
+        self.changing = False
+        # signal and subscriber of each bound property, by control id and property
+        self.bindings = {}
+
+    def __getitem__(self, name:str):
+        if name not in self.signals:
+            raise ClError(
+                error=f"Argument Error: '{name}' is not a signal of this store"
+            )
+        return self.signals[name].value
+
+    def signal(self, name:str):
+        """Return the ```ClSignal``` object with the given name.
+        """
+        if name not in self.signals:
+            raise ClError(
+                error=f"Argument Error: '{name}' is not a signal of this store"
+            )
+        return self.signals[name]
+
+    def computed(self, name:str, function, *names:str):
+        """Add a computed signal to the store, whose value is the result of ```function``` with the values of
+        the signals named in ```names```.
+        """
+        if not isinstance(name, str):
+            raise ClError(
+                error="Argument Error: <<name>> must be string"
+            )
+        self.signals[name] = ClComputed(function, *(self.signal(signal_name) for signal_name in names))
+        return self.signals[name]
+
+    def bind(self, control:ft.UserControl, prop:str, name:str):
+        """Bind a property of a Calet control to a signal of the store.\n
+        ---
+        - control: is the Calet component to drive.
+        - prop: is the bound property. Can be 'selected', 'enabled', 'active' or 'value'.
+        - name: is the name of the signal that gives the value of the property.
+        """
+        if not hasattr(control, "upd"):
+            raise ClError(
+                error="Argument Error: <<control>> must be a Calet component"
+            )
+        if prop not in self.BINDABLE:
+            raise ClError(
+                error="Argument Error: <<prop>> must be 'selected', 'enabled', 'active' or 'value'"
+            )
+        if prop not in inspect.signature(control.upd).parameters:
+            raise ClError(
+                error=f"Argument Error: <<prop>> '{prop}' can't be updated in a '{type(control).__name__}' component"
+            )
+        signal = self.signal(name)
+        self.unbind(control, prop)
+        key = (id(control), prop)
+        # the store only keeps a weak reference, so a bound control can be collected
+        reference = weakref.ref(control, lambda reference, key=key: self.release(key))
+        subscriber = functools.partial(self.notify, reference, prop)
+        signal.subscribe(subscriber)
+        self.bindings[key] = signal, subscriber
+        if control.page is None:
+            setattr(control, prop, signal.value)
+        else:
+            self.stage(control, prop, signal.value)
+            if not self.changing:
+                self.flush()
+
+    def unbind(self, control:ft.UserControl, prop:str=None):
+        """Remove the binding of a property of a Calet control, or all his bindings if ```prop``` isn't given.
+        Properties that aren't bound are ignored.
+        """
+        for key in [key for key in self.bindings if key[0] == id(control) and prop in (None, key[1])]:
+            self.release(key)
+
+    def release(self, key:tuple):
+        binding = self.bindings.pop(key, None)
+        if binding is not None:
+            signal, subscriber = binding
+            signal.unsubscribe(subscriber)
+
+    def notify(self, reference:weakref.ref, prop:str, value):
+        control = reference()
+        if control is not None:
+            self.stage(control, prop, value)
+
+    def stage(self, control:ft.UserControl, prop:str, value):
+        # the last staged value of each property wins
+        self.pending.setdefault(id(control), (control, {}))[1][prop] = value
+
+    def set(self, **values):
+        """Change the value of the given signals and send the resulting changes to the bound controls.
+        """
+        for name in values:
+            self.signal(name)
+        self.changing = True
+        try:
+            for name, value in values.items():
+                self.signals[name].set(value)
+        finally:
+            self.changing = False
+        self.flush()
+
+    def flush(self):
+        pending, self.pending = self.pending, {}
+        if self.page is None:
+            self.apply(pending)
+        else:
+            with ClBatch(self.page):
+                self.apply(pending)
+
+    def apply(self, pending:dict):
+        for control, props in pending.values():
+            props = {prop: value for prop, value in props.items() if getattr(control, prop, None) != value}
+            if not props:
+                continue
+            if control.page is None:
+                # not built yet, the control will read his attributes when it's built
+                for prop, value in props.items():
+                    setattr(control, prop, value)
+                continue
+            if isinstance(control, ClCheck) and "value" in props:
+                props["value"] = {True: "true", False: "false", None: "none"}[props["value"]]
+            control.upd(**props)
@@ -0,0 +1,142 @@
+"""Calet: a visual components library based on Flet framework
+   - Templates module"""
+
+import copy
+import inspect
+import types
+import flet as ft
+from calet_errors import ClError
+from calet_theme import ClTheme
+
+# components template
+class ClTemplate:
+    """Represents a template to stamp out many similar Calet components.\n
+    The shared properties are validated once, when the template is created, and every stamped
+    component only validates his own overrides instead of running the full constructor again.
+    """
+    # properties that can change between the stamped components, with the type they must have;
+    # with several types, the one annotated in the constructor of the component is used
+    STAMPABLE = {
+        "text": str,
+        "label": str,
+        "color": str,
+        "filter_color": str,
+        "selected": bool,
+        "enabled": bool,
+        "value": (bool, str),
+        "theme": ClTheme,
+        "data": object,
+        "action": callable,
+        "remove_action": callable,
+    }
+    # constructor parameters and annotations of each component class, read once
+    _parameters = {}
+    _annotations = {}
+
+    def __init__(self, component:type, **properties):
+        """Use this properties to personalize the template:\n
+        ---
+        - component: is the Calet component class to stamp, like ```calet_button.ClFilterButton```.
+        - properties: are the constructor arguments shared by all the stamped components.
+        """
+        # VALIDATION BLOCK
+        if not isinstance(component, type) or not issubclass(component, ft.UserControl):
+            raise ClError(
+                error="Argument Error: <<component>> must be a Calet component class"
+            )
+        # INITIALIZATION BLOCK
+        self.component = component
+        # - the prototype runs the full constructor validation only once and it's never built
+        self.prototype = component(**properties)
+
+    @classmethod
+    def parameters(cls, component:type):
+        """Return the constructor parameters of a component class, with their default values.
+        """
+        parameters = cls._parameters.get(component)
+        if parameters is None:
+            parameters = {
+                name: parameter.default for name, parameter in inspect.signature(component).parameters.items()
+            }
+            cls._parameters[component] = parameters
+            cls._annotations[component] = {
+                name: parameter.annotation for name, parameter in inspect.signature(component).parameters.items()
+            }
+        return parameters
+
+    @classmethod
+    def validate(cls, component:type, overrides:dict):
+        """Check the given overrides of a component class, raising a ```ClError``` if any of them is wrong.
+        """
+        for name, value in overrides.items():
+            kind = cls.STAMPABLE.get(name)
+            if kind is None or name not in cls.parameters(component):
+                raise ClError(
+                    error=f"Argument Error: <<{name}>> can not be overridden in a '{component.__name__}' template"
+                )
+            if value is None or kind is object:
+                continue
+            if isinstance(kind, tuple):
+                annotation = cls._annotations[component][name]
+                kind = annotation if annotation in kind else kind
+            if isinstance(kind, tuple) and not isinstance(value, kind):
+                raise ClError(
+                    error=f"Argument Error: <<{name}>> must be boolean or string"
+                )
+            if kind is callable and not callable(value):
+                raise ClError(
+                    error=f"Argument Error: <<{name}>> must be callable"
+                )
+            if kind is ClTheme and not isinstance(value, ClTheme):
+                raise ClError(
+                    error=f"Argument Error: <<{name}>> must be an instance of 'calet_theme.ClTheme' Calet class"
+                )
+            if kind in (str, bool) and not isinstance(value, kind):
+                raise ClError(
+                    error=f"Argument Error: <<{name}>> must be {'string' if kind is str else 'boolean'}"
+                )
+
+    @classmethod
+    def clone(cls, control:ft.Control, clones:dict):
+        """Return a copy of a control that is never built, without running his constructor.\n
+        His lists and dicts are copied and the child controls in them are cloned too, so the stamped components
+        never share their children, Flet attributes or event handlers. ```clones``` maps the id of each cloned
+        control to his clone, so a child found twice is cloned once and methods bound to it follow the clone.
+        """
+        clone = copy.copy(control)
+        clones[id(control)] = clone
+        state = vars(clone)
+        for name, value in state.items():
+            state[name] = cls.cloned(value, clones)
+        return clone
+
+    @classmethod
+    def cloned(cls, value, clones:dict):
+        if isinstance(value, ft.Control):
+            return clones[id(value)] if id(value) in clones else cls.clone(value, clones)
+        if isinstance(value, types.MethodType) and id(value.__self__) in clones:
+            return types.MethodType(value.__func__, clones[id(value.__self__)])
+        if isinstance(value, list):
+            return [cls.cloned(item, clones) for item in value]
+        if isinstance(value, dict):
+            return {cls.cloned(key, clones): cls.cloned(item, clones) for key, item in value.items()}
+        return value
+
+    def stamp(self, **overrides):
+        """Return a new component with the template properties and the given overrides.\n
+        Overrides can be 'text', 'label', 'color', 'filter_color', 'selected', 'enabled', 'value', 'theme', 'data', 'action' or 'remove_action'.
+        """
+        self.validate(self.component, overrides)
+        control = self.clone(self.prototype, {})
+        for name, value in overrides.items():
+            setattr(control, name, value)
+        return control
+
+    def stamp_all(self, overrides:list[dict]):
+        """Return a list of new components, one for each dict of overrides in the given list.
+        """
+        if not isinstance(overrides, list):
+            raise ClError(
+                error="Argument Error: <<overrides>> must be a list of dicts"
+            )
+        return [self.stamp(**component_overrides) for component_overrides in overrides]
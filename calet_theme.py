@@ -1,13 +1,194 @@
 """Miniframework de GUI 'Calet', basado en Flet
    - Módulo de temas"""
 
-import flet as ft
+import json
+import weakref
 from calet_errors import ClError
 
-class ClLightTheme:
+# color with opacity, written as Flet does, so the themes don't need to import Flet
+def with_opacity(opacity:float, color:str):
+    return f"{color},{opacity}"
+
+# immutable colors set
+class ClPalette:
+    """Represent an immutable set of colors to be used in Calet components.\n
+    Palettes are interned: building a palette with the same colors of a live one returns that
+    same object, so all the sessions of a process share one single object for each colors set.
+    Because of that, their colors and attributes can't be set: use ```replace``` to get a palette
+    with other colors.
+    """
+    # color tokens of every palette
+    TOKENS = (
+        "transparent", "transparent_05", "transparent_1", "transparent_3", "transparent_5", "transparent_8",
+        "transparent_inverse",
+        "background_one", "background_two", "divider",
+        "font_one", "font_two", "font_three", "font_four",
+        "primary", "primary_block", "primary_hovered",
+        "secondary", "secondary_block",
+        "tonal", "tonal_block",
+        "success", "success_block",
+        "accept", "accept_hovered",
+        "error", "error_block",
+        "cancel", "cancel_hovered",
+        "warning", "warning_block"
+    )
+    # colors taken from another color of the palette when they aren't given, with the opacity applied to it
+    DERIVED = {
+        "primary_block": ("primary", 0.2),
+        "secondary_block": ("secondary", 0.2),
+        "tonal": ("primary", None),
+        "tonal_block": ("primary_block", None),
+        "success_block": ("success", 0.2),
+        "error_block": ("error", 0.2),
+        "warning_block": ("warning", 0.2),
+    }
+    # default colors of each palette class
+    DEFAULTS = {}
+    # name of each palette class in the serialized palettes
+    KIND = None
+    # version of the serialized palettes and themes, the colors are saved in the order of the tokens
+    FORMAT = 1
+    # the colors are kept in one tuple, in the same order of the tokens
+    __slots__ = ("values", "__weakref__")
+    # live palettes by class and colors
+    _interned = weakref.WeakValueDictionary()
+
+    @classmethod
+    def intern(cls, colors:dict):
+        """Return the palette of this class with the given colors, the not given ones take their default value.
+        """
+        colors = {token: color for token, color in colors.items() if token in cls.TOKENS and color is not None}
+        for token in cls.TOKENS:
+            if token in colors:
+                continue
+            if token in cls.DERIVED:
+                base, opacity = cls.DERIVED[token]
+                colors[token] = colors[base] if opacity is None else with_opacity(opacity, colors[base])
+            else:
+                colors[token] = cls.DEFAULTS[token]
+        return cls.from_values(tuple(colors[token] for token in cls.TOKENS))
+
+    @classmethod
+    def from_values(cls, values:tuple):
+        """Return the palette of this class with the given colors, in the same order of the tokens.
+        """
+        values = tuple(values)
+        if len(values) != len(cls.TOKENS) or not all(isinstance(value, str) for value in values):
+            raise ClError(
+                error=f"Argument Error: <<values>> must have {len(cls.TOKENS)} color strings"
+            )
+        palette = cls._interned.get((cls, values))
+        if palette is None:
+            palette = object.__new__(cls)
+            object.__setattr__(palette, "values", values)
+            cls._interned[(cls, values)] = palette
+        return palette
+
+    def colors(self):
+        """Return a dict with all the colors of the palette.
+        """
+        return dict(zip(self.TOKENS, self.values))
+
+    def replace(self, **colors):
+        """Return the palette of the same class with the given colors changed.
+        The derived colors that follow their base color, like 'primary_block', are computed again from the new one.
+        """
+        current = self.colors()
+        kept = dict(current)
+        for token, (base, opacity) in self.DERIVED.items():
+            derived = current[base] if opacity is None else with_opacity(opacity, current[base])
+            if token not in colors and current[token] == derived:
+                del kept[token]
+        return self.intern(dict(kept, **colors))
+
+    def dump(self):
+        """Return the palette as a dict that can be saved as JSON.
+        """
+        return {"format": self.FORMAT, "palette": self.KIND, "colors": list(self.values)}
+
+    def dumps(self):
+        """Return the palette as a compact JSON string.
+        """
+        return json.dumps(self.dump(), separators=(",", ":"))
+
+    @classmethod
+    def load(cls, data:dict|str):
+        """Return the palette saved in a dict or a JSON string by ```dump``` or ```dumps```.
+        The saved colors are used as they are, without computing the default ones again.
+        """
+        if isinstance(data, str):
+            data = json.loads(data)
+        if not isinstance(data, dict) or data.get("format") != cls.FORMAT:
+            raise ClError(
+                error=f"Theme Error: the palette must be saved in the format {cls.FORMAT}"
+            )
+        palette_class = {palette.KIND: palette for palette in ClPalette.__subclasses__()}.get(data.get("palette"))
+        if palette_class is None or not issubclass(palette_class, cls):
+            raise ClError(
+                error=f"Theme Error: '{data.get('palette')}' is not a palette of the '{cls.__name__}' class"
+            )
+        return palette_class.from_values(data.get("colors", ()))
+
+    def __setattr__(self, name, value):
+        raise ClError(
+            error="Theme Error: palettes are immutable, use 'replace' to get a palette with other colors"
+        )
+
+    def __delattr__(self, name):
+        raise ClError(
+            error="Theme Error: palettes are immutable, use 'replace' to get a palette with other colors"
+        )
+
+    def __reduce__(self):
+        # copies and pickles are interned again
+        return (type(self).from_values, (self.values,))
+
+# color tokens read by their index, from a palette or from the active palette of a theme
+def palette_token(index:int):
+    return property(lambda palette: palette.values[index])
+
+def theme_token(index:int):
+    return property(lambda theme: theme.palette.values[index])
+
+for index, token in enumerate(ClPalette.TOKENS):
+    setattr(ClPalette, token, palette_token(index))
+
+class ClLightTheme(ClPalette):
     """Represent a light set of colors to be used in Calet components
         """
-    def __init__(self, transparent = None, 
+    KIND = "light"
+    DEFAULTS = {
+        # white and black transparent colors
+        "transparent": "#00000000",
+        "transparent_05": with_opacity(0.05, "black"),
+        "transparent_1": with_opacity(0.1, "black"),
+        "transparent_3": with_opacity(0.3, "black"),
+        "transparent_5": with_opacity(0.5, "black"),
+        "transparent_8": with_opacity(0.8, "black"),
+        "transparent_inverse": with_opacity(0.8, "white"),
+        # basic colors
+        "background_one": "#006EBE",
+        "background_two": "#B4C8E6",
+        "divider": "grey100",
+        "font_one": "#363636",
+        "font_two": "#161616",
+        "font_three": "black",
+        "font_four": "white",
+        # special text colors
+        "primary": "blue",
+        "primary_hovered": "blue300",
+        "secondary": "grey700",
+        "success": "green",
+        "accept": "green",
+        "accept_hovered": "green400",
+        "error": "red",
+        "warning": "yellow",
+        "cancel": "red",
+        "cancel_hovered": "red400",
+    }
+    __slots__ = ()
+
+    def __new__(cls, transparent = None, 
             transparent_05 = None, transparent_1 = None, 
             transparent_3 = None, transparent_5 = None, transparent_8 = None,
             transparent_inverse = None,
@@ -22,45 +203,45 @@ class ClLightTheme:
             cancel = None, cancel_hovered = None,
             warning = None, warning_block = None
         ):
-        # white and black transparent colors
-        self.transparent = "#00000000" if transparent is None else transparent
-        self.transparent_05 = ft.colors.with_opacity(0.05, "black") if transparent_05 is None else transparent_05
-        self.transparent_1 = ft.colors.with_opacity(0.1, "black") if transparent_1 is None else transparent_1
-        self.transparent_3 = ft.colors.with_opacity(0.3, "black") if transparent_3 is None else transparent_3
-        self.transparent_5 = ft.colors.with_opacity(0.5, "black") if transparent_5 is None else transparent_5
-        self.transparent_8 = ft.colors.with_opacity(0.8, "black") if transparent_8 is None else transparent_8
-        self.transparent_inverse = ft.colors.with_opacity(0.8, "white") if transparent_inverse is None else transparent_inverse 
-        # basic colors
-        self.background_one = "#006EBE" if background_one is None else background_one
-        self.background_two = "#B4C8E6" if background_two is None else background_two
-        self.divider = "grey100" if divider is None else divider
-        self.font_one = "#363636" if font_one is None else font_one
-        self.font_two = "#161616" if font_two is None else font_two
-        self.font_three = "black" if font_three is None else font_three
-        self.font_four = "white" if font_four is None else font_four
-        # special text colors
-        self.primary = "blue" if primary is None else primary
-        self.primary_block = ft.colors.with_opacity(0.2, self.primary) if primary_block is None else primary_block
-        self.primary_hovered = "blue300" if primary_hovered is None else primary_hovered
-        self.secondary = "grey700" if secondary is None else secondary
-        self.secondary_block = ft.colors.with_opacity(0.2, self.secondary) if secondary_block is None else secondary_block
-        self.tonal = self.primary if tonal is None else tonal
-        self.tonal_block = self.primary_block if tonal_block is None else tonal_block
-        self.success = "green" if success is None else success
-        self.success_block = ft.colors.with_opacity(0.2, self.success) if success_block is None else success_block
-        self.accept = "green" if accept is None else accept
-        self.accept_hovered = "green400" if accept_hovered is None else accept_hovered
-        self.error = "red" if error is None else error
-        self.error_block = ft.colors.with_opacity(0.2, self.error) if error_block is None else error_block
-        self.warning = "yellow" if warning is None else warning
-        self.warning_block = ft.colors.with_opacity(0.2, self.warning) if warning_block is None else warning_block
-        self.cancel = "red" if cancel is None else cancel
-        self.cancel_hovered = "red400" if cancel_hovered is None else cancel_hovered
-
-class ClDarkTheme:
+        colors = dict(locals())
+        return cls.intern(colors)
+
+class ClDarkTheme(ClPalette):
     """Represent a dark set of colors to be used in Calet components 
         """
-    def __init__(self, transparent = None, 
+    KIND = "dark"
+    DEFAULTS = {
+        # white and black transparent colors
+        "transparent": "#00000000",
+        "transparent_05": with_opacity(0.05, "white"),
+        "transparent_1": with_opacity(0.1, "white"),
+        "transparent_3": with_opacity(0.3, "white"),
+        "transparent_5": with_opacity(0.5, "white"),
+        "transparent_8": with_opacity(0.8, "white"),
+        "transparent_inverse": with_opacity(0.8, "black"),
+        # general colors
+        "background_one": "#333333",
+        "background_two": "#404040",
+        "divider": "grey700",
+        "font_one": "#A9A9A9",
+        "font_two": "#E9E9E9",
+        "font_three": "white",
+        "font_four": "black",
+        # special colors
+        "primary": "blue",
+        "primary_hovered": "blue300",
+        "secondary": "grey",
+        "success": "green",
+        "accept": "green",
+        "accept_hovered": "green300",
+        "error": "red",
+        "cancel": "red",
+        "cancel_hovered": "red300",
+        "warning": "yellow",
+    }
+    __slots__ = ()
+
+    def __new__(cls, transparent = None, 
             transparent_05 = None, transparent_1 = None, 
             transparent_3 = None, transparent_5 = None, transparent_8 = None,
             transparent_inverse = None,
@@ -75,43 +256,15 @@ class ClDarkTheme:
             cancel = None, cancel_hovered = None,
             warning = None, warning_block = None
         ):
-        # white and black transparent colors
-        self.transparent = "#00000000" if transparent is None else transparent
-        self.transparent_05 = ft.colors.with_opacity(0.05, "white") if transparent_05 is None else transparent_05
-        self.transparent_1 = ft.colors.with_opacity(0.1, "white") if transparent_1 is None else transparent_1
-        self.transparent_3 = ft.colors.with_opacity(0.3, "white") if transparent_3 is None else transparent_3
-        self.transparent_5 = ft.colors.with_opacity(0.5, "white") if transparent_5 is None else transparent_5
-        self.transparent_8 = ft.colors.with_opacity(0.8, "white") if transparent_8 is None else transparent_8
-        self.transparent_inverse = ft.colors.with_opacity(0.8, "black") if transparent_inverse is None else transparent_inverse 
-        # general colors
-        self.background_one = "#333333" if background_one is None else background_one
-        self.background_two = "#404040" if background_two is None else background_two
-        self.divider = "grey700" if divider is None else divider
-        self.font_one = "#A9A9A9" if font_one is None else font_one
-        self.font_two = "#E9E9E9" if font_two is None else font_two
-        self.font_three = "white" if font_three is None else font_three
-        self.font_four = "black" if font_four is None else font_four
-        # special colors
-        self.primary = "blue" if primary is None else primary
-        self.primary_block = ft.colors.with_opacity(0.2, self.primary) if primary_block is None else primary_block
-        self.primary_hovered = "blue300" if primary_hovered is None else primary_hovered
-        self.secondary = "grey" if secondary is None else secondary
-        self.secondary_block = ft.colors.with_opacity(0.2, self.secondary) if secondary_block is None else secondary_block
-        self.tonal = self.primary if tonal is None else tonal
-        self.tonal_block = self.primary_block if tonal_block is None else tonal_block
-        self.success = "green" if success is None else success
-        self.success_block = ft.colors.with_opacity(0.2, self.success) if success_block is None else success_block
-        self.accept = "green" if accept is None else accept
-        self.accept_hovered = "green300" if accept_hovered is None else accept_hovered
-        self.error = "red" if error is None else error
-        self.error_block = ft.colors.with_opacity(0.2, self.error) if error_block is None else error_block
-        self.cancel = "red" if cancel is None else cancel
-        self.cancel_hovered = "red300" if cancel_hovered is None else cancel_hovered
-        self.warning = "yellow" if warning is None else warning
-        self.warning_block = ft.colors.with_opacity(0.2, self.warning) if warning_block is None else warning_block
+        colors = dict(locals())
+        return cls.intern(colors)
 
 class ClTheme:
-    
+    """Represent a colors theme of a session. It only keeps his mode and a reference to the active palette,
+    so changing the mode only changes that reference. The colors are read from the active palette, so
+    they're changed with ```upd``` and a palette from ```replace```, but custom attributes can be set.
+    """
+
     def __init__(self, on_light:ClLightTheme, on_dark:ClDarkTheme=None, mode='light'):
         """Is a colors theme to be used in all calet components.\n
         ---
@@ -150,78 +303,12 @@ class ClTheme:
         
     def to_light(self):
         self.mode = "light"
-        # white and black transparent colors
-        self.transparent = self.on_light.transparent
-        self.transparent_05 = self.on_light.transparent_05
-        self.transparent_1 = self.on_light.transparent_1
-        self.transparent_3 = self.on_light.transparent_3
-        self.transparent_5 = self.on_light.transparent_5
-        self.transparent_8 = self.on_light.transparent_8
-        self.transparent_inverse = self.on_light.transparent_inverse
-        # general colors
-        self.background_one = self.on_light.background_one
-        self.background_two = self.on_light.background_two
-        self.divider = self.on_light.divider
-        self.font_one = self.on_light.font_one
-        self.font_two = self.on_light.font_two
-        self.font_three = self.on_light.font_three
-        self.font_four = self.on_light.font_four
-        # special colors
-        self.primary = self.on_light.primary
-        self.primary_block = self.on_light.primary_block
-        self.primary_hovered = self.on_light.primary_hovered
-        self.secondary = self.on_light.secondary
-        self.secondary_block = self.on_light.secondary_block
-        self.tonal = self.on_light.tonal
-        self.tonal_block = self.on_light.tonal_block
-        self.success = self.on_light.success
-        self.success_block = self.on_light.success_block
-        self.accept = self.on_light.accept
-        self.accept_hovered = self.on_light.accept_hovered
-        self.error = self.on_light.error
-        self.error_block = self.on_light.error_block
-        self.cancel = self.on_light.cancel
-        self.cancel_hovered = self.on_light.cancel_hovered
-        self.warning = self.on_light.warning
-        self.warning_block = self.on_light.warning_block
+        self.palette = self.on_light
 
     def to_dark(self):
         self.mode = "dark"
-        # white and black transparent colors
-        self.transparent = self.on_dark.transparent
-        self.transparent_05 = self.on_dark.transparent_05
-        self.transparent_1 = self.on_dark.transparent_1
-        self.transparent_3 = self.on_dark.transparent_3
-        self.transparent_5 = self.on_dark.transparent_5
-        self.transparent_8 = self.on_dark.transparent_8
-        self.transparent_inverse = self.on_dark.transparent_inverse
-        # general colors
-        self.background_one = self.on_dark.background_one
-        self.background_two = self.on_dark.background_two
-        self.divider = self.on_dark.divider
-        self.font_one = self.on_dark.font_one
-        self.font_two = self.on_dark.font_two
-        self.font_three = self.on_dark.font_three
-        self.font_four = self.on_dark.font_four
-        # special colors
-        self.primary = self.on_dark.primary
-        self.primary_block = self.on_dark.primary_block
-        self.primary_hovered = self.on_dark.primary_hovered
-        self.secondary = self.on_dark.secondary
-        self.secondary_block = self.on_dark.secondary_block
-        self.tonal = self.on_dark.tonal
-        self.tonal_block = self.on_dark.tonal_block
-        self.success = self.on_dark.success
-        self.success_block = self.on_dark.success_block
-        self.accept = self.on_dark.accept
-        self.accept_hovered = self.on_dark.accept_hovered
-        self.error = self.on_dark.error
-        self.error_block = self.on_dark.error_block
-        self.cancel = self.on_dark.cancel
-        self.cancel_hovered = self.on_dark.cancel_hovered
-        self.warning = self.on_dark.warning
-        self.warning_block = self.on_dark.warning_block
-    
+        self.palette = self.on_dark
+
     def upd(self, on_light:ClLightTheme=None, on_dark:ClDarkTheme=None, mode:str=None):
         """Update the value of all given properties of this object.\n
         """
@@ -249,3 +336,47 @@ class ClTheme:
                 self.to_light()
             else:
                 self.to_dark()
+
+    def dump(self):
+        """Return the theme as a dict that can be saved as JSON, with his mode and the colors of his palettes.
+        """
+        return {
+            "format": ClPalette.FORMAT,
+            "mode": self.mode,
+            "light": list(self.on_light.values),
+            "dark": list(self.on_dark.values) if self.on_dark is not None else None,
+        }
+
+    def dumps(self):
+        """Return the theme as a compact JSON string.
+        """
+        return json.dumps(self.dump(), separators=(",", ":"))
+
+    @classmethod
+    def load(cls, data:dict|str):
+        """Return a new theme from a dict or a JSON string saved by ```dump``` or ```dumps```.
+        """
+        if isinstance(data, str):
+            data = json.loads(data)
+        if not isinstance(data, dict) or data.get("format") != ClPalette.FORMAT:
+            raise ClError(
+                error=f"Theme Error: the theme must be saved in the format {ClPalette.FORMAT}"
+            )
+        return cls(
+            on_light=ClLightTheme.from_values(data.get("light", ())),
+            on_dark=ClDarkTheme.from_values(data["dark"]) if data.get("dark") is not None else None,
+            mode=data.get("mode", "light")
+        )
+
+    @classmethod
+    def load_many(cls, data:list[str]|str):
+        """Return a list of new themes from a list of JSON strings saved by ```dumps```, or from a JSON array of themes.
+        All the strings are parsed together, and the themes with the same colors share their palettes.
+        """
+        if isinstance(data, list):
+            data = "[" + ",".join(data) + "]"
+        return [cls.load(theme) for theme in json.loads(data)]
+
+for index, token in enumerate(ClPalette.TOKENS):
+    setattr(ClTheme, token, theme_token(index))
+del index, token
@@ -0,0 +1,173 @@
+"""Calet: a visual components library based on Flet framework
+   - Transitions module"""
+
+import inspect
+import threading
+import time
+import flet as ft
+from calet_errors import ClError
+from calet_theme import ClTheme, ClLightTheme
+from calet_batch import ClBatch
+from calet_color import to_rgba, to_hex
+
+# animated theme mode transition
+class ClThemeTransition:
+    """Represents an animated transition of a theme between his light and dark palettes.\n
+    All the intermediate palettes are computed before the animation starts (and cached for the next
+    transitions between the same palettes), and the changes of each frame are sent to the page in
+    one single update. Frames that can't be sent in time are dropped, the last one is always sent.
+    """
+    # intermediate themes of each transition, by source palette, target palette and number of frames
+    _frames = {}
+    # components classes whose upd method receives a theme
+    _themeable = {}
+
+    def __init__(self, page:ft.Page, theme:ClTheme, roots:list[ft.Control], mode:str=None, frames:int=8, duration:float=0.25):
+        """Use this properties to personalize the transition:\n
+        ---
+        - page: is the Flet page of the repainted components.
+        - theme: is the ```calet_theme.ClTheme``` object whose mode will change.
+        - roots: is a list of Calet components or Flet controls, all the Calet components inside them are repainted.
+        - mode: is the mode at the end of the transition. Can be 'light' or 'dark'. If it isn't given, the opposite of the current mode is used.
+        - frames: is the number of frames of the animation, the last one included.
+        - duration: is the duration of the animation in seconds.
+        """
+        # VALIDATION BLOCK
+        if not isinstance(page, ft.Page):
+            raise ClError(
+                error="Argument Error: <<page>> must be an instance of 'flet.Page' class"
+            )
+        if not isinstance(theme, ClTheme):
+            raise ClError(
+                error="Argument Error: <<theme>> must be an instance of 'calet_theme.ClTheme' Calet class"
+            )
+        if not isinstance(roots, list) or not all(isinstance(root, ft.Control) for root in roots):
+            raise ClError(
+                error="Argument Error: <<roots>> must be a list of Calet components or Flet controls"
+            )
+        if mode is not None and mode not in ("light", "dark"):
+            raise ClError(
+                error="Argument Error: <<mode>> must be 'light' or 'dark'"
+            )
+        if not isinstance(frames, int) or frames < 1:
+            raise ClError(
+                error="Argument Error: <<frames>> must be an integer greater than 0"
+            )
+        if not isinstance(duration, (int, float)) or duration < 0:
+            raise ClError(
+                error="Argument Error: <<duration>> must be a positive number"
+            )
+        # INITIALIZATION BLOCK
+        self.page = page
+        self.theme = theme
+        self.roots = roots
+        self.mode = mode if mode is not None else ("dark" if theme.mode == "light" else "light")
+        if theme.on_dark is None:
+            self.mode = "light"
+        self.frames = frames
+        self.duration = duration
+        self.sent = 0
+        self.dropped = 0
+        self.cancelled = False
+        self.thread = None
+
+    @staticmethod
+    def parse(color:str):
+        # colors that can't be interpolated, like the Flet theme colors 'primary' or 'surface', switch at once
+        try:
+            return to_rgba(color)
+        except ClError:
+            return None
+
+    @classmethod
+    def interpolate(cls, source, target, frames:int):
+        """Return the intermediate themes between two palettes, without the target one.
+        Colors that can't be parsed take the target color in all the intermediate themes.
+        """
+        key = (source, target, frames)
+        themes = cls._frames.get(key)
+        if themes is None:
+            source_colors = [cls.parse(color) for color in source.values]
+            target_colors = [cls.parse(color) for color in target.values]
+            themes = []
+            for frame in range(1, frames):
+                progress = frame / frames
+                palette = ClLightTheme(**{
+                    token: target_color if source_rgba is None or target_rgba is None else
+                    to_hex(*(start + (end - start) * progress for start, end in zip(source_rgba, target_rgba)))
+                    for token, source_rgba, target_rgba, target_color in zip(source.TOKENS, source_colors, target_colors, target.values)
+                })
+                themes.append(ClTheme(on_light=palette))
+            themes = tuple(themes)
+            # only the most recent transitions are kept
+            if len(cls._frames) >= 16:
+                del cls._frames[next(iter(cls._frames))]
+            cls._frames[key] = themes
+        return themes
+
+    @classmethod
+    def components(cls, roots:list[ft.Control]):
+        """Return all the mounted Calet components inside the given controls whose ```upd``` receives a theme.
+        """
+        found = []
+        seen = set()
+        pending = list(reversed(roots))
+        while pending:
+            control = pending.pop()
+            if id(control) in seen:
+                continue
+            seen.add(id(control))
+            component = type(control)
+            if component not in cls._themeable:
+                upd = getattr(component, "upd", None)
+                cls._themeable[component] = upd is not None and "theme" in inspect.signature(upd).parameters
+            if cls._themeable[component] and control.page is not None:
+                found.append(control)
+            pending.extend(reversed(control._get_children()))
+        return found
+
+    def paint(self, theme:ClTheme, components:list):
+        with ClBatch(self.page):
+            for component in components:
+                component.upd(theme=theme)
+
+    def run(self):
+        """Run the transition in the current thread and return when the last frame is sent.
+        """
+        target = self.theme.on_dark if self.mode == "dark" else self.theme.on_light
+        themes = self.interpolate(self.theme.palette, target, self.frames) if target is not self.theme.palette else ()
+        components = self.components(self.roots)
+        frame_time = self.duration / self.frames
+        start = time.perf_counter()
+        for frame, theme in enumerate(themes, start=1):
+            if self.cancelled:
+                break
+            deadline = start + frame * frame_time
+            if time.perf_counter() > deadline:
+                # late frame, the next one is closer to the end of the transition
+                self.dropped += 1
+                continue
+            self.paint(theme, components)
+            self.sent += 1
+            delay = deadline - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        # the real theme always ends the transition, in his new mode
+        if self.mode == "dark":
+            self.theme.to_dark()
+        else:
+            self.theme.to_light()
+        self.paint(self.theme, components)
+        self.sent += 1
+
+    def start(self):
+        """Run the transition in a new thread and return immediately.
+        """
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+        return self.thread
+
+    def cancel(self):
+        """Stop the animation, the theme is changed to his new mode in the next frame.
+        """
+        self.cancelled = True
@@ -0,0 +1,194 @@
+"""Calet: a visual components library based on Flet framework
+   - Theme files module"""
+
+import json
+import os
+import threading
+import weakref
+import flet as ft
+from calet_errors import ClError
+from calet_theme import ClPalette, ClLightTheme, ClDarkTheme, ClTheme
+from calet_batch import ClBatch
+from calet_transition import ClThemeTransition
+
+# hot reloadable theme file
+class ClThemeFile:
+    """Represents a local JSON file with the colors of a light and a dark palette, that is watched for changes.\n
+    When the file changes, his palettes are loaded again, the changed tokens are found, and only the
+    Calet components that paint any of those tokens are repainted, in every page attached to the file.
+    The file can be saved by ```ClTheme.dumps``` or written by hand, like ```{"light": {"primary": "red"}, "dark": {}}```.
+    """
+    # color tokens painted by each components class, joined from the ```TOKENS``` of his classes
+    _tokens = {}
+
+    def __init__(self, path:str, interval:float=0.5):
+        """Use this properties to personalize the theme file:\n
+        ---
+        - path: is the path of the JSON file.
+        - interval: is the time in seconds between two checks of the file.
+        """
+        # VALIDATION BLOCK
+        if not isinstance(path, str):
+            raise ClError(
+                error="Argument Error: <<path>> must be string"
+            )
+        if not isinstance(interval, (int, float)) or interval <= 0:
+            raise ClError(
+                error="Argument Error: <<interval>> must be a number greater than 0"
+            )
+        # INITIALIZATION BLOCK
+        self.path = path
+        self.interval = interval
+        self.pages = weakref.WeakKeyDictionary()
+        self.error = None
+        self.stamp = None
+        self.thread = None
+        self.stopped = threading.Event()
+        self.light, self.dark = self.load()
+        self.stamp = self.file_stamp()
+
+    def file_stamp(self):
+        try:
+            status = os.stat(self.path)
+        except OSError:
+            return None
+        return (status.st_mtime_ns, status.st_size)
+
+    def load(self):
+        """Read the file and return his light and dark palettes.
+        """
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                data = json.load(file)
+        except (OSError, ValueError) as e:
+            raise ClError(
+                error=f"Theme Error: '{self.path}' can not be read as a JSON theme file ({e})"
+            )
+        if not isinstance(data, dict):
+            raise ClError(
+                error=f"Theme Error: '{self.path}' must contain a JSON object"
+            )
+        if "format" in data:
+            theme = ClTheme.load(data)
+            return theme.on_light, theme.on_dark
+        palettes = []
+        for kind, palette_class in (("light", ClLightTheme), ("dark", ClDarkTheme)):
+            colors = data.get(kind, {})
+            if colors is None and kind == "dark":
+                palettes.append(None)
+                continue
+            if not isinstance(colors, dict):
+                raise ClError(
+                    error=f"Theme Error: '{kind}' must be an object of color tokens in '{self.path}'"
+                )
+            unknown = set(colors) - set(ClPalette.TOKENS)
+            if unknown:
+                raise ClError(
+                    error=f"Theme Error: unknown color tokens in '{self.path}': {', '.join(sorted(unknown))}"
+                )
+            palettes.append(palette_class(**colors))
+        return tuple(palettes)
+
+    def theme(self, mode:str="light"):
+        """Return a new ```calet_theme.ClTheme``` with the palettes of the file, in the given mode.
+        """
+        return ClTheme(on_light=self.light, on_dark=self.dark, mode=mode)
+
+    def attach(self, page:ft.Page, theme:ClTheme, roots:list[ft.Control]):
+        """Repaint the Calet components inside ```roots``` in the given page every time the file changes.
+        The palettes of ```theme``` are replaced by the new ones, keeping his mode.
+        """
+        if not isinstance(page, ft.Page):
+            raise ClError(
+                error="Argument Error: <<page>> must be an instance of 'flet.Page' class"
+            )
+        if not isinstance(theme, ClTheme):
+            raise ClError(
+                error="Argument Error: <<theme>> must be an instance of 'calet_theme.ClTheme' Calet class"
+            )
+        self.pages.setdefault(page, []).append((theme, roots))
+        # the tokens table is read now, so the first reload is as fast as the next ones
+        for component in ClThemeTransition.components(roots):
+            self.tokens(type(component))
+
+    def detach(self, page:ft.Page):
+        self.pages.pop(page, None)
+
+    @classmethod
+    def tokens(cls, component:type):
+        """Return the set of color tokens that the given components class paints from his theme.\n
+        Every Calet class declares the tokens its own code paints in ```TOKENS```, and a class paints the tokens
+        of all his bases. Classes of the Calet modules that don't declare them repaint with every change.
+        """
+        tokens = cls._tokens.get(component)
+        if tokens is None:
+            tokens = set()
+            for base in component.__mro__:
+                if "TOKENS" in vars(base):
+                    tokens |= set(base.TOKENS)
+                elif base.__module__.startswith("calet") and issubclass(base, ft.Control):
+                    tokens |= set(ClPalette.TOKENS)
+            cls._tokens[component] = tokens
+        return tokens
+
+    def check(self):
+        """Check the file once, and reload it and repaint the attached pages if it changed.
+        Return the set of changed tokens.
+        """
+        stamp = self.file_stamp()
+        if stamp == self.stamp:
+            return set()
+        self.stamp = stamp
+        try:
+            light, dark = self.load()
+        except ClError as e:
+            # a file saved in the middle of an edit, the old palettes are kept until it's fixed
+            self.error = e.error
+            return set()
+        self.error = None
+        changed = {
+            token for token, old, new in zip(ClPalette.TOKENS, self.light.values, light.values) if old != new
+        } | {
+            token for token, old, new in zip(
+                ClPalette.TOKENS,
+                self.dark.values if self.dark is not None else (),
+                dark.values if dark is not None else ()
+            ) if old != new
+        }
+        if (self.dark is None) != (dark is None):
+            changed = set(ClPalette.TOKENS)
+        self.light, self.dark = light, dark
+        if changed:
+            self.repaint(changed)
+        return changed
+
+    def repaint(self, changed:set):
+        for page, attached in list(self.pages.items()):
+            with ClBatch(page):
+                for theme, roots in attached:
+                    theme.on_light = self.light
+                    theme.on_dark = self.dark
+                    if theme.mode == "dark" and self.dark is not None:
+                        theme.to_dark()
+                    else:
+                        theme.to_light()
+                    for component in ClThemeTransition.components(roots):
+                        if self.tokens(type(component)) & changed:
+                            component.upd(theme=theme)
+
+    def watch(self):
+        """Check the file every ```interval``` seconds in the current thread, until ```stop``` is called.
+        """
+        self.stopped.clear()
+        while not self.stopped.wait(self.interval):
+            self.check()
+
+    def start(self):
+        """Watch the file in a new thread and return immediately.
+        """
+        self.thread = threading.Thread(target=self.watch, daemon=True)
+        self.thread.start()
+        return self.thread
+
+    def stop(self):
+        self.stopped.set()
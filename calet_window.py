@@ -0,0 +1,145 @@
+"""Calet: a visual components library based on Flet framework
+   - Window module"""
+
+import threading
+import time
+import weakref
+import flet as ft
+from calet_errors import ClError
+
+# window state controller
+class ClWindowController:
+    """Represents a page level controller of the window state, shared by all the window buttons of the page.\n
+    Window operations are coalesced: the first one is sent at once, and the ones requested during the next
+    ```debounce``` seconds are merged into one single page update with the final state, so fast toggles
+    never send intermediate states. The icons of all the maximize buttons follow the real window state,
+    changed by the buttons or by the user, in the same update.
+    """
+    # icon and action of the maximize buttons in each window state
+    MAXIMIZE_ICONS = {False: (ft.icons.SQUARE_OUTLINED, "maximize"), True: (ft.icons.SQUARE, "unmaximize")}
+    # window events that change the maximized state
+    WINDOW_EVENTS = {"maximize": True, "unmaximize": False}
+    # one controller for each live page
+    _controllers = weakref.WeakKeyDictionary()
+
+    def __init__(self, page:ft.Page, debounce:float=0.15):
+        """Use ```ClWindowController.of(page)``` instead of this constructor to get the controller of a page.\n
+        ---
+        - page: is the Flet page whose window is controlled.
+        - debounce: is the time in seconds during which new operations are merged with the last sent one.
+        """
+        # VALIDATION BLOCK
+        if not isinstance(page, ft.Page):
+            raise ClError(
+                error="Argument Error: <<page>> must be an instance of 'flet.Page' class"
+            )
+        if not isinstance(debounce, (int, float)) or debounce < 0:
+            raise ClError(
+                error="Argument Error: <<debounce>> must be a positive number"
+            )
+        # INITIALIZATION BLOCK
+        self.page = page
+        self.debounce = debounce
+        self.buttons = weakref.WeakSet()
+        self.maximized = bool(page.window_maximized)
+        self.minimized = False
+        self.sent = 0.0
+        self.timer = None
+        self.lock = threading.Lock()
+        # subscribed next to the window events handlers of the app
+        self.page.on_window_event = self.window_changed
+
+    @classmethod
+    def of(cls, page:ft.Page):
+        """Return the window controller of the given page, creating it the first time.
+        """
+        if not isinstance(page, ft.Page):
+            raise ClError(
+                error="Argument Error: <<page>> must be an instance of 'flet.Page' class"
+            )
+        controller = cls._controllers.get(page)
+        if controller is None:
+            controller = cls(page)
+            cls._controllers[page] = controller
+        return controller
+
+    def register(self, button):
+        """Register a maximize window button, his icon will follow the window state. Registering it again does nothing else.
+        Return True if his icon was changed to show the current state.
+        """
+        self.buttons.add(button)
+        return self.paint(button)
+
+    def unregister(self, button):
+        self.buttons.discard(button)
+
+    def paint(self, button):
+        # returns True if the icon of the button changed
+        icon, winaction = self.MAXIMIZE_ICONS[self.maximized]
+        button.winaction = winaction
+        button.icon = icon
+        if getattr(button, "button", None) is None or button.button.icon == icon:
+            return False
+        button.button.icon = icon
+        return True
+
+    def request(self, operation:str):
+        """Request a window operation: 'close', 'minimize', 'maximize', 'unmaximize' or 'toggle' (maximize or unmaximize).
+        """
+        if operation not in ("close", "minimize", "maximize", "unmaximize", "toggle"):
+            raise ClError(
+                error="Argument Error: <<operation>> must be 'close', 'minimize', 'maximize', 'unmaximize' or 'toggle'"
+            )
+        if operation == "close":
+            with self.lock:
+                if self.timer is not None:
+                    self.timer.cancel()
+                    self.timer = None
+            self.page.window_destroy()
+            return
+        with self.lock:
+            if operation == "minimize":
+                self.minimized = True
+            else:
+                self.maximized = not self.maximized if operation == "toggle" else operation == "maximize"
+            if self.timer is not None:
+                # merged with the operation already waiting
+                return
+            delay = self.sent + self.debounce - time.monotonic()
+            if delay > 0:
+                self.timer = threading.Timer(delay, self.flush)
+                self.timer.daemon = True
+                self.timer.start()
+                return
+        self.flush()
+
+    def flush(self):
+        """Send the requested window state and the icons of the maximize buttons in one single page update.
+        """
+        with self.lock:
+            self.timer = None
+            self.sent = time.monotonic()
+            changed = []
+            if bool(self.page.window_maximized) != self.maximized or self.minimized:
+                self.page.window_maximized = self.maximized
+                if self.minimized:
+                    self.minimized = False
+                    self.page.window_minimized = True
+                changed.append(self.page)
+            # buttons are isolated controls, the page update doesn't include them unless they're given
+            changed.extend(button.button for button in list(self.buttons) if self.paint(button))
+        if changed:
+            self.page.update(*changed)
+
+    def window_changed(self, e:ft.ControlEvent):
+        # the window state was changed by the user, like a double tap in the title bar
+        maximized = self.WINDOW_EVENTS.get(e.data)
+        if maximized is not None:
+            with self.lock:
+                waiting = self.timer is not None
+                if not waiting:
+                    self.maximized = maximized
+                    self.page.window_maximized = maximized
+                    changed = [button.button for button in list(self.buttons) if self.paint(button)]
+            if not waiting and changed:
+                self.page.update(*changed)
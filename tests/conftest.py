@@ -0,0 +1,44 @@
+import os
+import sys
+from types import SimpleNamespace
+import pytest
+import flet as ft
+from flet_core.connection import Connection
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# connection that records the sent commands instead of talking to a Flet client
+class FakeConnection(Connection):
+    def __init__(self):
+        super().__init__()
+        self.sent = []
+        self.ids = 0
+
+    def send_commands(self, session_id, commands):
+        self.sent.append(commands)
+        results = []
+        for command in commands:
+            if command.name == "add":
+                ids = []
+                for _ in range(len(command.commands) if command.commands else 1):
+                    self.ids += 1
+                    ids.append(f"_{self.ids}")
+                results.append(" ".join(ids))
+        return SimpleNamespace(results=results)
+
+    def send_command(self, session_id, command):
+        self.sent.append([command])
+        return SimpleNamespace(result="", error="")
+
+@pytest.fixture
+def connection():
+    return FakeConnection()
+
+@pytest.fixture
+def page(connection):
+    return ft.Page(connection, "session")
+
+@pytest.fixture
+def theme():
+    from calet_theme import ClTheme, ClLightTheme
+    return ClTheme(on_light=ClLightTheme())
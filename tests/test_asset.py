@@ -0,0 +1,78 @@
+import base64
+from concurrent.futures import Future
+import pytest
+import calet_asset
+from calet_asset import ClAssetCache
+from calet_bar import ClAppBar
+from calet_errors import ClError
+
+PNG = base64.b64decode(ClAssetCache.PLACEHOLDER)
+
+def test_extensions_are_checked(tmp_path):
+    for name in ("icon.jpg", "icon.JPEG", "icon.png"):
+        path = tmp_path / name
+        path.write_bytes(PNG)
+        ClAssetCache.check(str(path))
+    path = tmp_path / "icon.notpng"
+    path.write_bytes(PNG)
+    with pytest.raises(ClError):
+        ClAssetCache.check(str(path))
+
+def test_invalid_icon_is_rejected_at_construction(tmp_path, theme):
+    with pytest.raises(ClError):
+        ClAppBar(theme, "App", [], left_icon=str(tmp_path / "missing.png"))
+    path = tmp_path / "fake.png"
+    path.write_bytes(b"not an image")
+    with pytest.raises(ClError):
+        ClAppBar(theme, "App", [], left_icon=str(path))
+
+def test_thumbnail_is_served_as_base64(tmp_path):
+    pytest.importorskip("PIL")
+    path = tmp_path / "icon.png"
+    path.write_bytes(PNG)
+    cache = ClAssetCache(folder=str(tmp_path / "cache"))
+    assert base64.b64decode(cache.submit(str(path), 20).result()).startswith(b"\x89PNG")
+
+def test_icon_keeps_his_path_without_pillow(tmp_path, monkeypatch, page, theme):
+    path = tmp_path / "icon.png"
+    path.write_bytes(PNG)
+    monkeypatch.setattr(calet_asset, "image_library", lambda: None)
+    assert ClAssetCache(folder=str(tmp_path / "cache")).thumbnail(str(path), 20) is None
+    bar = ClAppBar(theme, "App", [], left_icon=str(path))
+    page.add(bar)
+    # the full size image is never sent as base64
+    assert bar.left_icon_future is None
+    assert bar.app_icon.src == str(path) and not bar.app_icon.src_base64
+
+def test_icon_is_swapped_when_ready(tmp_path, monkeypatch, page, connection, theme):
+    path = tmp_path / "icon.png"
+    path.write_bytes(PNG)
+    future = Future()
+    monkeypatch.setattr(ClAssetCache, "thumbnails", classmethod(lambda cls: True))
+    monkeypatch.setattr(ClAssetCache, "submit", lambda self, path, size: future)
+    bar = ClAppBar(theme, "App", [], left_icon=str(path))
+    # the bar is built without waiting for the image
+    page.add(bar)
+    assert bar.app_icon.src_base64 == ClAssetCache.PLACEHOLDER
+    connection.sent.clear()
+    future.set_result("aWNvbg==")
+    assert bar.app_icon.src_base64 == "aWNvbg=="
+    assert len(connection.sent) == 1
+
+def test_failed_icon_is_reported_once(tmp_path, monkeypatch, page, theme):
+    path = tmp_path / "icon.png"
+    path.write_bytes(PNG)
+    future = Future()
+    errors = []
+    monkeypatch.setattr(ClAssetCache, "thumbnails", classmethod(lambda cls: True))
+    monkeypatch.setattr(ClAssetCache, "submit", lambda self, path, size: future)
+    monkeypatch.setattr(ClAssetCache.default(), "on_error", lambda path, error: errors.append((path, error)))
+    bar = ClAppBar(theme, "App", [], left_icon=str(path))
+    page.add(bar)
+    page.remove(bar)
+    page.add(bar)
+    future.set_exception(ValueError("broken"))
+    # the callback is added once, the error is a ClError and the client gets the path
+    assert len(errors) == 1
+    assert errors[0][0] == str(path) and isinstance(errors[0][1], ClError)
+    assert bar.app_icon.src == str(path) and not bar.app_icon.src_base64
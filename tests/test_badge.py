@@ -0,0 +1,43 @@
+import threading
+import time
+import pytest
+from calet_badge import ClBadgeFlusher
+from calet_button import ClMarkTab, ClNavTab
+from calet_errors import ClError
+
+def test_fast_badges_are_coalesced(page, connection, theme):
+    tabs = [ClNavTab(theme, text="One"), ClNavTab(theme, text="Two")]
+    page.add(*tabs)
+    ClBadgeFlusher.of(page).interval = 0.05
+    connection.sent.clear()
+    for value in range(1, 11):
+        for tab in tabs:
+            tab.set_badge(value)
+    # the first badge is sent at once, the rest of the values are merged into one single update
+    assert len(connection.sent) == 1
+    time.sleep(0.2)
+    assert len(connection.sent) == 2
+    assert [tab.badge_control.text for tab in tabs] == ["10", "10"]
+
+def test_badge_follows_an_async_stream(page, theme):
+    tab = ClNavTab(theme, text="One")
+    page.add(tab)
+    async def stream():
+        for value in (3, 150):
+            yield value
+    ClBadgeFlusher.follow(tab, stream()).result(timeout=2)
+    time.sleep(0.3)
+    assert tab.badge_control.text == "99+"
+
+def test_mark_tab_rejects_badges(theme):
+    with pytest.raises(ClError):
+        ClMarkTab(theme, text="One").set_badge(3)
+
+def test_one_flusher_is_created_for_each_page(page):
+    flushers = []
+    threads = [threading.Thread(target=lambda: flushers.append(ClBadgeFlusher.of(page))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all(flusher is flushers[0] for flusher in flushers)
@@ -0,0 +1,65 @@
+import threading
+import flet as ft
+from calet_batch import ClBatch
+
+def test_batch_sends_one_update(page, connection):
+    texts = [ft.Text(value=str(i)) for i in range(3)]
+    page.add(*texts)
+    connection.sent.clear()
+    with ClBatch(page):
+        for text in texts:
+            text.value = "changed"
+            text.update()
+        with ClBatch(page):
+            texts[0].value = "nested"
+            texts[0].update()
+        assert connection.sent == []
+    assert len(connection.sent) == 1
+
+def test_batch_ignores_updates_of_other_threads(page, connection):
+    texts = [ft.Text(value="a"), ft.Text(value="b")]
+    page.add(*texts)
+    connection.sent.clear()
+    opened, sent = threading.Event(), threading.Event()
+
+    def other_thread():
+        opened.wait()
+        texts[1].value = "other"
+        texts[1].update()
+        sent.set()
+
+    thread = threading.Thread(target=other_thread)
+    thread.start()
+    with ClBatch(page):
+        texts[0].value = "batched"
+        texts[0].update()
+        opened.set()
+        assert sent.wait(2)
+        # the other thread was not recorded by this batch
+        assert len(connection.sent) == 1
+    thread.join()
+    assert len(connection.sent) == 2
+
+def test_batches_in_two_threads_are_independent(page, connection):
+    texts = [ft.Text(value="a"), ft.Text(value="b")]
+    page.add(*texts)
+    connection.sent.clear()
+    barrier = threading.Barrier(2)
+
+    def batched(text):
+        with ClBatch(page):
+            text.value = "changed"
+            text.update()
+            barrier.wait(2)
+        barrier.wait(2)
+
+    threads = [threading.Thread(target=batched, args=(text,)) for text in texts]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(connection.sent) == 2
+    # the page update goes back to Flet outside the batches
+    texts[0].value = "sent"
+    texts[0].update()
+    assert len(connection.sent) == 3
@@ -0,0 +1,25 @@
+from calet_button import ClRadio, ClRadioGroup
+
+def radios(theme):
+    return [ClRadio(theme, value=value, label=value) for value in ("a", "b", "c")]
+
+def test_radio_group_is_selected_before_mounting(page, connection, theme):
+    group = ClRadioGroup(theme, radios(theme))
+    group.select("b")
+    group.upd(enabled=False)
+    assert connection.sent == []
+    page.add(group)
+    assert group.group.value == "b"
+    assert all(not radio.enabled for radio in group.radios)
+
+def test_radio_group_selection_is_cleared(page, connection, theme):
+    group = ClRadioGroup(theme, radios(theme), value="a")
+    page.add(group)
+    connection.sent.clear()
+    group.upd(value=None)
+    assert group.value is None and group.selected() is None
+    assert len(connection.sent) == 1
+    # without value, the selection is kept
+    group.select("c")
+    group.upd(enabled=True)
+    assert group.value == "c"
@@ -0,0 +1,12 @@
+import pytest
+from calet_color import normalize, to_rgba
+from calet_errors import ClError
+
+def test_hex_codes_need_the_hash():
+    assert to_rgba("#ADD") == to_rgba("#AADDDD")
+    assert to_rgba("#80FF0000") == (1.0, 0.0, 0.0, 128 / 255)
+    for name in ("bad", "add", "faded", "ffffff"):
+        with pytest.raises(ClError):
+            to_rgba(name)
+    # names that Calet can't parse are left to Flet
+    assert normalize("faded") == "faded"
@@ -0,0 +1,111 @@
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+from calet_button import ClCheck
+from calet_template import ClTemplate
+from calet_list import ClCheckList, ClVirtualList
+from calet_source import ClPagedSource
+
+def scroll(virtual_list, pixels):
+    virtual_list.scrolled(SimpleNamespace(pixels=pixels, viewport_dimension=400))
+
+def labels(virtual_list):
+    return [virtual_list.rows[index].content.label for index in sorted(virtual_list.rows)]
+
+def wait(condition, timeout=2):
+    # the async sources are read in the loop thread
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+def test_only_the_window_is_rendered(page, theme):
+    items = [f"row {i}" for i in range(20000)]
+    virtual_list = ClVirtualList(theme, ClTemplate(ClCheck, theme=theme), items, row=lambda item: {"label": item}, height=400)
+    page.add(virtual_list)
+    assert virtual_list.window == (0, 20)
+    assert len(virtual_list.stack.controls) == 20
+    assert virtual_list.stack.height == 20000 * 40
+
+def test_scrolled_rows_are_recycled_in_place(page, connection, theme):
+    items = [f"row {i}" for i in range(1000)]
+    virtual_list = ClVirtualList(theme, ClTemplate(ClCheck, theme=theme), items, row=lambda item: {"label": item}, height=400)
+    page.add(virtual_list)
+    slots = list(virtual_list.stack.controls)
+    connection.sent.clear()
+    scroll(virtual_list, 400)
+    assert virtual_list.window == (5, 25)
+    assert labels(virtual_list) == items[5:25]
+    # one update, and the rows are never removed and added again, only their content is built again
+    assert len(connection.sent) == 1
+    removed = {uid for command in connection.sent[0] if command.name == "remove" for uid in command.values}
+    assert not removed & {control.uid for slot in slots for control in (slot, slot.content)}
+    assert virtual_list.stack.controls == slots
+    scroll(virtual_list, 20000)
+    assert labels(virtual_list) == items[495:515]
+    # recycled rows keep their page and can be clicked
+    check = virtual_list.rows[500].content
+    check.check.value = True
+    check.b_changed(SimpleNamespace(control=check.check))
+    assert check.page is page
+
+def test_iterator_is_pulled_by_chunks(page, theme):
+    source = ({"label": f"row {i}"} for i in range(1000))
+    virtual_list = ClVirtualList(theme, ClTemplate(ClCheck, theme=theme), source, height=400, chunk=50)
+    page.add(virtual_list)
+    assert len(virtual_list.items) == 50
+    for pixels in range(0, 4000, 400):
+        scroll(virtual_list, pixels)
+    assert len(virtual_list.items) == 150
+    assert not virtual_list.exhausted
+
+def test_async_source_grows_while_scrolling(page, theme):
+    async def source():
+        for i in range(120):
+            yield {"label": f"row {i}"}
+    virtual_list = ClVirtualList(theme, ClTemplate(ClCheck, theme=theme), source(), height=400, chunk=50)
+    page.add(virtual_list)
+    # the first chunk is pulled once the list is built and rendered from the loop thread
+    wait(lambda: virtual_list.window == (0, 20))
+    assert len(virtual_list.items) == 50
+    assert labels(virtual_list) == [f"row {i}" for i in range(20)]
+    scroll(virtual_list, 1200)
+    wait(lambda: virtual_list.stack.height == 100 * 40)
+    scroll(virtual_list, 4000)
+    wait(lambda: virtual_list.window == (95, 115))
+    assert virtual_list.exhausted and len(virtual_list.items) == 120
+    assert labels(virtual_list) == [f"row {i}" for i in range(95, 115)]
+
+def test_paged_source_fills_the_placeholders_in_one_update(page, connection, theme):
+    release = threading.Event()
+    async def fetch(number, page_size):
+        while not release.is_set():
+            await asyncio.sleep(0.01)
+        return [{"label": f"row {i}"} for i in range(number * page_size, min(15, (number + 1) * page_size))]
+    source = ClPagedSource(fetch, page_size=20, prefetch=0)
+    virtual_list = ClVirtualList(theme, ClTemplate(ClCheck, theme=theme), source, height=400)
+    page.add(virtual_list)
+    # one page is displayed with placeholders while it's fetched
+    assert len(virtual_list.rows) == 20 and virtual_list.waiting == set(range(20))
+    slots = list(virtual_list.stack.controls)
+    connection.sent.clear()
+    release.set()
+    wait(lambda: source.total is not None and not virtual_list.waiting and connection.sent)
+    time.sleep(0.1)
+    # the page is short, so the list shrinks to his items in the same update
+    assert len(connection.sent) == 1
+    assert labels(virtual_list) == [f"row {i}" for i in range(15)]
+    assert virtual_list.stack.controls == slots
+
+def test_check_toggle_is_sent_in_one_update(page, connection, theme):
+    checks = [ClCheck(theme, label=f"item {i}") for i in range(3)]
+    check_list = ClCheckList(theme, checks)
+    page.add(check_list)
+    connection.sent.clear()
+    checks[1].check.value = True
+    checks[1].b_changed(SimpleNamespace(control=checks[1].check))
+    # the check and the header of the list go together
+    assert len(connection.sent) == 1
+    assert check_list.get_checked() == [1]
+    assert check_list.count_label.value == "1 selected"
@@ -0,0 +1,22 @@
+from calet_button import ClCheck
+from calet_list import ClCheckList
+from calet_memory import ClMemoryProfile
+
+def checks(theme):
+    return ClCheckList(theme, [ClCheck(theme, label=f"item {i}") for i in range(3)])
+
+def test_small_tree_is_profiled_by_component(theme):
+    root = checks(theme)
+    report = ClMemoryProfile(root).report()
+    counter = report["components"]["ClCheck"]
+    assert counter["instances"] == 3 and counter["built"] == 3
+    assert counter["flet_controls"] > 0 and counter["bytes"] > 0
+    assert report["total_controls"] == sum(control["instances"] for control in report["controls"].values())
+    # the tree is built in place by the profile
+    assert root.controls
+
+def test_tree_is_profiled_without_building_it(theme):
+    root = checks(theme)
+    report = ClMemoryProfile(root, build=False).report()
+    assert report["components"]["ClCheck"]["built"] == 0
+    assert not root.controls
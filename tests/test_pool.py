@@ -0,0 +1,29 @@
+import pytest
+from calet_button import ClCheck, ClFilterButton
+from calet_errors import ClError
+from calet_pool import ClPool
+
+def test_released_components_are_reused_with_their_properties_reset(page, theme):
+    pool = ClPool.of(page)
+    check = pool.acquire(ClCheck, theme=theme, label="One", value=True)
+    page.add(check)
+    with pytest.raises(ClError):
+        pool.release(check)
+    page.remove(check)
+    pool.release(check, check)
+    assert len(pool) == 1
+    again = pool.acquire(ClCheck, theme=theme, label="Two")
+    # the same component, with the new label and the default value
+    assert again is check
+    assert again.label == "Two" and again.value is False
+    page.add(again)
+    assert again.check_label.value == "Two"
+    assert pool.stats(ClCheck)["reuse_rate"] == 0.5
+
+def test_components_with_other_properties_are_constructed(theme):
+    pool = ClPool(size=1)
+    pool.release(ClFilterButton(theme, text="One", rounded=False), ClFilterButton(theme, text="Two"))
+    assert pool.stats()["dropped"] == 1
+    button = pool.acquire(ClFilterButton, theme=theme, text="Three")
+    # 'rounded' can't be reset, so the pooled button is kept for a later acquire
+    assert button.rounded and len(pool) == 1
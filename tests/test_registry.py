@@ -0,0 +1,27 @@
+import gc
+from calet_button import ClTextButton
+from calet_registry import ClRegistry
+
+def test_controls_are_found_by_key_and_pattern(page, connection, theme):
+    registry = ClRegistry.of(page)
+    buttons = [registry.register(f"filters.{i}", ClTextButton(theme, text=str(i))) for i in range(3)]
+    save = registry.register("save", ClTextButton(theme, text="Save"))
+    page.add(*buttons)
+    assert registry.get("filters.1") is buttons[1] and registry.get("save") is save
+    assert list(registry.find("filters.*").values()) == buttons
+    connection.sent.clear()
+    # every matching control is updated in one single page update
+    assert registry.upd("filters.*", enabled=False) == 3
+    assert len(connection.sent) == 1
+    assert not any(button.enabled for button in buttons)
+
+def test_controls_are_removed_by_key_and_when_collected(theme):
+    registry = ClRegistry()
+    kept = registry.register("kept", ClTextButton(theme, text="Kept"))
+    registry.register("dropped", ClTextButton(theme, text="Dropped"))
+    gc.collect()
+    assert "dropped" not in registry and len(registry) == 1
+    registry.unregister("kept")
+    registry.unregister("kept")
+    assert registry.get("kept") is None and len(registry) == 0
+    assert kept.text == "Kept"
@@ -0,0 +1,56 @@
+from calet_bar import ClAppBar, ClNavBar
+from calet_button import ClMarkTab, ClNavTab, ClWinButton
+from calet_render import ClRenderProfile
+from calet_shortcut import ClShortcutDispatcher
+from calet_window import ClWindowController
+
+def commands(connection):
+    return [command.name for batch in connection.sent for command in batch]
+
+def test_switch_keeps_the_shortcuts_of_the_tabs(page, connection, theme):
+    profile = ClRenderProfile.of(page)
+    tabs = [ClNavTab(theme, text="One", shortcut="ctrl+1"), ClMarkTab(theme, text="Two", shortcut="ctrl+2")]
+    bar = ClNavBar(theme, tabs, render_profile=profile)
+    page.add(bar)
+    # the tabs are built with the profile of the bar, mounting them only sends the page keyboard handler
+    assert len(connection.sent) == 2
+    connection.sent.clear()
+    profile.switch("minimal")
+    assert len(connection.sent) == 1
+    assert "remove" not in commands(connection) and "add" not in commands(connection)
+    assert tabs[0].button.animate is None
+    assert tabs[1].button.gradient is None and tabs[1].button.bgcolor == theme.background_one
+    keymap = ClShortcutDispatcher.of(page).keymap
+    assert keymap[("1", True, False, False, False)]() is tabs[0]
+    assert keymap[("2", True, False, False, False)]() is tabs[1]
+    profile.switch("full")
+    assert tabs[1].button.gradient is not None
+
+def test_switch_keeps_the_window_buttons(page, connection, theme):
+    buttons = [ClWinButton(theme, winaction="minimize"), ClWinButton(theme, winaction="maximize")]
+    bar = ClAppBar(theme, "App", buttons, with_blur=True)
+    page.add(bar)
+    assert len(connection.sent) == 1
+    connection.sent.clear()
+    ClRenderProfile.of(page).switch("reduced")
+    assert len(connection.sent) == 1
+    assert "remove" not in commands(connection)
+    assert bar.bar.blur is None
+    # only the maximize buttons follow the window state
+    assert set(ClWindowController.of(page).buttons) == {buttons[1]}
+
+def test_component_built_with_another_profile_is_painted_on_mount(page, connection, theme):
+    ClRenderProfile.of(page).switch("minimal")
+    tab = ClNavTab(theme, text="One")
+    page.add(tab)
+    # built with the default profile, so it's updated once with the profile of the page
+    assert len(connection.sent) == 2
+    assert tab.render_profile is ClRenderProfile.of(page)
+    assert tab.button.animate is None
+
+def test_mark_tabs_do_not_share_their_gradient_colors(page, theme):
+    tabs = [ClMarkTab(theme, text="One"), ClMarkTab(theme, text="Two")]
+    page.add(*tabs)
+    tabs[0].paint(True)
+    assert tabs[0].button.gradient.colors is not tabs[1].button.gradient.colors
+    assert tabs[1].button.gradient.colors == [theme.background_one, theme.background_one]
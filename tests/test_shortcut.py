@@ -0,0 +1,57 @@
+import pytest
+from calet_errors import ClError
+from calet_bar import ClAppBar
+from calet_button import ClIconButton, ClTextButton
+from calet_shortcut import ClShortcutDispatcher
+
+def sent_attrs(connection):
+    return [attr.lower() for batch in connection.sent for command in batch for attr in command.attrs]
+
+def test_mount_sends_the_keyboard_handler_once(page, connection, theme):
+    button = ClTextButton(theme, text="Save", shortcut="ctrl+s")
+    page.add(button)
+    # the client only sends key presses once the page has the keyboard handler
+    assert "onkeyboardevent" in sent_attrs(connection)
+    assert ClShortcutDispatcher.of(page).keymap[("s", True, False, False, False)]() is button
+    connection.sent.clear()
+    page.add(ClTextButton(theme, text="Open", shortcut="ctrl+o"))
+    assert len(connection.sent) == 1
+
+def test_duplicate_shortcuts_are_rejected_at_construction(theme):
+    with pytest.raises(ClError):
+        ClAppBar(theme, "App", [], right_actions=[
+            ClTextButton(theme, text="Save", shortcut="ctrl+s"),
+            ClIconButton(theme, icon="save", shortcut="Ctrl+S")
+        ])
+
+def test_duplicate_shortcut_keeps_the_first_control(page, theme):
+    first = ClTextButton(theme, text="Save", shortcut="ctrl+s")
+    second = ClTextButton(theme, text="Store", shortcut="ctrl+s")
+    page.add(first)
+    # the second button is already sent when it's mounted, so it's added without his shortcut
+    page.add(second)
+    assert ClShortcutDispatcher.of(page).keymap[("s", True, False, False, False)]() is first
+
+def test_register_and_unregister_are_idempotent(page, theme):
+    button = ClTextButton(theme, text="Save", shortcut="ctrl+s")
+    dispatcher = ClShortcutDispatcher.of(page)
+    dispatcher.register(button)
+    dispatcher.register(button)
+    dispatcher.unregister(button)
+    dispatcher.unregister(button)
+    assert dispatcher.keymap == {}
+
+def test_remount_keeps_the_shortcut(page, theme):
+    button = ClTextButton(theme, text="Save", shortcut="ctrl+s")
+    page.add(button)
+    page.remove(button)
+    assert ClShortcutDispatcher.of(page).keymap == {}
+    page.add(button)
+    assert ClShortcutDispatcher.of(page).keymap[("s", True, False, False, False)]() is button
+
+def test_unmounted_button_is_ignored(theme):
+    button = ClTextButton(theme, text="Save", shortcut="ctrl+s")
+    button.did_mount()
+    button.will_unmount()
+    with pytest.raises(ClError):
+        ClShortcutDispatcher.of(None)
@@ -0,0 +1,96 @@
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+from calet_bar import ClFilterBar
+from calet_button import ClCheck, ClCrystalFilterButton, ClFilterButton
+from calet_list import ClVirtualList
+from calet_source import ClPagedSource
+from calet_template import ClTemplate
+
+def store(size):
+    def fetch(page, page_size):
+        return list(range(page * page_size, min(size, (page + 1) * page_size)))
+    return fetch
+
+def wait(source):
+    while True:
+        with source.lock:
+            pending = list(source.pending.values())
+        if not pending:
+            return
+        for future in pending:
+            try:
+                future.result(timeout=2)
+            except Exception:
+                pass
+
+def test_pages_are_fetched_ahead_and_the_total_is_found():
+    source = ClPagedSource(store(25), page_size=10, prefetch=2)
+    assert source.get(0) is None
+    source.request(0, 10)
+    wait(source)
+    assert source.get(5) == 5 and source.get(24) == 24
+    # the third page is short, so it's the last one
+    assert source.total == 25
+    assert source.stats["fetched"] == 3
+
+def test_cache_keeps_the_last_used_pages():
+    source = ClPagedSource(store(100), page_size=10, cache_pages=2, prefetch=0)
+    assert source.future(0).result(timeout=2) == list(range(10))
+    source.future(1).result(timeout=2)
+    # page 0 is used again, so page 1 is the least recently used one
+    assert source.get(0) == 0
+    source.future(2).result(timeout=2)
+    wait(source)
+    assert list(source.cache) == [0, 2]
+
+def test_jumps_cancel_the_pages_not_wanted():
+    release = threading.Event()
+    async def fetch(page, page_size):
+        while not release.is_set():
+            await asyncio.sleep(0.01)
+        return list(range(page * page_size, (page + 1) * page_size))
+    source = ClPagedSource(fetch, page_size=10, prefetch=1)
+    source.request(0, 10)
+    source.request(500, 510)
+    release.set()
+    wait(source)
+    assert source.stats["cancelled"] == 2
+    assert set(source.cache) == {50, 51}
+
+def test_filters_are_added_to_an_empty_bar(page, theme):
+    bar = ClFilterBar(theme, [ClFilterButton(theme, text="One")])
+    page.add(bar)
+    bar.filters.clear()
+    bar.add_filters([])
+    bar.add_filters([ClCrystalFilterButton(theme, text="Two")])
+    assert [button.text for button in bar.filters] == ["Two"]
+
+def test_pages_are_fed_to_a_filter_bar(page, connection, theme):
+    bar = ClFilterBar(theme, [ClFilterButton(theme, text="All")])
+    page.add(bar)
+    connection.sent.clear()
+    source = ClPagedSource(store(25), page_size=10)
+    source.feed(lambda items: bar.add_filters([ClFilterButton(theme, text=str(item)) for item in items])).result(timeout=2)
+    # one update for each page, in order
+    assert len(connection.sent) == 3
+    assert [button.text for button in bar.filters] == ["All"] + [str(item) for item in range(25)]
+
+def test_virtual_list_is_filled_from_the_pages(page, theme):
+    def fetch(number, page_size):
+        return [{"label": f"row {i}"} for i in range(number * page_size, min(95, (number + 1) * page_size))]
+    source = ClPagedSource(fetch, page_size=20, prefetch=1)
+    virtual_list = ClVirtualList(theme, ClTemplate(ClCheck, theme=theme), source, height=400)
+    page.add(virtual_list)
+    for pixels in (0, 1000, 3000, 4000):
+        virtual_list.scrolled(SimpleNamespace(pixels=pixels, viewport_dimension=400))
+        wait(source)
+    # the rows are filled from the loop thread once their pages are loaded
+    deadline = time.monotonic() + 2
+    while virtual_list.waiting and time.monotonic() < deadline:
+        time.sleep(0.01)
+    # the total is found when the short page arrives, and the last rows are bound to their items
+    assert source.total == 95
+    assert virtual_list.window == (75, 95) and not virtual_list.waiting
+    assert [virtual_list.rows[index].content.label for index in range(75, 95)] == [f"row {i}" for i in range(75, 95)]
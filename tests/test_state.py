@@ -0,0 +1,43 @@
+import gc
+import pytest
+from calet_button import ClRadio, ClRadioGroup, ClSelectableButton, ClSwitch
+from calet_errors import ClError
+from calet_state import ClStore
+
+def test_bind_rejects_props_the_component_cannot_update(theme):
+    store = ClStore(choice="a", on=True)
+    with pytest.raises(ClError):
+        store.bind(ClRadio(theme, value="a"), "value", "choice")
+    with pytest.raises(ClError):
+        store.bind(ClSwitch(theme), "value", "on")
+    store.bind(ClSwitch(theme), "active", "on")
+
+def test_bound_group_follows_the_store(page, theme):
+    group = ClRadioGroup(theme, [ClRadio(theme, value=value) for value in ("a", "b")])
+    page.add(group)
+    store = ClStore(page, choice="a")
+    store.bind(group, "value", "choice")
+    assert group.group.value == "a"
+    store.set(choice=None)
+    assert group.value is None and not group.group.value
+
+def test_bound_enabled_reaches_selectable_buttons(page, theme):
+    button = ClSelectableButton(theme, text="One")
+    page.add(button)
+    store = ClStore(page, on=True)
+    store.bind(button, "enabled", "on")
+    store.set(on=False)
+    assert not button.enabled and button.button.disabled
+
+def test_unbound_and_collected_controls_are_released(theme):
+    store = ClStore(on=True)
+    kept = ClSwitch(theme)
+    store.bind(kept, "active", "on")
+    store.bind(ClSwitch(theme), "active", "on")
+    gc.collect()
+    # the store doesn't keep the second switch alive
+    assert len(store.signal("on").subscribers) == 1
+    store.unbind(kept)
+    assert store.signal("on").subscribers == [] and store.bindings == {}
+    store.set(on=False)
+    assert kept.active
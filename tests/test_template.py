@@ -0,0 +1,24 @@
+import pytest
+from calet_button import ClCheck, ClOptionButton, ClRadio, ClRadioGroup
+from calet_errors import ClError
+from calet_template import ClTemplate
+
+def test_value_type_follows_the_component(theme):
+    radio = ClTemplate(ClRadio, theme=theme, value="a").stamp(value="b", label="B")
+    assert radio.value == "b"
+    check = ClTemplate(ClCheck, theme=theme).stamp(value=True)
+    assert check.value is True
+    with pytest.raises(ClError):
+        ClTemplate(ClRadio, theme=theme, value="a").stamp(value=True)
+    with pytest.raises(ClError):
+        ClTemplate(ClCheck, theme=theme).stamp(value="true")
+
+def test_stamped_components_do_not_share_children(page, theme):
+    template = ClTemplate(ClRadioGroup, theme=theme, radios=[ClRadio(theme, value=value) for value in ("a", "b")])
+    first, second = template.stamp_all([{"value": "a"}, {"value": "b"}])
+    assert not set(map(id, first.radios)) & set(map(id, second.radios))
+    assert first.radio("b") is first.radios[1] and second.radio("b") is second.radios[1]
+    page.add(first, second)
+    assert first.group.value == "a" and second.group.value == "b"
+    options = ClTemplate(ClOptionButton, theme=theme, sub_options=[ClOptionButton(theme, text="Sub")]).stamp_all([{}, {}])
+    assert options[0].sub_options[0] is not options[1].sub_options[0]
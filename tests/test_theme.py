@@ -0,0 +1,19 @@
+import pytest
+from calet_errors import ClError
+from calet_theme import ClLightTheme, ClTheme
+
+def test_replace_computes_the_derived_colors_again():
+    palette = ClLightTheme(primary="blue").replace(primary="teal")
+    assert palette.primary_block == "teal,0.2"
+    assert palette.tonal == "teal" and palette.tonal_block == "teal,0.2"
+    # a derived color given on purpose is kept
+    custom = ClLightTheme(primary="blue", primary_block="#112233").replace(primary="teal")
+    assert custom.primary_block == "#112233"
+    assert custom.replace(primary_block="#445566").primary_block == "#445566"
+
+def test_themes_accept_custom_attributes_and_palettes_are_immutable():
+    theme = ClTheme(on_light=ClLightTheme())
+    theme.name = "main"
+    assert theme.name == "main"
+    with pytest.raises(ClError):
+        theme.on_light.primary = "teal"
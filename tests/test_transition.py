@@ -0,0 +1,10 @@
+from calet_theme import ClDarkTheme, ClLightTheme
+from calet_transition import ClThemeTransition
+
+def test_theme_color_names_switch_at_once():
+    source = ClLightTheme(primary="primary", background_one="#FFFFFF")
+    target = ClDarkTheme(primary="surface", background_one="#000000")
+    themes = ClThemeTransition.interpolate(source, target, 4)
+    assert len(themes) == 3
+    assert all(theme.primary == "surface" for theme in themes)
+    assert themes[1].background_one == "#808080"
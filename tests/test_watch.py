@@ -0,0 +1,26 @@
+import json
+from calet_button import ClCrystalButton, ClTonalButton
+from calet_watch import ClThemeFile
+
+def test_tokens_are_joined_from_the_declared_classes():
+    assert ClThemeFile.tokens(ClTonalButton) == {"font_one", "font_two", "transparent", "transparent_05", "tonal", "tonal_block"}
+    # a subclass out of Calet paints the tokens of his bases, unless it declares more
+    class Shaded(ClCrystalButton):
+        TOKENS = ("secondary",)
+    assert ClThemeFile.tokens(Shaded) == ClThemeFile.tokens(ClCrystalButton) | {"secondary"}
+
+def test_only_the_components_painting_a_changed_token_are_repainted(tmp_path, page, monkeypatch):
+    path = tmp_path / "theme.json"
+    path.write_text(json.dumps({"light": {}, "dark": {}}))
+    watched = ClThemeFile(str(path))
+    theme = watched.theme()
+    buttons = [ClTonalButton(theme, text="Tonal"), ClCrystalButton(theme, text="Crystal")]
+    page.add(*buttons)
+    watched.attach(page, theme, buttons)
+    painted = []
+    for button in buttons:
+        monkeypatch.setattr(button, "upd", lambda theme, button=button: painted.append(button))
+    path.write_text(json.dumps({"light": {"tonal": "#123456"}, "dark": {}}))
+    watched.stamp = None
+    assert watched.check() == {"tonal"}
+    assert painted == [buttons[0]]
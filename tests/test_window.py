@@ -0,0 +1,39 @@
+import time
+from calet_button import ClWinButton
+from calet_window import ClWindowController
+
+def test_remount_keeps_the_button_registered(page, theme):
+    button = ClWinButton(theme, winaction="maximize")
+    page.add(button)
+    controller = ClWindowController.of(page)
+    assert button in controller.buttons
+    page.remove(button)
+    assert button not in controller.buttons
+    page.add(button)
+    assert button in controller.buttons
+
+def test_fast_toggles_are_coalesced(page, connection, theme):
+    button = ClWinButton(theme, winaction="maximize")
+    page.add(button)
+    controller = ClWindowController.of(page)
+    controller.debounce = 0.05
+    connection.sent.clear()
+    for _ in range(4):
+        controller.request("toggle")
+    # the first toggle is sent at once, the other three are merged into the final state
+    assert len(connection.sent) == 1
+    assert page.window_maximized is True
+    time.sleep(0.2)
+    assert len(connection.sent) == 2
+    assert page.window_maximized is False
+    assert button.winaction == "maximize"
+
+def test_merged_toggles_back_to_the_sent_state_send_nothing(page, connection, theme):
+    page.add(ClWinButton(theme, winaction="maximize"))
+    controller = ClWindowController.of(page)
+    controller.debounce = 0.05
+    connection.sent.clear()
+    for _ in range(3):
+        controller.request("toggle")
+    time.sleep(0.2)
+    assert len(connection.sent) == 1